@@ -1,8 +1,17 @@
+import io
 import os
 from .Procesos.lectura import lectura
 from .Procesos.limpieza import limpia
-from .Procesos.transiciones import transiciones, estados_finales
 from .Procesos.tokenizador import tokenizacion
+from .Procesos.compilado import TablaLexica, tokenizacion_tabla
+from .Procesos.patron import PatronLexico, tokenizacion_patron
+from .Procesos.fusion import tokenizacion_fusionada
+from .Procesos.flujo import piezas
+from .Procesos.mapeo import mapea
+from .Procesos.incremental import relexea
+from .Procesos.paralelo import tokenizacion_paralela
+from .Procesos.verificacion import verifica
+from .Procesos.cache import carga_o_construye, FUENTES, CONSTRUCTORES
 
 class Lexico:
     def __init__(self, transiciones, estados_finales):
@@ -18,16 +27,115 @@ class Lexico:
             estados[origen][simbolo] = destino
         return estados
 
-def inicia_lexico(archivo):
+class TablasLexicas:
+    """Todo lo que sale de transiciones y llaves: el automata, su tabla y el patron"""
+    def __init__(self):
+        # Solo aqui se carga transiciones.py, con la cache ni se importa
+        from .Procesos.transiciones import transiciones, estados_finales
+        self.lexi = Lexico(transiciones, estados_finales)
+        self.tabla = TablaLexica(self.lexi)
+        self.patron = PatronLexico(self.lexi, self.tabla)
+
+_tablas = None
+
+def tablas_lexicas():
+    """Las tablas del lexico, una sola vez por proceso y guardadas en disco entre corridas"""
+    global _tablas
+    if _tablas is None:
+        _tablas = carga_o_construye(TablasLexicas, "lexico", FUENTES + CONSTRUCTORES + (__file__,))
+    return _tablas
+
+def iter_tokens(fuente, chunk_size=1 << 16):
+    """Tokens del archivo (ruta u objeto archivo) conforme se van leyendo, sin cargarlo completo"""
+    if hasattr(fuente, "read"):
+        yield from _tokens_por_pieza(fuente, chunk_size)
+        return
+    try:
+        archivo = open(fuente, "r", encoding="utf-8")
+    except FileNotFoundError:
+        print(f"Directorio equivocado: {fuente}")
+        raise
+    with archivo:
+        yield from _tokens_por_pieza(archivo, chunk_size)
+
+def _tokens_por_pieza(archivo, chunk_size):
+    patron = tablas_lexicas().patron
+    linea = 1
+    for pieza in piezas(archivo, chunk_size):
+        yield from tokenizacion_fusionada(patron, pieza, linea)
+        linea += pieza.count('\n')
+
+def relexea_tokens(flujo, inicio, borrados, insertado, patron=None):
+    """Aplica una edicion (posicion, cuantos caracteres se borran, texto que entra) al
+    TokenStream que regreso inicia_lexico. Regresa (TokenStream nuevo, (desde, hasta_viejo,
+    hasta_nuevo))"""
+    if patron is None:
+        patron = tablas_lexicas().patron
+    return relexea(patron, flujo, inicio, borrados, insertado)
+
+# "automata" recorre el diccionario (referencia), "tabla" usa el automata compilado,
+# "patron" una sola regex, "fusion" la regex sobre el texto sin limpiar (lineas del
+# archivo original, regresa un TokenStream), "flujo" lo mismo leyendo por pedazos,
+# "mmap" fusion sobre los bytes del archivo mapeado sin decodificarlo, "palabras" como
+# fusion pero cada palabra clave sale de un diccionario en vez del trie, "paralelo"
+# fusion repartido en varios procesos y "verifica" corre todos y truena si no dan lo mismo
+MODOS = ("fusion", "automata", "tabla", "patron", "flujo", "mmap", "palabras", "paralelo", "verifica")
+
+# Los que pueden seguir despues de un error
+RECUPERABLES = ("fusion", "mmap", "palabras")
+
+def inicia_lexico(archivo, modo="fusion", recupera=False):
+    """Tokens del archivo. Con recupera=True no truena en el primer error: regresa
+    (tokens, diagnosticos) con un token ERROR por cada pedazo que no se pudo tokenizar"""
+    if modo not in MODOS:
+        raise ValueError(f"Modo de lexico desconocido: {modo}")
+    if recupera and modo not in RECUPERABLES:
+        raise ValueError(f"El modo {modo} no se recupera de errores, usa uno de {RECUPERABLES}")
+    diagnosticos = [] if recupera else None
     current_dir = os.path.dirname(os.path.abspath(__file__))
     full_path = os.path.join(current_dir, archivo)
     
-    lexi = Lexico(transiciones, estados_finales)
-    t = lectura(full_path)
-    t = limpia(t)
-    tokens = tokenizacion(lexi, t)
+    tablas = tablas_lexicas()
+    lexi, tabla, patron = tablas.lexi, tablas.tabla, tablas.patron
+    if modo == "flujo":
+        tokens = list(iter_tokens(full_path))
+    elif modo == "mmap":
+        # El TokenStream corta los lexemas del mmap, se cierra cuando ya nadie lo usa
+        datos = mapea(full_path)
+        tokens = []
+        if datos is not None:
+            tokens = tokenizacion_fusionada(patron, datos, diagnosticos=diagnosticos)
+    elif modo == "verifica":
+        tokens = verifica(lectura(full_path), lambda texto: tokenizacion(lexi, limpia(texto)), {
+            "tabla": lambda texto: tokenizacion_tabla(tabla, limpia(texto)),
+            "patron": lambda texto: tokenizacion_patron(patron, limpia(texto)),
+            "fusion": lambda texto: tokenizacion_fusionada(patron, texto),
+            # Chunks chicos para que los cortes caigan en todos lados
+            "flujo": lambda texto: list(iter_tokens(io.StringIO(texto), 64)),
+            "mmap": lambda texto: tokenizacion_fusionada(patron, texto.encode("utf-8")),
+            "palabras": lambda texto: tokenizacion_fusionada(patron, texto, regex=patron.regex_palabras),
+        }, sin_lineas=("fusion", "flujo", "mmap", "palabras"))
+    elif modo == "fusion":
+        t = lectura(full_path)
+        tokens = tokenizacion_fusionada(patron, t, diagnosticos=diagnosticos)
+    elif modo == "palabras":
+        t = lectura(full_path)
+        tokens = tokenizacion_fusionada(patron, t, regex=patron.regex_palabras, diagnosticos=diagnosticos)
+    elif modo == "paralelo":
+        tokens = tokenizacion_paralela(patron, lectura(full_path))
+    else:
+        t = lectura(full_path)
+        t = limpia(t)
+        if modo == "automata":
+            tokens = tokenizacion(lexi, t)
+        elif modo == "tabla":
+            tokens = tokenizacion_tabla(tabla, t)
+        else:
+            tokens = tokenizacion_patron(patron, t)
     if not tokens:
-        return None
+        tokens = None
     #print("Lexico: ", tokens)
+    if recupera:
+        return tokens, diagnosticos
     
     return tokens
\ No newline at end of file
@@ -0,0 +1,53 @@
+import glob
+import hashlib
+import os
+import pickle
+
+_AQUI = os.path.dirname(os.path.abspath(__file__))
+# Si cambia cualquiera de estos la cache ya no sirve
+FUENTES = (os.path.join(_AQUI, "transiciones.py"), os.path.join(_AQUI, "tokens.py"))
+# El codigo que arma las tablas tambien, o una cache vieja traeria objetos incompletos
+CONSTRUCTORES = tuple(os.path.join(_AQUI, f) for f in ("compilado.py", "patron.py", "limpieza.py", "tipos.py"))
+CARPETA = os.path.join(_AQUI, "__pycache__")
+
+
+def huella(fuentes=FUENTES):
+    """Hash del contenido de los archivos de los que salen las tablas"""
+    h = hashlib.sha256()
+    for ruta in fuentes:
+        with open(ruta, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()[:16]
+
+
+def carga_o_construye(construye, nombre, fuentes=FUENTES, carpeta=CARPETA):
+    """Regresa lo que dejo construye() la ultima vez que las fuentes estaban igual, o lo
+    construye y lo guarda, borrando las de otras versiones de las fuentes. Si no se puede
+    leer o escribir la cache se construye y ya"""
+    ruta = os.path.join(carpeta, f"{nombre}-{huella(fuentes)}.pickle")
+    try:
+        with open(ruta, "rb") as f:
+            return pickle.loads(f.read())
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        pass
+
+    objeto = construye()
+    temporal = f"{ruta}.{os.getpid()}"
+    try:
+        os.makedirs(carpeta, exist_ok=True)
+        with open(temporal, "wb") as f:
+            f.write(pickle.dumps(objeto, pickle.HIGHEST_PROTOCOL))
+        # Otro proceso puede estar escribiendo la misma cache, el reemplazo es atomico
+        os.replace(temporal, ruta)
+    except OSError:
+        return objeto
+
+    # Las de otras huellas ya no se van a leer. Si otro proceso corre con otras fuentes le
+    # toca volver a construir, nada mas
+    for vieja in glob.glob(os.path.join(glob.escape(carpeta), f"{glob.escape(nombre)}-*.pickle")):
+        if vieja != ruta:
+            try:
+                os.remove(vieja)
+            except OSError:
+                pass
+    return objeto
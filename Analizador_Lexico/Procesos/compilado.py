@@ -0,0 +1,213 @@
+from array import array
+from .tokenizador import Token
+from .tipos import llaves_tipo
+
+# Caracteres que terminan un token sin formar parte de el
+ESPACIOS = (' ', '\t', '\n', '\r')
+# Simbolos individuales, el token termina apenas se consumen
+CORTES = (';', ':', '(', ')', ',', '{', '}')
+
+# Clases fijas: 0 para lo que no tiene transicion en ningun lado y 1 para espacios
+OTRO = 0
+ESPACIO = 1
+
+# Motivos por los que el automata no pudo formar un token
+INICIO_STRING = 1
+DENTRO_STRING = 2
+CIERRE_STRING = 3
+STRING_ABIERTO = 4
+CARACTER = 5
+NO_FINAL = 6
+DESCONOCIDO = 7
+
+
+class _MapaClases(dict):
+    # Para str.translate: todo caracter que no conocemos cae en OTRO
+    def __missing__(self, codigo):
+        return chr(OTRO)
+
+
+def _destino(trans, letra, num):
+    # Mismo orden de prioridad que tokenizacion: primero la letra, luego las categorias
+    if letra in trans:
+        return trans[letra]
+    if letra >= 'a' and letra <= 'z' and 'minuschar' in trans:
+        return trans['minuschar']
+    if letra in num and 'num' in trans:
+        return trans['num']
+    if letra == '+' and 'pos' in trans:
+        return trans['pos']
+    if letra == '-' and 'neg' in trans:
+        return trans['neg']
+    return -1
+
+
+class TablaLexica:
+    """Automata del Lexico compilado a una tabla plana estado * n_clases + clase"""
+    def __init__(self, lexi, llaves=llaves_tipo):
+        from .transiciones import num
+        estados = lexi.estados
+        self.estado_inicial = lexi.estado_inicial
+        self.n_estados = max(
+            [lexi.estado_inicial, *estados, *lexi.estados_finales]
+            + [d for trans in estados.values() for d in trans.values()]
+        ) + 1
+
+        # Solo importan los caracteres que aparecen en alguna transicion o categoria
+        alfabeto = {s for trans in estados.values() for s in trans if len(s) == 1}
+        alfabeto |= {chr(c) for c in range(ord('a'), ord('z') + 1)}
+        alfabeto |= set(num) | {'+', '-'}
+        alfabeto -= set(ESPACIOS)
+
+        # Caracteres con la misma columna en la tabla comparten clase
+        columnas = [(-1,) * self.n_estados, (-1,) * self.n_estados]
+        firmas = {}
+        corta = [False, False]
+        self.clases = _MapaClases()
+        for letra in ESPACIOS:
+            self.clases[ord(letra)] = chr(ESPACIO)
+        for letra in sorted(alfabeto):
+            columna = tuple(_destino(estados.get(e, {}), letra, num) for e in range(self.n_estados))
+            firma = (columna, letra in CORTES)
+            if firma not in firmas:
+                firmas[firma] = len(columnas)
+                columnas.append(columna)
+                corta.append(letra in CORTES)
+            self.clases[ord(letra)] = chr(firmas[firma])
+        self.n_clases = len(columnas)
+        self.corta = bytes(corta)
+
+        self.tabla = array('h', [-1]) * (self.n_estados * self.n_clases)
+        for clase, columna in enumerate(columnas):
+            for estado, destino in enumerate(columna):
+                self.tabla[estado * self.n_clases + clase] = destino
+
+        # Transiciones de la categoria 'string', van aparte porque aceptan cualquier caracter
+        self.en_string = array('h', [-1]) * self.n_estados
+        for estado, trans in estados.items():
+            if 'string' in trans:
+                self.en_string[estado] = trans['string']
+
+        self.finales = bytearray(self.n_estados)
+        for estado in lexi.estados_finales:
+            self.finales[estado] = 1
+        self.tipos = [llaves.get(estado) for estado in range(self.n_estados)]
+
+    def clasifica(self, texto):
+        """Convierte el texto a sus ids de clase, un byte por caracter"""
+        return texto.translate(self.clases).encode('latin-1')
+
+
+def escanea_token(tabla, texto, clases, i):
+    """Corre el automata compilado desde i. Regresa (estado, fin, motivo de falla o None)"""
+    t = tabla.tabla
+    k = tabla.n_clases
+    n = len(texto)
+    estado = tabla.estado_inicial
+    j = i
+
+    # Pa strings
+    if texto[i] == '"':
+        estado = t[estado * k + clases[i]]
+        if estado < 0:
+            return tabla.estado_inicial, i, INICIO_STRING
+        j += 1
+        cierre = texto.find('"', j)
+        if cierre < 0:
+            cierre = n
+        if tabla.en_string[estado] == estado:
+            # El estado se cicla en si mismo, brincamos todo el contenido de un jalon
+            j = cierre
+        else:
+            while j < cierre:
+                if tabla.en_string[estado] < 0:
+                    return estado, j, DENTRO_STRING
+                estado = tabla.en_string[estado]
+                j += 1
+        if j >= n:
+            return estado, j, STRING_ABIERTO
+        destino = t[estado * k + clases[j]]
+        if destino < 0:
+            return estado, j, CIERRE_STRING
+        estado = destino
+        j += 1
+    else:
+        corta = tabla.corta
+        while j < n:
+            clase = clases[j]
+            if clase == ESPACIO:
+                break
+            destino = t[estado * k + clase]
+            if destino < 0:
+                if tabla.finales[estado]:
+                    break
+                return estado, j, CARACTER
+            estado = destino
+            j += 1
+            if corta[clase]:
+                break
+
+    if not tabla.finales[estado]:
+        return estado, j, NO_FINAL
+    if tabla.tipos[estado] is None:
+        return estado, j, DESCONOCIDO
+    return estado, j, None
+
+
+def mensaje_error(motivo, texto, j, estado, linea):
+    """Mismos mensajes que tokenizacion para cada motivo de falla"""
+    if motivo == INICIO_STRING:
+        return f"Error al iniciar string en línea {linea}"
+    if motivo == DENTRO_STRING:
+        return f"Error procesando string en línea {linea}"
+    if motivo == CIERRE_STRING:
+        return f"Error cerrando string en línea {linea}"
+    if motivo == STRING_ABIERTO:
+        return f"String sin cerrar en línea {linea}"
+    if motivo == CARACTER:
+        return f"No es posible tokenizar en línea {linea}, carácter '{texto[j]}', estado {estado}"
+    if motivo == DESCONOCIDO:
+        return f"Estado final desconocido {estado} en línea {linea}"
+    return f"No termina en estado final (estado {estado}) en línea {linea}"
+
+
+class Diagnostico:
+    """Un error lexico que se brinco en vez de tronar"""
+    __slots__ = ('linea', 'columna', 'texto', 'estado', 'mensaje')
+
+    def __init__(self, linea, columna, texto, estado, mensaje):
+        self.linea = linea
+        self.columna = columna
+        self.texto = texto
+        self.estado = estado
+        self.mensaje = mensaje
+
+    def __repr__(self):
+        return f"Diagnostico(L{self.linea}:{self.columna}, '{self.texto}', estado {self.estado})"
+
+
+def tokenizacion_tabla(tabla, texto):
+    """Igual que tokenizacion pero sobre la tabla compilada"""
+    resultado = []
+    clases = tabla.clasifica(texto)
+    n = len(texto)
+    i = 0
+    linea_actual = 1
+
+    while i < n:
+        letra = texto[i]
+        if letra == '\n':
+            linea_actual += 1
+            i += 1
+            continue
+        if letra in (' ', '\t', '\r'):
+            i += 1
+            continue
+
+        estado, j, motivo = escanea_token(tabla, texto, clases, i)
+        if motivo:
+            raise ValueError(mensaje_error(motivo, texto, j, estado, linea_actual))
+        resultado.append(Token(tabla.tipos[estado], texto[i:j], linea_actual))
+        i = j
+
+    return resultado
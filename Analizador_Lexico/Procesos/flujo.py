@@ -0,0 +1,100 @@
+import re
+
+# Modos del cortador
+NORMAL = 0
+STRING = 1
+COMENTARIO = 2
+
+# Lo unico que cambia el modo: abrir comentario, comillas y saltos de linea
+_MARCAS_NORMAL = re.compile(r'/\*|"|\n')
+_MARCAS_STRING = re.compile(r'/\*|"')
+
+
+def piezas(archivo, chunk_size=1 << 16):
+    """Lee el archivo por chunks y regresa pedazos que terminan en un salto de linea
+    fuera de strings y comentarios, asi cada uno se puede tokenizar solo"""
+    buffer = ''
+    pos = 0          # Hasta donde ya revisamos el buffer
+    corte = 0        # Justo despues del ultimo salto de linea seguro
+    modo = NORMAL
+    regreso = NORMAL  # Al cerrar un comentario volvemos a donde estabamos
+    fin = False
+
+    while not fin:
+        chunk = archivo.read(chunk_size)
+        fin = not chunk
+        buffer += chunk
+
+        while pos < len(buffer):
+            if modo == COMENTARIO:
+                k = buffer.find('*/', pos)
+                if k < 0:
+                    # El '*' del final puede cerrar con el siguiente chunk
+                    pos = len(buffer) if fin else max(pos, len(buffer) - 1)
+                    break
+                pos = k + 2
+                modo = regreso
+                continue
+
+            marcas = _MARCAS_NORMAL if modo == NORMAL else _MARCAS_STRING
+            m = marcas.search(buffer, pos)
+            if not m:
+                # Igual con un '/' al final que todavia no sabemos si abre comentario
+                pos = len(buffer) if fin else max(pos, len(buffer) - 1)
+                break
+            marca = m.group()
+            if marca == '\n':
+                corte = m.end()
+            elif marca == '"':
+                modo = STRING if modo == NORMAL else NORMAL
+            else:
+                regreso = modo
+                modo = COMENTARIO
+            pos = m.end()
+
+        if corte:
+            yield buffer[:corte]
+            buffer = buffer[corte:]
+            pos -= corte
+            corte = 0
+
+    if buffer:
+        yield buffer
+
+
+def cortes_seguros(texto, partes):
+    """Posiciones para partir texto en mas o menos partes iguales, cada una justo despues
+    de un salto de linea fuera de strings y comentarios. Pueden salir menos si no hay donde"""
+    cortes = []
+    pos = 0
+    modo = NORMAL
+    regreso = NORMAL
+    for k in range(1, partes):
+        objetivo = len(texto) * k // partes
+        while True:
+            if modo == COMENTARIO:
+                cierre = texto.find('*/', pos)
+                if cierre < 0:
+                    return cortes
+                pos = cierre + 2
+                modo = regreso
+                continue
+            # Aqui los saltos no cambian nada, solo se buscan comillas y comentarios
+            m = _MARCAS_STRING.search(texto, pos)
+            if modo == NORMAL:
+                salto = texto.find('\n', max(objetivo, pos))
+                if salto < 0:
+                    return cortes
+                if m is None or salto < m.start():
+                    pos = salto + 1
+                    cortes.append(pos)
+                    break
+            elif m is None:
+                return cortes
+            if m.group() == '"':
+                modo = STRING if modo == NORMAL else NORMAL
+            else:
+                regreso = modo
+                modo = COMENTARIO
+            pos = m.end()
+    return cortes
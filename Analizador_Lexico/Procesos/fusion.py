@@ -0,0 +1,238 @@
+import re
+from .secuencia import TokenStream, ERROR
+from .limpieza import limpia_lexema
+from .compilado import Diagnostico, STRING_ABIERTO
+from . import patron as p
+
+# Caracteres con los que limpia le cambiaria algo a un string. En bytes tambien el \r de
+# los saltos de Windows, que al leer como texto ya no llega
+_SUCIOS = ('-', '/', '\t', '  ', '\n')
+_SUCIOS_BINARIOS = (b'-', b'/', b'\t', b'  ', b'\n', b'\r')
+# La corrida de letras no es ninguna palabra ni prefijo de una
+_LARGA = -1
+# Donde se retoma despues de un error: el siguiente espacio o delimitador
+_RESINCRONIZA = re.compile(r'[ \t\r\n;:(),{}]')
+_RESINCRONIZA_BINARIA = re.compile(_RESINCRONIZA.pattern.encode('ascii'))
+
+
+def tokenizacion_fusionada(patron, texto, linea_actual=1, desde=0, sincroniza=None, regex=None,
+                           diagnosticos=None):
+    """Tokeniza el texto tal cual viene del archivo, sin pasar por limpia: comentarios y
+    espacios se brincan en la misma pasada y las lineas son las del archivo original.
+    Regresa un TokenStream con las posiciones de cada token en texto. texto tambien puede
+    ser bytes o un mmap del archivo: se usa patron.regex_binaria, las posiciones van en
+    bytes y solo se decodifican los strings que hay que limpiar.
+
+    desde es donde arranca (tiene que ser fuera de strings y comentarios) y sincroniza,
+    si viene, se llama en cada salto de linea con (posicion, linea); si regresa True
+    ahi se para. regex puede ser patron.regex_palabras en vez de la del trie.
+
+    Con una lista en diagnosticos los errores no truenan: se guarda un Diagnostico, el
+    pedazo malo queda como un token ERROR y se sigue en el siguiente espacio o delimitador.
+
+    Un comentario sin cerrar se lleva la linea logica entera, como en limpia: la que queda
+    juntando las fisicas alrededor de los comentarios de varias lineas. Lo que no se imita
+    (para que todos los modos fusionados, flujo incluido, den lo mismo) y verifica reporta
+    como divergencia: strings de varias lineas que limpia corta, tokens que limpia pega al
+    quitar el comentario de en medio y /* o */ que se forman al quitar un articulo"""
+    resultado = TokenStream(texto)
+    kinds = resultado.kinds.append
+    inicios = resultado.inicios.append
+    fines = resultado.fines.append
+    lineas = resultado.lineas.append
+    binario = resultado.binario
+    salto_linea = b'\n' if binario else '\n'
+    sucios = _SUCIOS_BINARIOS if binario else _SUCIOS
+    if regex is None:
+        regex = patron.regex_binaria if binario else patron.regex_fusion
+    grupos = regex.groupindex
+    salto = grupos['salto']
+    string = grupos['string']
+    clave = grupos['clave']
+    simbolo = grupos['simbolo']
+    articulo = grupos['articulo']
+    comentario = grupos['comentario']
+    abierto = grupos['abierto']
+    error = grupos['error']
+    tipos = {
+        string: int(patron.tipos[p.STRING]),
+        grupos['id']: int(patron.tipos[p.ID]),
+        grupos['decimal']: int(patron.tipos[p.DECIMAL]),
+        grupos['entero']: int(patron.tipos[p.ENTERO]),
+    }
+    palabras = {k: None if t is None else int(t) for k, t in patron.palabras.items()}
+    simbolos = {s: int(t) for s, t in patron.simbolos.items()}
+    if binario:
+        palabras = {k.encode('ascii'): t for k, t in palabras.items()}
+        simbolos = {s.encode('ascii'): t for s, t in simbolos.items()}
+    # Primer token de la linea, contando como una sola las que junta un comentario de bloque
+    inicio_linea = 0
+    pos = desde
+
+    while pos is not None:
+        inicio, pos = pos, None
+        for m in regex.finditer(texto, inicio):
+            grupo = m.lastindex
+            if grupo == salto:
+                linea_actual += 1
+                inicio_linea = len(resultado)
+                if sincroniza is not None and sincroniza(m.end(), linea_actual):
+                    return resultado
+                continue
+            if grupo == articulo:
+                if binario and _pegado(texto, m.end(grupo)):
+                    # Con una letra fuera de ASCII pegada no hay \b: es un menos y un id
+                    kinds(simbolos[b'-'])
+                    inicios(m.start(grupo))
+                    fines(m.start(grupo) + 1)
+                    lineas(linea_actual)
+                    kinds(tipos[grupos['id']])
+                    inicios(m.start(grupo) + 1)
+                    fines(m.end(grupo))
+                    lineas(linea_actual)
+                continue
+            if grupo == comentario:
+                linea_actual += m.group(grupo).count(salto_linea)
+                continue
+            if grupo != abierto:
+                lexema = m.group(grupo)
+                if grupo == clave:
+                    tipo = palabras.get(lexema, _LARGA)
+                    if tipo == _LARGA:
+                        # El automata no regresa: se queda con el prefijo mas largo que
+                        # camina y lo que sigue es otro token
+                        corte = _prefijo(palabras, lexema)
+                        tipo = palabras[corte]
+                        if tipo is not None:
+                            pos = m.start(grupo) + len(corte)
+                            kinds(tipo)
+                            inicios(m.start(grupo))
+                            fines(pos)
+                            lineas(linea_actual)
+                            break
+                elif grupo == simbolo:
+                    tipo = simbolos[lexema]
+                elif grupo == error:
+                    tipo = None
+                else:
+                    tipo = tipos[grupo]
+                if tipo is not None:
+                    if grupo == string and any(c in lexema for c in sucios):
+                        resultado.lexemas[len(resultado.kinds)] = limpia_lexema(_texto(lexema))
+                    kinds(tipo)
+                    inicios(m.start(grupo))
+                    fines(m.end(grupo))
+                    lineas(linea_actual)
+                    if grupo == string:
+                        linea_actual += lexema.count(salto_linea)
+                    continue
+
+            fin = _linea_borrada(texto, m.start(grupo))
+            if fin is None:
+                if diagnosticos is None:
+                    raise patron.error(texto, m.start(grupo), linea_actual)
+                pos = _recupera(patron, resultado, m.start(grupo), linea_actual, diagnosticos)
+                kinds(ERROR)
+                inicios(m.start(grupo))
+                fines(pos)
+                lineas(linea_actual)
+                break
+
+            # Comentario que nunca cierra: limpia borra toda su linea, lo de antes tambien,
+            # y con eso cualquier error que hubiera en ella. No se cuida el caso de una linea
+            # que empieza dentro de un string de varias lineas: limpia cortaria el string y
+            # aqui se va completo (el modo verifica lo marca como divergencia)
+            del resultado[inicio_linea:]
+            linea_actual += texto.count(salto_linea, m.start(grupo), fin)
+            if fin < len(texto):
+                linea_actual += 1
+                pos = fin + 1
+            break
+
+    return resultado
+
+
+def _texto(lexema):
+    # Los lexemas de un mmap llegan en bytes y con los saltos tal cual estan en el archivo
+    if isinstance(lexema, str):
+        return lexema
+    return str(lexema, 'utf-8').replace('\r\n', '\n')
+
+
+def _recupera(patron, flujo, i, linea, diagnosticos):
+    # Regresa donde sigue el tokenizador; un string sin cerrar se lleva el resto de la linea
+    texto = flujo.fuente
+    estado, j, motivo = patron.falla(texto, i)
+    if motivo == STRING_ABIERTO:
+        fin = texto.find(b'\n' if flujo.binario else '\n', i)
+        fin = len(texto) if fin < 0 else fin
+        if flujo.binario and texto[fin - 1:fin] == b'\r':
+            fin -= 1
+    else:
+        resincroniza = _RESINCRONIZA_BINARIA if flujo.binario else _RESINCRONIZA
+        m = resincroniza.search(texto, max(j, i + 1))
+        fin = m.start() if m else len(texto)
+    crudo = texto[i:fin]
+    lexema = _texto(crudo)
+    if flujo.binario and b'\r' in crudo:
+        # El token ERROR que sigue se queda sin el \r, como al leer el archivo como texto
+        flujo.lexemas[len(flujo)] = lexema
+    diagnosticos.append(Diagnostico(linea, flujo.columna(i), lexema, estado,
+                                    str(patron.error(texto, i, linea))))
+    return fin
+
+
+def _pegado(texto, i):
+    # Si en i (bytes) empieza una letra fuera de ASCII
+    return texto[i:i + 1] >= b'\x80' and re.match(r'\w', str(texto[i:i + 4], 'utf-8', 'ignore')) is not None
+
+
+def _prefijo(palabras, lexema):
+    k = 1
+    while k < len(lexema) and lexema[:k + 1] in palabras:
+        k += 1
+    return lexema[:k]
+
+
+def _linea_borrada(texto, i):
+    # Donde acaba la linea (el salto, o len(texto)) si limpia se la lleva entera, None si no.
+    # limpia quita los comentarios completos y ya despues borra cada linea donde quede un /*:
+    # la linea sigue despues de un comentario de varias lineas y el /* tambien puede salir
+    # de juntar lo que quedo a los lados de uno
+    lineas = _lineas(texto, i)
+    linea, fin = next(lineas)
+    queda = []
+    desde = 0
+    while True:
+        abre = linea.find('/*', desde)
+        if abre < 0:
+            queda.append(linea[desde:])
+            return fin if '/*' in ''.join(queda) else None
+        queda.append(linea[desde:abre])
+        cierra = linea.find('*/', abre + 2)
+        if cierra < 0:
+            for linea, fin_siguiente in lineas:
+                cierra = linea.find('*/')
+                if cierra >= 0:
+                    break
+            else:
+                # No cierra: el /* se queda en la linea
+                return fin
+            fin = fin_siguiente
+        desde = cierra + 2
+
+
+def _lineas(texto, i):
+    # Las lineas del archivo desde i, como str, con donde acaba cada una
+    salto = '\n' if isinstance(texto, str) else b'\n'
+    while True:
+        fin = texto.find(salto, i)
+        if fin < 0:
+            fin = len(texto)
+        linea = texto[i:fin]
+        if not isinstance(linea, str):
+            linea = str(linea, 'utf-8')
+        yield linea, fin
+        if fin == len(texto):
+            return
+        i = fin + 1
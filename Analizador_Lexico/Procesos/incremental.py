@@ -0,0 +1,85 @@
+import re
+from array import array
+from bisect import bisect_left
+from .fusion import tokenizacion_fusionada
+from .limpieza import BLOQUE
+from .secuencia import TokenStream
+
+_COMENTARIO = re.compile(BLOQUE, re.S)
+
+
+def _sin_cerrar(texto):
+    # Con un /* que nunca cierra limpia borra lineas segun lo que venga despues en todo
+    # el archivo, ahi no hay punto seguro y se tokeniza completo
+    abre = texto.rfind('/*')
+    return abre >= 0 and abre + 1 >= texto.rfind('*/')
+
+
+def _en_comentario(texto, desde, p):
+    # Entre dos tokens solo hay espacios, articulos y comentarios completos
+    for m in _COMENTARIO.finditer(texto, desde):
+        if m.start() >= p:
+            return False
+        if m.end() > p:
+            return True
+    return False
+
+
+def relexea(patron, flujo, inicio, borrados, insertado):
+    """Aplica una edicion al texto de un TokenStream de tokenizacion_fusionada y vuelve a
+    tokenizar solo lo necesario: desde el token anterior a la edicion hasta el primer
+    salto de linea despues de ella donde el flujo viejo estaba en el mismo estado.
+    Regresa (TokenStream nuevo, (desde, hasta_viejo, hasta_nuevo)) con el rango de tokens
+    que cambio"""
+    viejo = flujo.fuente
+    if flujo.binario:
+        # Un flujo de mmap cuenta en bytes: se decodifica como lo leeria lectura y, como sus
+        # posiciones ya no sirven, se tokeniza completo
+        viejo = str(viejo, 'utf-8').replace('\r\n', '\n')
+    texto = viejo[:inicio] + insertado + viejo[inicio + borrados:]
+    if flujo.binario or _sin_cerrar(viejo) or _sin_cerrar(texto):
+        nuevo = tokenizacion_fusionada(patron, texto)
+        return nuevo, (0, len(flujo), len(nuevo))
+
+    delta = len(insertado) - borrados
+    dlinea = insertado.count('\n') - viejo.count('\n', inicio, inicio + borrados)
+    fin_nuevo = inicio + len(insertado)
+    fin_viejo = inicio + borrados
+
+    # El token que termina justo donde empieza la edicion puede crecer con ella, asi que
+    # se arranca desde el ultimo que acaba antes
+    r = bisect_left(flujo.fines, inicio) - 1
+    if r >= 0:
+        desde, linea = flujo.inicios[r], flujo.lineas[r]
+    else:
+        r, desde, linea = 0, 0, 1
+
+    cola = [len(flujo)]
+
+    def sincroniza(q, linea):
+        # El salto tiene que quedar despues de la edicion, y en el flujo viejo tambien
+        # tuvo que ser un salto: ni dentro de un string ni de un comentario
+        p = q - delta
+        if q <= fin_nuevo or p <= fin_viejo:
+            return False
+        j = bisect_left(flujo.inicios, p)
+        anterior = flujo.fines[j - 1] if j else 0
+        if anterior >= p or _en_comentario(viejo, anterior, p - 1):
+            return False
+        cola[0] = j
+        return True
+
+    tramo = tokenizacion_fusionada(patron, texto, linea, desde, sincroniza)
+    j = cola[0]
+
+    nuevo = TokenStream(texto)
+    nuevo.kinds = flujo.kinds[:r] + tramo.kinds + flujo.kinds[j:]
+    nuevo.inicios = flujo.inicios[:r] + tramo.inicios + array('I', [x + delta for x in flujo.inicios[j:]])
+    nuevo.fines = flujo.fines[:r] + tramo.fines + array('I', [x + delta for x in flujo.fines[j:]])
+    nuevo.lineas = flujo.lineas[:r] + tramo.lineas + array('I', [x + dlinea for x in flujo.lineas[j:]])
+
+    corrimiento = r + len(tramo) - j
+    nuevo.lexemas = {k: v for k, v in flujo.lexemas.items() if k < r}
+    nuevo.lexemas.update((r + k, v) for k, v in tramo.lexemas.items())
+    nuevo.lexemas.update((k + corrimiento, v) for k, v in flujo.lexemas.items() if k >= j)
+    return nuevo, (r, j, r + len(tramo))
@@ -1,10 +1,16 @@
 import re
+
+# Comentarios de una sola palabra con el menos (-el, -la, ...)
+ARTICULOS = r"-(el|la|los|las|al|a|lo|le|les|un|una|unos|unas)\b"
+# Comentarios entre lineas /* ... */
+BLOQUE = r"/\*.*?\*/"
+
 #Usando regex encontramos los comentarios y los borramos
 def remueve_comentarios(input: str) -> str:
     #Reemplaza los comentarios de una sola palabra que usan el menos con vacio
-    text = re.sub(r"-(el|la|los|las|al|a|lo|le|les|un|una|unos|unas)\b", "", input)
+    text = re.sub(ARTICULOS, "", input)
     #Reemplaza los comentarios entre lineas que usan el /* y cierran con */
-    text = re.sub(r"/\*.*?\*/", "", text, flags=re.S)
+    text = re.sub(BLOQUE, "", text, flags=re.S)
     #Reemplaza los comentarios de una sola linea que usan unicamente el /
     text = re.sub(r"^.*?/\*.*$", "", text, flags=re.M)
 
@@ -17,4 +23,12 @@ def limpia(input: str) -> str:
     text = re.sub(r'[ \t]+', ' ', text)           # Reduce espacios
     text = re.sub(r'\n\s*\n+', '\n', text)        # Elimina saltos de línea
     text = text.strip()                           # Elimina espacios al inicio y final
-    return text
\ No newline at end of file
+    return text
+
+def limpia_lexema(lexema: str) -> str:
+    # Lo que limpia le haria a un string por dentro, para quien tokeniza sin limpiar antes
+    text = re.sub(ARTICULOS, "", lexema)
+    text = re.sub(BLOQUE, "", text, flags=re.S)
+    text = re.sub(r'[ \t]+', ' ', text)
+    text = re.sub(r'\n\s*\n+', '\n', text)
+    return text
@@ -0,0 +1,16 @@
+import mmap
+
+
+def mapea(ruta):
+    """Abre el archivo como mmap de solo lectura; None si esta vacio (mmap no los acepta).
+    Se le pasa tal cual a tokenizacion_fusionada, que lo tokeniza sin decodificarlo"""
+    try:
+        archivo = open(ruta, "rb")
+    except FileNotFoundError:
+        print(f"Directorio equivocado: {ruta}")
+        raise
+    with archivo:
+        try:
+            return mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return None
@@ -0,0 +1,172 @@
+import argparse
+from collections import defaultdict, deque
+from .tokens import llaves as llaves_base
+from .transiciones import transiciones as transiciones_base, estados_finales as finales_base
+
+# Estado extra al que van todas las transiciones que no existen
+_SUMIDERO = -1
+
+
+def tabla_delta(transiciones):
+    """(origen, simbolo) -> destino. Si una clave se repite gana la ultima, igual que en
+    Lexico._crear_estados, asi que es el automata que corre el lexico"""
+    delta = {}
+    for origen, destino, simbolo in transiciones:
+        delta[(origen, simbolo)] = destino
+    return delta
+
+
+def valida(transiciones, estados_finales, llaves=llaves_base, estado_inicial=0):
+    """Lista de problemas de la tabla: transiciones repetidas o en conflicto, estados que
+    no se alcanzan y finales sin tipo en llaves (o tipos de estados que no son finales)"""
+    problemas = []
+    delta = tabla_delta(transiciones)
+    vistas = {}
+    for origen, destino, simbolo in transiciones:
+        clave = (origen, simbolo)
+        if clave in vistas:
+            if vistas[clave] == destino:
+                problemas.append(f"Transicion repetida {origen} -'{simbolo}'-> {destino}")
+            else:
+                problemas.append(f"Conflicto en {origen} con '{simbolo}': va a {vistas[clave]} y a {destino}, "
+                                 f"se queda {delta[clave]}")
+        vistas[clave] = destino
+
+    alcanzados = _alcanzables(delta, estado_inicial)
+    todos = {estado_inicial} | set(estados_finales)
+    for origen, destino, _ in transiciones:
+        todos.update((origen, destino))
+    for estado in sorted(todos - alcanzados):
+        problemas.append(f"Estado {estado} no se alcanza desde {estado_inicial}")
+
+    for estado in sorted(estados_finales):
+        if llaves.get(estado) is None:
+            problemas.append(f"Estado final {estado} sin tipo en llaves")
+    for estado in sorted(llaves):
+        if estado not in estados_finales:
+            problemas.append(f"Estado {estado} tiene tipo {llaves[estado]} pero no es final")
+    return problemas
+
+
+def _alcanzables(delta, estado_inicial):
+    siguientes = defaultdict(list)
+    for (origen, _), destino in delta.items():
+        siguientes[origen].append(destino)
+    alcanzados = {estado_inicial}
+    pendientes = [estado_inicial]
+    while pendientes:
+        for destino in siguientes[pendientes.pop()]:
+            if destino not in alcanzados:
+                alcanzados.add(destino)
+                pendientes.append(destino)
+    return alcanzados
+
+
+def minimiza(transiciones, estados_finales, llaves=llaves_base, estado_inicial=0):
+    """Minimiza el automata con Hopcroft. Las categorias ('minuschar', 'num', ...) cuentan
+    como un simbolo mas y los finales solo se juntan si dan el mismo tipo de token.
+    Regresa (transiciones, estados_finales, llaves, viejo -> nuevo), numerado a lo ancho
+    desde el estado inicial que queda en 0"""
+    delta = tabla_delta(transiciones)
+    estados = sorted(_alcanzables(delta, estado_inicial))
+    simbolos = sorted({simbolo for _, simbolo in delta})
+
+    # Inversa completa: lo que no tiene transicion va al sumidero
+    inversa = defaultdict(set)
+    for estado in estados + [_SUMIDERO]:
+        for simbolo in simbolos:
+            inversa[(delta.get((estado, simbolo), _SUMIDERO), simbolo)].add(estado)
+
+    # Particion inicial: un bloque por tipo de token, uno para los no finales y el sumidero
+    # solo, porque un estado sin salida no se porta igual que uno que falla despues
+    grupos = defaultdict(set)
+    for estado in estados:
+        grupos[("final", llaves.get(estado)) if estado in estados_finales else ("no final",)].add(estado)
+    particion = [frozenset(g) for g in grupos.values()] + [frozenset([_SUMIDERO])]
+    pendientes = deque(particion)
+    en_pendientes = set(particion)
+
+    while pendientes:
+        bloque = pendientes.popleft()
+        en_pendientes.discard(bloque)
+        for simbolo in simbolos:
+            previos = set()
+            for estado in bloque:
+                previos |= inversa.get((estado, simbolo), set())
+            if not previos:
+                continue
+            nueva = []
+            for y in particion:
+                dentro = y & previos
+                if not dentro or len(dentro) == len(y):
+                    nueva.append(y)
+                    continue
+                fuera = y - dentro
+                nueva.extend((dentro, fuera))
+                if y in en_pendientes:
+                    pendientes.remove(y)
+                    en_pendientes.discard(y)
+                    pendientes.extend((dentro, fuera))
+                    en_pendientes.update((dentro, fuera))
+                else:
+                    menor = dentro if len(dentro) <= len(fuera) else fuera
+                    pendientes.append(menor)
+                    en_pendientes.add(menor)
+            particion = nueva
+
+    bloque_de = {estado: b for b in particion for estado in b}
+
+    # Numeracion nueva a lo ancho, el orden de simbolos la deja estable
+    numero = {bloque_de[estado_inicial]: 0}
+    orden = deque([estado_inicial])
+    nuevas = []
+    while orden:
+        estado = orden.popleft()
+        for simbolo in simbolos:
+            destino = delta.get((estado, simbolo))
+            if destino is None:
+                continue
+            bloque = bloque_de[destino]
+            if bloque not in numero:
+                numero[bloque] = len(numero)
+                orden.append(min(bloque))
+            nuevas.append((numero[bloque_de[estado]], numero[bloque], simbolo))
+
+    mapeo = {estado: numero[bloque_de[estado]] for estado in estados}
+    finales = {mapeo[e] for e in estados_finales if e in mapeo}
+    tipos = {mapeo[e]: t for e, t in llaves.items() if e in mapeo}
+    return list(dict.fromkeys(nuevas)), finales, tipos, mapeo
+
+
+def emite(transiciones, estados_finales, llaves):
+    """Texto de un modulo como transiciones.py, con llaves incluidas"""
+    lineas = ["transiciones = ["]
+    lineas += [f"    ({o}, {d}, {s!r})," for o, d, s in transiciones]
+    lineas += ["]", "", "estados_finales = {"]
+    lineas += [f"    {e},  # {llaves.get(e)}" for e in sorted(estados_finales)]
+    lineas += ["}", "", "llaves = {"]
+    lineas += [f"    {e}: {t!r}," for e, t in sorted(llaves.items())]
+    lineas += ["}", "", "num = ('0','1','2','3','4','5','6','7','8','9')", ""]
+    return "\n".join(lineas)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Valida y minimiza el automata del lexico")
+    parser.add_argument("--salida", help="archivo donde escribir la tabla minimizada")
+    args = parser.parse_args(argv)
+
+    problemas = valida(transiciones_base, finales_base)
+    for problema in problemas:
+        print(problema)
+    trans, finales, tipos, mapeo = minimiza(transiciones_base, finales_base)
+    print(f"Estados: {len(set(mapeo))} -> {len(set(mapeo.values()))}, "
+          f"transiciones: {len(transiciones_base)} -> {len(trans)}")
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            f.write(emite(trans, finales, tipos))
+        print(f"Tabla minimizada escrita en: '{args.salida}'")
+    return 1 if problemas else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
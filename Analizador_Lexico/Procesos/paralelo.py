@@ -0,0 +1,56 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from array import array
+from .flujo import cortes_seguros
+from .fusion import tokenizacion_fusionada
+from .secuencia import TokenStream
+
+# Caracteres de texto: con menos, levantar los procesos tarda mas que tokenizar en uno
+MINIMO = 1 << 20
+
+_patron = None
+
+
+def _inicia(patron):
+    global _patron
+    _patron = patron
+
+
+def _tokeniza_pieza(pieza, base, linea):
+    # Los offsets salen ya corridos al texto completo, asi el proceso principal solo pega
+    flujo = tokenizacion_fusionada(_patron, pieza, linea)
+    if base:
+        flujo.inicios = array('I', [x + base for x in flujo.inicios])
+        flujo.fines = array('I', [x + base for x in flujo.fines])
+    flujo.fuente = None
+    return flujo
+
+
+def tokenizacion_paralela(patron, texto, procesos=None, minimo=MINIMO):
+    """tokenizacion_fusionada repartida en varios procesos: el texto se parte en saltos
+    de linea fuera de strings y comentarios y cada pedazo se tokeniza por su lado"""
+    procesos = procesos or os.cpu_count() or 1
+    if procesos == 1 or len(texto) < minimo:
+        return tokenizacion_fusionada(patron, texto)
+
+    # Unas cuantas piezas por proceso para que ninguno se quede esperando al ultimo
+    limites = [0, *cortes_seguros(texto, procesos * 4), len(texto)]
+    trabajos = []
+    linea = 1
+    for a, b in zip(limites, limites[1:]):
+        trabajos.append((texto[a:b], a, linea))
+        linea += texto.count('\n', a, b)
+
+    with ProcessPoolExecutor(procesos, initializer=_inicia, initargs=(patron,)) as pool:
+        # map regresa en orden: si hay error truena el del primer pedazo que falle
+        partes = list(pool.map(_tokeniza_pieza, *zip(*trabajos)))
+
+    resultado = TokenStream(texto)
+    for parte in partes:
+        n = len(resultado)
+        resultado.lexemas.update((k + n, v) for k, v in parte.lexemas.items())
+        resultado.kinds.extend(parte.kinds)
+        resultado.inicios.extend(parte.inicios)
+        resultado.fines.extend(parte.fines)
+        resultado.lineas.extend(parte.lineas)
+    return resultado
@@ -0,0 +1,166 @@
+import re
+from .tokenizador import Token
+from .tipos import llaves_tipo
+from .compilado import escanea_token, mensaje_error
+from .limpieza import ARTICULOS
+
+# Grupos del patron maestro, en el orden en que se prueban
+SALTO = 1
+STRING = 2
+CLAVE = 3
+ID = 4
+DECIMAL = 5
+ENTERO = 6
+SIMBOLO = 7
+ERROR = 8
+
+
+def _trie(prefijos, base=''):
+    # Arma (?:P(?:a(?:r(?:a)?)?|...)?|...) para que la regex camine igual que el automata:
+    # avanza mientras haya transicion y se queda con el prefijo mas largo
+    hijos = sorted({p[len(base)] for p in prefijos if len(p) > len(base) and p.startswith(base)})
+    ramas = []
+    for letra in hijos:
+        sub = _trie(prefijos, base + letra)
+        ramas.append(re.escape(letra) + (f"(?:{sub})?" if sub else ''))
+    return '|'.join(ramas)
+
+
+def _regex_fusion(clave, simbolo):
+    return re.compile(
+        r'[ \t\r]*+(?:'
+        r'(?P<salto>\n)'
+        r'|(?P<string>"(?:[^"/]|/(?!\*)|/\*[\s\S]*?\*/)*")'
+        f'|(?P<clave>{clave})'
+        r'|(?P<id>[a-z][a-z0-9]*)'
+        r'|(?P<decimal>[0-9]+\.[0-9]*)'
+        r'|(?P<entero>[0-9]+)'
+        f'|(?P<articulo>{ARTICULOS})'
+        f'|(?P<simbolo>[{simbolo}])'
+        r'|(?P<comentario>/\*[\s\S]*?\*/)'
+        r'|(?P<abierto>/\*)'
+        r'|(?P<error>[\s\S]))'
+    )
+
+
+class PatronLexico:
+    """Una sola regex con todas las clases de token, sacada del automata del Lexico"""
+    def __init__(self, lexi, tabla, llaves=llaves_tipo):
+        estados = lexi.estados
+        inicio = estados[lexi.estado_inicial]
+        self.tabla = tabla
+
+        # Palabras clave: todo lo que cuelga de una mayuscula en el estado inicial
+        self.palabras = {}
+        pendientes = [(destino, letra) for letra, destino in inicio.items()
+                      if len(letra) == 1 and letra.isupper()]
+        while pendientes:
+            estado, prefijo = pendientes.pop()
+            self.palabras[prefijo] = llaves.get(estado) if estado in lexi.estados_finales else None
+            for letra, destino in estados.get(estado, {}).items():
+                if len(letra) != 1:
+                    raise ValueError(f"La palabra '{prefijo}' usa la categoria '{letra}', no cabe en el patron")
+                pendientes.append((destino, prefijo + letra))
+
+        # Tokens complejos, los tipos salen de la tabla para no repetirlos aqui
+        id_estado = inicio['minuschar']
+        entero = inicio['num']
+        comilla = inicio['"']
+        if estados[comilla].get('string') != comilla:
+            raise ValueError("El contenido del string no se cicla, no cabe en el patron")
+        self.tipos = {
+            STRING: llaves[estados[comilla]['"']],
+            ID: llaves[id_estado],
+            DECIMAL: llaves[estados[entero]['.']],
+            ENTERO: llaves[entero],
+        }
+        self.simbolos = {letra: llaves[destino] for letra, destino in inicio.items()
+                         if len(letra) == 1 and not letra.isalnum() and letra != '"'}
+        self.simbolos['+'] = llaves[inicio['pos']]
+        self.simbolos['-'] = llaves[inicio['neg']]
+
+        clave = _trie(self.palabras)
+        simbolo = ''.join(re.escape(s) for s in sorted(self.simbolos))
+
+        # Los espacios van pegados al inicio de cada match para no gastar una vuelta en ellos
+        self.regex = re.compile(
+            r'[ \t\r]*+(?:'
+            r'(?P<salto>\n)'
+            r'|(?P<string>"[^"]*")'
+            f'|(?P<clave>{clave})'
+            r'|(?P<id>[a-z][a-z0-9]*)'
+            r'|(?P<decimal>[0-9]+\.[0-9]*)'
+            r'|(?P<entero>[0-9]+)'
+            f'|(?P<simbolo>[{simbolo}])'
+            r'|(?P<error>[\s\S]))'
+        )
+
+        # Lo mismo pero sobre el texto sin limpiar: los comentarios se brincan aqui mismo
+        # y los strings pueden traer comentarios adentro, como los deja pasar limpia
+        self.regex_fusion = _regex_fusion(clave, simbolo)
+
+        # Variante que no camina el trie: toma la corrida entera de letras que pueden ir en
+        # una palabra clave y la busca en palabras de un jalon
+        iniciales = ''.join(sorted({k[0] for k in self.palabras}))
+        resto = ''.join(sorted({c for k in self.palabras for c in k[1:]}))
+        self.regex_palabras = _regex_fusion(f'[{re.escape(iniciales)}][{re.escape(resto)}]*', simbolo)
+
+        # regex_fusion en bytes, para tokenizar un mmap sin decodificarlo. Ahi el \b de los
+        # articulos no ve las letras fuera de ASCII, de eso se encarga el tokenizador
+        self.regex_binaria = re.compile(self.regex_fusion.pattern.encode('ascii'))
+
+    def _escanea(self, texto, i):
+        # Solo se clasifica lo que puede caer en el token: hasta el fin de la linea o hasta
+        # la comilla que cierra el string. En bytes se decodifica nada mas ese pedazo
+        salto, comilla = ('\n', '"') if isinstance(texto, str) else (b'\n', b'"')
+        fin = texto.find(salto, i)
+        if fin < 0:
+            fin = len(texto)
+        if texto[i:i + 1] == comilla:
+            fin = max(fin, texto.find(comilla, i + 1) + 1)
+        ventana = texto[i:fin]
+        if not isinstance(ventana, str):
+            ventana = str(ventana, 'utf-8')
+        estado, j, motivo = escanea_token(self.tabla, ventana, self.tabla.clasifica(ventana), 0)
+        return ventana, estado, j, motivo
+
+    def falla(self, texto, i):
+        """(estado, fin, motivo) del automata compilado en i; texto puede ser bytes y fin
+        queda en bytes tambien"""
+        ventana, estado, j, motivo = self._escanea(texto, i)
+        if not isinstance(texto, str):
+            j = len(ventana[:j].encode('utf-8'))
+        return estado, i + j, motivo
+
+    def error(self, texto, i, linea):
+        """Deja que el automata compilado diga por que no hay token en i"""
+        ventana, estado, j, motivo = self._escanea(texto, i)
+        return ValueError(mensaje_error(motivo, ventana, j, estado, linea))
+
+
+def tokenizacion_patron(patron, texto, linea_actual=1):
+    """Mismos tokens que tokenizacion, pero el ciclo por caracter lo hace re"""
+    resultado = []
+    palabras = patron.palabras
+    simbolos = patron.simbolos
+    tipos = patron.tipos
+
+    for m in patron.regex.finditer(texto):
+        grupo = m.lastindex
+        if grupo == SALTO:
+            linea_actual += 1
+            continue
+        lexema = m.group(grupo)
+        if grupo == CLAVE:
+            tipo = palabras[lexema]
+        elif grupo == SIMBOLO:
+            tipo = simbolos[lexema]
+        elif grupo == ERROR:
+            tipo = None
+        else:
+            tipo = tipos[grupo]
+        if tipo is None:
+            raise patron.error(texto, m.start(grupo), linea_actual)
+        resultado.append(Token(tipo, lexema, linea_actual))
+
+    return resultado
@@ -0,0 +1,141 @@
+import json
+import mmap
+from array import array
+from .tipos import Tipo
+
+# Token que deja el lexico al recuperarse de un error
+ERROR = Tipo.ERROR
+
+# Encabezado del formato serializado
+_FIRMA = b"TKS2"
+
+
+class TokenVista:
+    """Lo que regresa TokenStream[i]: se ve como un Token pero el lexema se corta del
+    texto hasta que alguien lo pide"""
+    __slots__ = ('_flujo', '_i', 'tipo', 'linea')
+
+    def __init__(self, flujo, i):
+        self._flujo = flujo
+        self._i = i
+        self.tipo = Tipo(flujo.kinds[i])
+        self.linea = flujo.lineas[i]
+
+    @property
+    def lexema(self):
+        return self._flujo.lexema(self._i)
+
+    def __repr__(self):
+        return f"Token({self.tipo}, '{self.lexema}', L{self.linea})"
+
+    def __str__(self):
+        return str(self.tipo)
+
+
+class TokenStream:
+    """Tokens guardados por columnas: tipo, inicio y fin en el texto fuente y linea.
+    El tipo va como su valor en Tipo, asi las columnas se pueden pegar o mandar a otro
+    proceso tal cual. Solo los strings que limpia modifica guardan su lexema aparte. La
+    fuente puede ser bytes (un mmap, por ejemplo): ahi las posiciones van en bytes y cada
+    lexema se decodifica cuando se pide"""
+    def __init__(self, fuente):
+        self.fuente = fuente
+        self.binario = fuente is not None and not isinstance(fuente, str)
+        self.kinds = array('H')
+        self.inicios = array('I')
+        self.fines = array('I')
+        self.lineas = array('I')
+        self.lexemas = {}
+
+    def agrega(self, tipo, inicio, fin, linea, lexema=None):
+        if lexema is not None:
+            self.lexemas[len(self.kinds)] = lexema
+        self.kinds.append(tipo)
+        self.inicios.append(inicio)
+        self.fines.append(fin)
+        self.lineas.append(linea)
+
+    def lexema(self, i):
+        if i in self.lexemas:
+            return self.lexemas[i]
+        lexema = self.fuente[self.inicios[i]:self.fines[i]]
+        return str(lexema, 'utf-8') if self.binario else lexema
+
+    def columna(self, offset):
+        """Columna, desde 1 y en caracteres, de la posicion offset de la fuente"""
+        salto = b'\n' if self.binario else '\n'
+        inicio = self.fuente.rfind(salto, 0, offset) + 1
+        if self.binario:
+            return len(str(self.fuente[inicio:offset], 'utf-8')) + 1
+        return offset - inicio + 1
+
+    def tipo(self, i):
+        return Tipo(self.kinds[i])
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("token fuera de rango")
+        return TokenVista(self, i)
+
+    def __delitem__(self, i):
+        # Solo para quitar la cola, que es lo que hace el tokenizador al descartar una linea
+        if not isinstance(i, slice) or i.stop is not None or i.step is not None:
+            raise TypeError("Solo se puede borrar la cola del TokenStream")
+        n = i.indices(len(self))[0]
+        del self.kinds[n:], self.inicios[n:], self.fines[n:], self.lineas[n:]
+        for k in [k for k in self.lexemas if k >= n]:
+            del self.lexemas[k]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield TokenVista(self, i)
+
+    def __repr__(self):
+        return f"TokenStream({len(self)} tokens)"
+
+    def __getstate__(self):
+        # Un mmap no se puede mandar a otro proceso, va lo que tiene
+        estado = self.__dict__.copy()
+        if isinstance(self.fuente, mmap.mmap):
+            estado['fuente'] = self.fuente[:]
+        return estado
+
+    def serializa(self):
+        """Bytes con todo el flujo, texto fuente incluido: encabezado json y las columnas crudas"""
+        encabezado = json.dumps({
+            "n": len(self),
+            "binario": self.binario,
+            "lexemas": [[k, v] for k, v in self.lexemas.items()],
+        }).encode("utf-8")
+        return b"".join((
+            _FIRMA, len(encabezado).to_bytes(4, "little"), encabezado,
+            self.kinds.tobytes(), self.inicios.tobytes(),
+            self.fines.tobytes(), self.lineas.tobytes(),
+            bytes(self.fuente) if self.binario else self.fuente.encode("utf-8"),
+        ))
+
+    @classmethod
+    def deserializa(cls, datos):
+        datos = memoryview(datos)
+        if datos[:4] != _FIRMA:
+            raise ValueError("No es un TokenStream serializado")
+        largo = int.from_bytes(datos[4:8], "little")
+        pos = 8 + largo
+        encabezado = json.loads(bytes(datos[8:pos]))
+        flujo = cls(None)
+        n = encabezado["n"]
+        for columna in (flujo.kinds, flujo.inicios, flujo.fines, flujo.lineas):
+            fin = pos + n * columna.itemsize
+            columna.frombytes(datos[pos:fin])
+            pos = fin
+        flujo.binario = encabezado.get("binario", False)
+        flujo.fuente = bytes(datos[pos:]) if flujo.binario else str(datos[pos:], "utf-8")
+        flujo.lexemas = {k: v for k, v in encabezado["lexemas"]}
+        return flujo
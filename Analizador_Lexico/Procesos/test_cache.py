@@ -0,0 +1,28 @@
+import os
+import shutil
+import tempfile
+import unittest
+from Analizador_Lexico.Procesos.cache import carga_o_construye
+
+
+class TestCache(unittest.TestCase):
+    def test_borra_las_viejas(self):
+        # Cada cambio en la fuente deja una cache nueva y se lleva la anterior
+        carpeta = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, carpeta)
+        fuente = os.path.join(carpeta, "fuente.py")
+        otra = os.path.join(carpeta, "otra-0123456789abcdef.pickle")
+        open(otra, "wb").close()
+        for version in range(3):
+            with open(fuente, "w") as f:
+                f.write(f"version = {version}\n")
+            self.assertEqual(carga_o_construye(lambda: version, "prueba", (fuente,), carpeta), version)
+            caches = [n for n in os.listdir(carpeta) if n.startswith("prueba-")]
+            self.assertEqual(len(caches), 1, caches)
+        # Ya guardada se lee sin construir, y lo de otros nombres no se toca
+        self.assertEqual(carga_o_construye(lambda: None, "prueba", (fuente,), carpeta), 2)
+        self.assertTrue(os.path.exists(otra))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import io
+import unittest
+from Analizador_Lexico.Lexi import iter_tokens, tablas_lexicas
+from Analizador_Lexico.Procesos.fusion import tokenizacion_fusionada
+from Analizador_Lexico.Procesos.limpieza import limpia
+from Analizador_Lexico.Procesos.tokenizador import tokenizacion
+from Analizador_Lexico.Procesos.verificacion import verifica
+
+
+def verifica_fusionados(texto):
+    tablas = tablas_lexicas()
+    patron = tablas.patron
+    return verifica(texto, lambda texto: tokenizacion(tablas.lexi, limpia(texto)), {
+        "fusion": lambda texto: tokenizacion_fusionada(patron, texto),
+        "flujo": lambda texto: list(iter_tokens(io.StringIO(texto), 8)),
+        "mmap": lambda texto: tokenizacion_fusionada(patron, texto.encode("utf-8")),
+        "palabras": lambda texto: tokenizacion_fusionada(patron, texto, regex=patron.regex_palabras),
+    }, sin_lineas=("fusion", "flujo", "mmap", "palabras"))
+
+
+class TestFusion(unittest.TestCase):
+    def test_comentario_sin_cerrar(self):
+        # El /* sin cerrar borra la linea logica completa, con lo que hay antes del comentario
+        # de varias lineas, y tambien la linea donde el /* sale de juntar dos comentarios
+        casos = {
+            ' OCon */- +12 /* multi\nline */ 3.5-la/* Decida O': [],
+            'x\n*//* a\nb */*/ 12\ny': ['x', 'y'],
+            'Para p /* a\nb */ $ /* c\n12': ['12'],
+        }
+        for texto, lexemas in casos.items():
+            with self.subTest(texto=texto):
+                self.assertEqual([t.lexema for t in verifica_fusionados(texto)], lexemas)
+
+    def test_string_partido(self):
+        # El /* esta en una linea que empieza dentro de un string: limpia corta el string y
+        # truena, fusion se lleva todo. No se imita, verifica lo tiene que marcar
+        with self.assertRaisesRegex(ValueError, "Divergencia en 'fusion'"):
+            verifica_fusionados('x "s /* t */\nu"/*""')
+
+
+if __name__ == "__main__":
+    unittest.main()
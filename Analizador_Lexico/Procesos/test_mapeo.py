@@ -0,0 +1,39 @@
+import os
+import pickle
+import tempfile
+import unittest
+from Analizador_Lexico.Lexi import tablas_lexicas
+from Analizador_Lexico.Procesos.fusion import tokenizacion_fusionada
+from Analizador_Lexico.Procesos.mapeo import mapea
+
+TEXTO = ('Para p\n{\n    El x Puntual; -el\n    x Dice "uno  /* no */\n\n  dos";\n'
+         '    Se_Escribe x $ x -elá;\n    x Dice "ñá -la€;\n}\nFin\n')
+
+
+def resumen(flujo):
+    return [(t.tipo, t.lexema, t.linea) for t in flujo]
+
+
+class TestMapeo(unittest.TestCase):
+    def test_como_texto(self):
+        # El archivo con saltos de Windows da lo mismo que leido como texto, errores incluidos
+        patron = tablas_lexicas().patron
+        with tempfile.NamedTemporaryFile(delete=False) as archivo:
+            archivo.write(TEXTO.replace('\n', '\r\n').encode('utf-8'))
+        self.addCleanup(os.unlink, archivo.name)
+        datos = mapea(archivo.name)
+        self.addCleanup(datos.close)
+
+        esperados, diagnosticos = [], []
+        texto = tokenizacion_fusionada(patron, TEXTO, diagnosticos=esperados)
+        mapeado = tokenizacion_fusionada(patron, datos, diagnosticos=diagnosticos)
+        self.assertEqual(resumen(mapeado), resumen(texto))
+        self.assertEqual(repr(diagnosticos), repr(esperados))
+        self.assertEqual([d.mensaje for d in diagnosticos], [d.mensaje for d in esperados])
+        self.assertIn('"uno \n dos"', [t.lexema for t in mapeado])
+        # Para mandarlo a otro proceso el mmap se va como bytes
+        self.assertEqual(resumen(pickle.loads(pickle.dumps(mapeado))), resumen(texto))
+
+
+if __name__ == "__main__":
+    unittest.main()
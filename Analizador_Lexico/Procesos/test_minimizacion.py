@@ -0,0 +1,19 @@
+import unittest
+from Analizador_Lexico.Lexi import Lexico
+from Analizador_Lexico.Procesos.minimizacion import valida
+
+
+class TestValida(unittest.TestCase):
+    def test_conflicto_gana_la_ultima(self):
+        # El lexico se queda con 0 -'a'-> 3, asi que 1 y 2 son los que no se alcanzan
+        transiciones = [(0, 1, 'a'), (1, 2, 'b'), (0, 3, 'a')]
+        self.assertEqual(Lexico(transiciones, {2, 3}).estados[0]['a'], 3)
+        self.assertEqual(valida(transiciones, {2, 3}, {2: 'X', 3: 'Y'}), [
+            "Conflicto en 0 con 'a': va a 1 y a 3, se queda 3",
+            "Estado 1 no se alcanza desde 0",
+            "Estado 2 no se alcanza desde 0",
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,22 @@
+from enum import IntEnum
+from .tokens import llaves
+
+
+class _Tipo(IntEnum):
+    # Se imprimen con su nombre, igual que cuando los tipos eran strings
+    def __str__(self):
+        return self.name
+
+    def __format__(self, formato):
+        return format(self.name, formato)
+
+
+# Un numero por tipo de token en el orden de llaves, desde 1 para que ninguno sea falso.
+# Al final los que no salen del automata: ERROR, que deja el lexico al recuperarse de un
+# error; DIFF, que la gramatica usa aunque ninguna palabra lo produce, y EOF, el fin de
+# los tokens
+Tipo = _Tipo("Tipo", [*dict.fromkeys(llaves.values()), "ERROR", "DIFF", "EOF"],
+             module=__name__, qualname="Tipo")
+
+# llaves con el Tipo de cada estado final en vez de su nombre
+llaves_tipo = {estado: Tipo[nombre] for estado, nombre in llaves.items()}
@@ -1,7 +1,8 @@
-from .tokens import llaves
-from .transiciones import num
+from .tipos import llaves_tipo
 
 class Token:
+    __slots__ = ('tipo', 'lexema', 'linea')
+
     def __init__(self, tipo, lexema, linea):
         self.tipo = tipo
         self.lexema = lexema
@@ -12,9 +13,10 @@ class Token:
     
     def __str__(self):
         # Necesario para el sintactico para solo identificar tokens
-        return self.tipo  
+        return str(self.tipo)
 
 def tokenizacion(lexi, texto):
+    from .transiciones import num
     resultado = []
     i = 0
     # Contando las lineas para hacer un super mega duper token
@@ -103,7 +105,7 @@ def tokenizacion(lexi, texto):
         
         # Verificar si llegamos a un estado final
         if estado in lexi.estados_finales:
-            token_tipo = llaves.get(estado)
+            token_tipo = llaves_tipo.get(estado)
             if token_tipo:
                 # Extraer el lexema (texto original) para el super duper token
                 lexema = texto[inicio:j]
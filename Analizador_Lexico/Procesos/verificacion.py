@@ -0,0 +1,36 @@
+def _corre(tokenizador, texto):
+    # Regresa los tokens o el mensaje del error, los dos cuentan para comparar
+    try:
+        return tokenizador(texto), None
+    except ValueError as e:
+        return None, str(e)
+
+
+def primera_diferencia(referencia, candidato, lineas=True):
+    """Indice del primer token distinto entre dos listas, o None si son iguales"""
+    for i, (a, b) in enumerate(zip(referencia, candidato)):
+        if a.tipo != b.tipo or a.lexema != b.lexema or (lineas and a.linea != b.linea):
+            return i
+    if len(referencia) != len(candidato):
+        return min(len(referencia), len(candidato))
+    return None
+
+
+def verifica(texto, referencia, candidatos, sin_lineas=()):
+    """Corre todos los tokenizadores sobre el texto y truena con la primera divergencia.
+    Los de sin_lineas cuentan las lineas del archivo original, a esos no se les comparan"""
+    tokens_ref, error_ref = _corre(referencia, texto)
+    for nombre, candidato in candidatos.items():
+        tokens, error = _corre(candidato, texto)
+        if error_ref or error:
+            if (error_ref is None) != (error is None) or (nombre not in sin_lineas and error_ref != error):
+                raise ValueError(f"Divergencia en '{nombre}': referencia {error_ref!r}, {nombre} {error!r}")
+            continue
+        i = primera_diferencia(tokens_ref, tokens, nombre not in sin_lineas)
+        if i is not None:
+            a = tokens_ref[i] if i < len(tokens_ref) else "EOF"
+            b = tokens[i] if i < len(tokens) else "EOF"
+            raise ValueError(f"Divergencia en '{nombre}', token {i}: referencia {a!r}, {nombre} {b!r}")
+    if error_ref:
+        raise ValueError(error_ref)
+    return tokens_ref
@@ -1,12 +1,21 @@
+from Analizador_Lexico.Procesos.tipos import Tipo
+from Analizador_Sintactico.Arbol import Nodo, Definicion
+from .grafo import Grafo
+
+# Token kinds that can follow DEFINIR
+TIPOS_DATO = frozenset({Tipo.INT, Tipo.REAL, Tipo.BOOL, Tipo.STRING, Tipo.CHAR})
+
+
 class SymbolEntry:
     """Represents an entry in the symbol table"""
     def __init__(self, nombre, tipo, linea_declaracion, scope, id_unico):
         self.nombre = nombre
         self.tipo = tipo  # INT, REAL, BOOL, STRING, CHAR
         self.linea_declaracion = linea_declaracion
-        self.scope = scope  # 0 = global/class, 1+ = functions
+        self.scope = scope  # 0 = global/class, 1+ = one per function
         self.id_unico = id_unico  # VAR_001, FUNC_001, etc.
-        self.lineas_uso = []  # Lines where it's used
+        self.pos = None  # Token of its name in the declaration
+        self.usos = {}  # Line -> [(column, offset), ...] of each use, in order
         self.tiene_valor = False  # Has been assigned a value
         
         # For functions
@@ -15,10 +24,24 @@ class SymbolEntry:
         self.tipo_retorno = None
         self.es_parametro = False  # If it's a function parameter
     
-    def agregar_uso(self, linea):
-        """Add a line where this symbol is used"""
-        if linea not in self.lineas_uso:
-            self.lineas_uso.append(linea)
+    @property
+    def lineas_uso(self):
+        """Lines where it's used, each once, in order"""
+        return list(self.usos)
+    
+    def agregar_uso(self, linea, columna=None, offset=None):
+        """Add a use site; the same site twice in a row is kept once"""
+        sitios = self.usos.get(linea)
+        if sitios is None:
+            sitios = self.usos[linea] = []
+        elif sitios[-1] == (columna, offset):
+            return False
+        sitios.append((columna, offset))
+        return True
+    
+    def sitios(self):
+        """Every use as (line, column, offset), in order"""
+        return [(linea, columna, offset) for linea, sitios in self.usos.items() for columna, offset in sitios]
     
     def marcar_asignado(self):
         """Mark that this variable has been assigned"""
@@ -32,11 +55,34 @@ class SymbolEntry:
 class SymbolTable:
     """Symbol table for semantic analysis"""
     def __init__(self):
-        self.tabla = {}  # Stores all symbols by unique key (name + scope)
-        self.scope_actual_num = 0  # Current scope: 0 = class, 1+ = functions
+        self.tabla = {}  # Every symbol ever declared, by (name, scope)
+        self.scopes = [{}]  # Open scopes, innermost last: name -> entry
+        self.ids_scope = [0]  # Id of each open scope
+        self.scope_actual_num = 0  # Current scope: 0 = class, 1+ = one per function
+        self.contador_scope = 0
         self.contador_var = 0
         self.contador_func = 0
-        self.errores = []
+        self.errores = []  # (token index, message)
+        self.pos = 0  # Token the analyzer is on, errors are reported there
+        self.por_linea = {}  # Line -> symbols used on it (dict as ordered set)
+    
+    def error(self, mensaje, pos=None):
+        """Record an error at token pos, or at the current one"""
+        self.errores.append((self.pos if pos is None else pos, mensaje))
+    
+    def entrar_scope(self):
+        """Open a new scope with its own id, nested in the current one"""
+        self.contador_scope += 1
+        self.scope_actual_num = self.contador_scope
+        self.scopes.append({})
+        self.ids_scope.append(self.scope_actual_num)
+        return self.scope_actual_num
+    
+    def salir_scope(self):
+        """Close the current scope; its symbols stay in tabla"""
+        self.scopes.pop()
+        self.ids_scope.pop()
+        self.scope_actual_num = self.ids_scope[-1]
     
     def generar_id_variable(self):
         """Generate unique ID for variables"""
@@ -48,88 +94,102 @@ class SymbolTable:
         self.contador_func += 1
         return f"FUNC_{self.contador_func:03d}"
     
-    def _generar_clave(self, nombre, scope):
-        """Generate unique key for symbol lookup"""
-        return f"{nombre}@{scope}"
-    
     def agregar_variable(self, nombre, tipo, linea, es_parametro=False):
-        """Add a variable to the symbol table"""
-        clave = self._generar_clave(nombre, self.scope_actual_num)
+        """Add a variable to the current scope"""
+        scope = self.scopes[-1]
         
         # Check if already declared in current scope
-        if clave in self.tabla:
-            entry = self.tabla[clave]
-            self.errores.append(
+        if nombre in scope:
+            entry = scope[nombre]
+            self.error(
                 f"Error línea {linea}: Variable '{nombre}' ya declarada en línea {entry.linea_declaracion}"
             )
             return None
         
         id_unico = self.generar_id_variable()
         entry = SymbolEntry(nombre, tipo, linea, self.scope_actual_num, id_unico)
+        entry.pos = self.pos
         entry.es_parametro = es_parametro
         
         # Parameters automatically have value
         if es_parametro:
             entry.tiene_valor = True
         
-        self.tabla[clave] = entry
+        scope[nombre] = entry
+        self.tabla[(nombre, self.scope_actual_num)] = entry
         return entry
     
     def agregar_funcion(self, nombre, tipo_retorno, parametros, linea):
         """Add a function to the symbol table (always in global scope)"""
-        clave = self._generar_clave(nombre, 0)  # Functions always in scope 0
+        scope = self.scopes[0]  # Functions always in scope 0
         
-        if clave in self.tabla:
-            self.errores.append(
+        if nombre in scope:
+            self.error(
                 f"Error línea {linea}: Función '{nombre}' ya declarada"
             )
             return None
         
         id_unico = self.generar_id_funcion()
         entry = SymbolEntry(nombre, "FUNCTION", linea, 0, id_unico)
+        entry.pos = self.pos
         entry.es_funcion = True
         entry.parametros = parametros
         entry.tipo_retorno = tipo_retorno
         entry.tiene_valor = True  # Functions always "have value"
         
-        self.tabla[clave] = entry
+        scope[nombre] = entry
+        self.tabla[(nombre, 0)] = entry
         return entry
     
     def buscar(self, nombre):
-        """Search for a symbol (current scope first, then global)"""
-        # First try current scope
-        clave_actual = self._generar_clave(nombre, self.scope_actual_num)
-        if clave_actual in self.tabla:
-            return self.tabla[clave_actual]
-        
-        # If not in current scope and we're in a function, try global scope
-        if self.scope_actual_num > 0:
-            clave_global = self._generar_clave(nombre, 0)
-            if clave_global in self.tabla:
-                return self.tabla[clave_global]
-        
+        """Search for a symbol from the innermost open scope out to the global one, as seen
+        from token pos. Globals are all declared up front, so a variable whose declaration
+        comes after pos is not visible yet; functions are visible anywhere"""
+        for scope in reversed(self.scopes):
+            entry = scope.get(nombre)
+            if entry is not None and (entry.es_funcion or entry.pos <= self.pos):
+                return entry
         return None
     
-    def marcar_asignacion(self, nombre, linea):
+    def registrar_uso(self, entry, linea, columna=None, offset=None):
+        """Record a use site in the entry and in the line index"""
+        if entry.agregar_uso(linea, columna, offset):
+            simbolos = self.por_linea.get(linea)
+            if simbolos is None:
+                simbolos = self.por_linea[linea] = {}
+            simbolos[entry] = None
+    
+    def simbolos_en_linea(self, linea):
+        """Symbols referenced on a line, in order of first use"""
+        return list(self.por_linea.get(linea, ()))
+    
+    def marcar_asignacion(self, nombre, linea, columna=None, offset=None):
         """Mark that a variable has been assigned a value"""
         entry = self.buscar(nombre)
         if entry:
             entry.marcar_asignado()
-            entry.agregar_uso(linea)
+            self.registrar_uso(entry, linea, columna, offset)
     
-    def verificar_tiene_valor(self, nombre, linea):
-        """Verify that a variable has a value before using it"""
+    def usar(self, nombre, linea, columna=None, offset=None):
+        """Record a use of nombre and return its entry, or None if it is not declared"""
         entry = self.buscar(nombre)
         if not entry:
-            self.errores.append(
+            self.error(
                 f"Error línea {linea}: Variable '{nombre}' no declarada"
             )
-            return False
+            return None
         
-        entry.agregar_uso(linea)
+        self.registrar_uso(entry, linea, columna, offset)
+        return entry
+    
+    def verificar_tiene_valor(self, nombre, linea, columna=None, offset=None):
+        """Verify that a variable has a value before using it"""
+        entry = self.usar(nombre, linea, columna, offset)
+        if not entry:
+            return False
         
         if not entry.puede_usarse():
-            self.errores.append(
+            self.error(
                 f"Error línea {linea}: Variable '{nombre}' usada sin valor asignado"
             )
             return False
@@ -171,7 +231,7 @@ class SymbolTable:
             print("\n" + "!"*100)
             print(" ERRORES SEMÁNTICOS ".center(100))
             print("!"*100)
-            for error in self.errores:
+            for _, error in self.errores:
                 print(f"  • {error}")
             print("!"*100 + "\n")
             return True
@@ -188,6 +248,10 @@ class SemanticAnalyzer:
         self.tokens = tokens
         self.pos = 0
         self.tabla = SymbolTable()
+        # A TokenStream keeps where each token starts, so uses get a column and offset
+        self.fuente = getattr(tokens, "fuente", None)
+        self.inicios = getattr(tokens, "inicios", None) if self.fuente is not None else None
+        self.con_valor = set()  # Globals with a value when function bodies start
     
     def current(self):
         """Get current token"""
@@ -206,99 +270,160 @@ class SemanticAnalyzer:
         """Move to next token"""
         self.pos += 1
     
+    def sitio(self, i):
+        """Line, column and offset of token i (column and offset are None for plain tokens).
+        Errors the table reports next are placed at token i"""
+        self.tabla.pos = i
+        linea = self.tokens[i].linea
+        if self.inicios is None:
+            return linea, None, None
+        offset = self.inicios[i]
+        return linea, self.tokens.columna(offset), offset
+    
     def analizar(self):
         """Perform complete semantic analysis"""
         print("  → Análisis semántico en progreso...")
         
-        # Single pass: process declarations and usage together
+        # First pass: globals and function signatures, so a function can be used before
+        # it is defined
+        self.declarar()
+        
+        # Second pass: check the process and each function body
         while self.pos < len(self.tokens):
             token = self.current()
             if not token:
                 break
             
-            if token.tipo == "DEFINIR":
-                self.procesar_declaracion()
-            elif token.tipo == "FUNCTION":
+            if token.tipo == Tipo.DEFINIR:
+                self.leer_declaracion()  # Already declared by the first pass
+            elif token.tipo == Tipo.FUNCTION:
                 self.procesar_funcion()
-            elif token.tipo == "ID" and self.peek() and self.peek().tipo == "EQUAL":
+            elif token.tipo == Tipo.ID and self.peek() and self.peek().tipo == Tipo.EQUAL:
                 self.verificar_asignacion()
-            elif token.tipo == "READ":
+            elif token.tipo == Tipo.READ:
                 self.verificar_read()
-            elif token.tipo == "WRITE":
+            elif token.tipo == Tipo.WRITE:
                 self.verificar_write()
-            elif token.tipo == "IF":
+            elif token.tipo == Tipo.IF:
                 self.verificar_condicion()
-            elif token.tipo == "WHILE":
+            elif token.tipo == Tipo.WHILE:
                 self.verificar_condicion()
             else:
                 self.advance()
         
+        self.tabla.errores.sort(key=lambda error: error[0])
         return self.tabla
     
-    def procesar_declaracion(self):
-        """Process variable declaration: DEFINIR ID TIPO"""
+    def declarar(self):
+        """First pass: add the global variables and the function signatures to scope 0,
+        skipping function bodies"""
+        while self.pos < len(self.tokens):
+            token = self.current()
+            if token.tipo == Tipo.DEFINIR:
+                self.procesar_declaracion()
+            elif token.tipo == Tipo.FUNCTION:
+                cabecera = self.leer_cabecera()
+                if cabecera:
+                    nombre, retorno, parametros, linea, self.tabla.pos = cabecera
+                    self.tabla.agregar_funcion(nombre, retorno, parametros, linea)
+                    self.saltar_cuerpo()
+            else:
+                self.advance()
+        self.pos = 0
+    
+    def leer_declaracion(self):
+        """Read a declaration: DEFINIR ID TIPO. Returns (name, type, line, position of the
+        name) or None if it is incomplete"""
         self.advance()  # Skip DEFINIR
         
         token_id = self.current()
-        if not token_id or token_id.tipo != "ID":
+        if not token_id or token_id.tipo != Tipo.ID:
             self.advance()
-            return
+            return None
         
-        nombre = token_id.lexema
-        linea = token_id.linea
+        pos_nombre = self.pos
         self.advance()
         
         token_tipo = self.current()
-        if not token_tipo or token_tipo.tipo not in ["INT", "REAL", "BOOL", "STRING", "CHAR"]:
+        if not token_tipo or token_tipo.tipo not in TIPOS_DATO:
             self.advance()
-            return
+            return None
         
-        tipo = token_tipo.tipo
-        self.tabla.agregar_variable(nombre, tipo, linea)
         self.advance()
+        return token_id.lexema, token_tipo.tipo.name, token_id.linea, pos_nombre
     
-    def procesar_funcion(self):
-        """Process function declaration"""
+    def procesar_declaracion(self):
+        """Process variable declaration in the current scope"""
+        declaracion = self.leer_declaracion()
+        if declaracion:
+            nombre, tipo, linea, self.tabla.pos = declaracion
+            self.tabla.agregar_variable(nombre, tipo, linea)
+    
+    def leer_cabecera(self):
+        """Read a function header up to its closing parenthesis. Returns (name, return
+        variable, parameters, line, position of the name) or None if it is cut short before
+        the parameters"""
         self.advance()  # Skip FUNCTION
         
         token_retorno = self.current()
-        if not token_retorno or token_retorno.tipo != "ID":
-            return
+        if not token_retorno or token_retorno.tipo != Tipo.ID:
+            return None
         var_retorno = token_retorno.lexema
         self.advance()
         
-        if not self.current() or self.current().tipo != "EQUAL":
-            return
+        if not self.current() or self.current().tipo != Tipo.EQUAL:
+            return None
         self.advance()
         
         token_nombre = self.current()
-        if not token_nombre or token_nombre.tipo != "ID":
-            return
+        if not token_nombre or token_nombre.tipo != Tipo.ID:
+            return None
         nombre_funcion = token_nombre.lexema
         linea = token_nombre.linea
+        pos_nombre = self.pos
         self.advance()
         
-        if not self.current() or self.current().tipo != "DELIM_LPAREN":
-            return
+        if not self.current() or self.current().tipo != Tipo.DELIM_LPAREN:
+            return None
         self.advance()
         
         parametros = []
-        while self.current() and self.current().tipo != "DELIM_RPAREN":
-            if self.current().tipo == "ID":
+        while self.current() and self.current().tipo != Tipo.DELIM_RPAREN:
+            if self.current().tipo == Tipo.ID:
                 parametros.append(self.current().lexema)
             self.advance()
         
-        self.tabla.agregar_funcion(nombre_funcion, var_retorno, parametros, linea)
-        
-        if self.current() and self.current().tipo == "DELIM_RPAREN":
+        if self.current() and self.current().tipo == Tipo.DELIM_RPAREN:
+            self.advance()
+        return nombre_funcion, var_retorno, parametros, linea, pos_nombre
+    
+    def saltar_cuerpo(self):
+        """Skip a function body, braces included"""
+        if not self.current() or self.current().tipo != Tipo.DELIM_LKEY:
+            return
+        self.advance()
+        depth = 1
+        while self.current() and depth > 0:
+            if self.current().tipo == Tipo.DELIM_LKEY:
+                depth += 1
+            elif self.current().tipo == Tipo.DELIM_RKEY:
+                depth -= 1
             self.advance()
+    
+    def procesar_funcion(self):
+        """Process function declaration"""
+        cabecera = self.leer_cabecera()
+        if not cabecera:
+            return
+        _, _, parametros, linea, pos_nombre = cabecera
         
-        if self.current() and self.current().tipo == "DELIM_LKEY":
+        if self.current() and self.current().tipo == Tipo.DELIM_LKEY:
             # Enter function scope
-            self.tabla.scope_actual_num += 1
+            self.tabla.entrar_scope()
             self.advance()
             
             # Add parameters as variables in function scope
+            self.tabla.pos = pos_nombre
             for param in parametros:
                 self.tabla.agregar_variable(param, "INT", linea, es_parametro=True)
             
@@ -307,26 +432,26 @@ class SemanticAnalyzer:
             while self.current() and depth > 0:
                 token = self.current()
                 
-                if token.tipo == "DELIM_LKEY":
+                if token.tipo == Tipo.DELIM_LKEY:
                     depth += 1
                     self.advance()
-                elif token.tipo == "DELIM_RKEY":
+                elif token.tipo == Tipo.DELIM_RKEY:
                     depth -= 1
                     if depth == 0:
                         # Exiting function scope
-                        self.tabla.scope_actual_num -= 1
+                        self.tabla.salir_scope()
                     self.advance()
-                elif token.tipo == "DEFINIR":
+                elif token.tipo == Tipo.DEFINIR:
                     self.procesar_declaracion()
-                elif token.tipo == "ID" and self.peek() and self.peek().tipo == "EQUAL":
+                elif token.tipo == Tipo.ID and self.peek() and self.peek().tipo == Tipo.EQUAL:
                     self.verificar_asignacion()
-                elif token.tipo == "READ":
+                elif token.tipo == Tipo.READ:
                     self.verificar_read()
-                elif token.tipo == "WRITE":
+                elif token.tipo == Tipo.WRITE:
                     self.verificar_write()
-                elif token.tipo == "IF":
+                elif token.tipo == Tipo.IF:
                     self.verificar_condicion()
-                elif token.tipo == "WHILE":
+                elif token.tipo == Tipo.WHILE:
                     self.verificar_condicion()
                 else:
                     self.advance()
@@ -336,14 +461,16 @@ class SemanticAnalyzer:
         token_id = self.current()
         nombre = token_id.lexema
         linea = token_id.linea
+        inicio = self.pos
         
+        self.tabla.pos = inicio
         entry = self.tabla.buscar(nombre)
         if not entry:
-            self.tabla.errores.append(
-                f"Error línea {linea}: Variable '{nombre}' no declarada"
+            self.tabla.error(
+                f"Error línea {linea}: Variable '{nombre}' no declarada", inicio
             )
             # Skip to end of statement
-            while self.current() and self.current().tipo != "DELIM_LINE":
+            while self.current() and self.current().tipo != Tipo.DELIM_LINE:
                 self.advance()
             if self.current():
                 self.advance()
@@ -353,17 +480,15 @@ class SemanticAnalyzer:
         self.advance()  # Skip EQUAL
         
         # Check all IDs in the expression
-        while self.current() and self.current().tipo != "DELIM_LINE":
-            if self.current().tipo == "ID":
-                expr_nombre = self.current().lexema
-                expr_linea = self.current().linea
-                self.tabla.verificar_tiene_valor(expr_nombre, expr_linea)
+        while self.current() and self.current().tipo != Tipo.DELIM_LINE:
+            if self.current().tipo == Tipo.ID:
+                self.tabla.verificar_tiene_valor(self.current().lexema, *self.sitio(self.pos))
             self.advance()
         
         # Mark assignment after evaluating expression
-        self.tabla.marcar_asignacion(nombre, linea)
+        self.tabla.marcar_asignacion(nombre, *self.sitio(inicio))
         
-        if self.current() and self.current().tipo == "DELIM_LINE":
+        if self.current() and self.current().tipo == Tipo.DELIM_LINE:
             self.advance()
     
     def verificar_read(self):
@@ -371,22 +496,23 @@ class SemanticAnalyzer:
         linea = self.current().linea
         self.advance()  # Skip READ
         
-        if self.current() and self.current().tipo == "ID":
+        if self.current() and self.current().tipo == Tipo.ID:
             nombre = self.current().lexema
+            self.tabla.pos = self.pos
             entry = self.tabla.buscar(nombre)
             
             if entry:
                 # READ assigns value to variable
-                self.tabla.marcar_asignacion(nombre, linea)
+                self.tabla.marcar_asignacion(nombre, *self.sitio(self.pos))
             else:
-                self.tabla.errores.append(
-                    f"Error línea {linea}: Variable '{nombre}' no declarada en READ"
+                self.tabla.error(
+                    f"Error línea {linea}: Variable '{nombre}' no declarada en READ", self.pos
                 )
             
             self.advance()
         
         # Skip to end of statement
-        while self.current() and self.current().tipo != "DELIM_LINE":
+        while self.current() and self.current().tipo != Tipo.DELIM_LINE:
             self.advance()
         if self.current():
             self.advance()
@@ -395,39 +521,225 @@ class SemanticAnalyzer:
         """Verify WRITE statement - checks variables have values"""
         self.advance()  # Skip WRITE
         
-        while self.current() and self.current().tipo != "DELIM_LINE":
-            if self.current().tipo == "ID":
-                nombre = self.current().lexema
-                linea = self.current().linea
-                self.tabla.verificar_tiene_valor(nombre, linea)
+        while self.current() and self.current().tipo != Tipo.DELIM_LINE:
+            if self.current().tipo == Tipo.ID:
+                self.tabla.verificar_tiene_valor(self.current().lexema, *self.sitio(self.pos))
             
             self.advance()
         
-        if self.current() and self.current().tipo == "DELIM_LINE":
+        if self.current() and self.current().tipo == Tipo.DELIM_LINE:
             self.advance()
     
     def verificar_condicion(self):
         """Verify IF/WHILE condition"""
         self.advance()  # Skip IF/WHILE
         
-        if self.current() and self.current().tipo == "DELIM_LPAREN":
+        if self.current() and self.current().tipo == Tipo.DELIM_LPAREN:
             self.advance()
             
             # Check that variables in condition exist and have values
-            while self.current() and self.current().tipo != "DELIM_RPAREN":
-                if self.current().tipo == "ID":
-                    nombre = self.current().lexema
-                    linea = self.current().linea
-                    self.tabla.verificar_tiene_valor(nombre, linea)
+            while self.current() and self.current().tipo != Tipo.DELIM_RPAREN:
+                if self.current().tipo == Tipo.ID:
+                    self.tabla.verificar_tiene_valor(self.current().lexema, *self.sitio(self.pos))
                 
                 self.advance()
             
-            if self.current() and self.current().tipo == "DELIM_RPAREN":
+            if self.current() and self.current().tipo == Tipo.DELIM_RPAREN:
                 self.advance()
 
 
-def inicia_semantico(tokens):
-    """Main function to start semantic analysis"""
+    def analizar_arbol(self, programa, procesos=1):
+        """Same checks as analizar, walking the syntax tree instead of the tokens. Whether a
+        variable has a value is decided per body with a definite-assignment analysis over
+        its control-flow graph, so an assignment in one branch or loop body does not count
+        after it. With procesos other than 1 the function bodies are checked in a process
+        pool (None for one process per CPU). Errors come out in source order"""
+        print("  → Análisis semántico en progreso...")
+        self.declarar_arbol(programa)
+        self.abrir_grafo()
+        self.visitar_bloque(programa.cuerpo)
+        self.cerrar_grafo()
+        self.fijar_globales()
+        if procesos != 1:
+            from .paralelo import revision_paralela
+            revision_paralela(self, programa.funciones, procesos)
+        else:
+            for funcion in programa.funciones:
+                self.visitar_funcion(funcion)
+        self.tabla.errores.sort(key=lambda error: error[0])
+        return self.tabla
+    
+    def declarar_arbol(self, programa):
+        """First pass over the tree: globals of the process and every function signature"""
+        for nodo in self.definiciones(programa.cuerpo):
+            self.declarar_variable(nodo)
+        for funcion in programa.funciones:
+            self.tabla.pos = funcion.nombre
+            parametros = [self.lexema(i) for i in funcion.parametros]
+            self.tabla.agregar_funcion(self.lexema(funcion.nombre), self.lexema(funcion.retorno), parametros, self.linea(funcion.nombre))
+    
+    def definiciones(self, nodos):
+        """Declarations of a body in order, also the ones nested in other statements"""
+        pila = list(reversed(nodos))
+        while pila:
+            nodo = pila.pop()
+            if isinstance(nodo, Definicion):
+                yield nodo
+            elif isinstance(nodo, Nodo):
+                for campo in reversed(nodo.__slots__):
+                    valor = getattr(nodo, campo)
+                    if isinstance(valor, list):
+                        pila.extend(reversed(valor))
+    
+    def lexema(self, i):
+        return self.tokens[i].lexema
+    
+    def linea(self, i):
+        return self.tokens[i].linea
+    
+    def fijar_globales(self):
+        """Globals the process leaves with a value. A function body starts from these and
+        not from what another function assigned, so each body can be checked on its own"""
+        self.con_valor = {entry for entry in self.tabla.scopes[0].values() if entry.tiene_valor}
+    
+    def abrir_grafo(self):
+        """Start the control-flow graph of a body; variables get bits as they show up"""
+        self.grafo = Grafo()
+        self.bits = {}
+        self.entrada = 0  # Bits already assigned when the body starts
+    
+    def bit(self, entry):
+        bit = self.bits.get(entry)
+        if bit is None:
+            bit = self.bits[entry] = 1 << len(self.bits)
+            # A global used from a function has a value if the process gave it one
+            if entry.scope != self.tabla.scope_actual_num and entry in self.con_valor:
+                self.entrada |= bit
+        return bit
+    
+    def cerrar_grafo(self):
+        """Report the uses that some path reaches without an assignment"""
+        for i in self.grafo.sin_asignar(self.entrada):
+            self.tabla.error(f"Error línea {self.linea(i)}: Variable '{self.lexema(i)}' usada sin valor asignado", i)
+    
+    def visitar_bloque(self, nodos):
+        """Visit each statement node in order. Like the table parser this uses an explicit
+        stack and no recursion, so nesting depth is not limited by Python's stack: a
+        visitor returns what comes after it, the statements of its bodies and the steps
+        of the control-flow graph (Grafo methods) that go between them"""
+        pila = list(reversed(nodos))
+        while pila:
+            nodo = pila.pop()
+            if not isinstance(nodo, Nodo):
+                nodo()
+                continue
+            siguientes = getattr(self, f"visitar_{type(nodo).__name__.lower()}")(nodo)
+            if siguientes:
+                pila.extend(reversed(siguientes))
+    
+    def visitar_funcion(self, nodo):
+        """Parameters and body go to the function scope; the header is already in scope 0"""
+        linea = self.linea(nodo.nombre)
+        self.tabla.pos = nodo.nombre
+        self.tabla.entrar_scope()
+        for i in nodo.parametros:
+            self.tabla.agregar_variable(self.lexema(i), "INT", linea, es_parametro=True)
+        self.abrir_grafo()
+        self.visitar_bloque(nodo.cuerpo)
+        self.cerrar_grafo()
+        self.tabla.salir_scope()
+    
+    def visitar_definicion(self, nodo):
+        # Globals were declared by the first pass
+        if self.tabla.scope_actual_num:
+            self.declarar_variable(nodo)
+    
+    def declarar_variable(self, nodo):
+        self.tabla.pos = nodo.nombre
+        self.tabla.agregar_variable(self.lexema(nodo.nombre), self.tokens[nodo.tipo].tipo.name, self.linea(nodo.nombre))
+    
+    def visitar_asignacion(self, nodo):
+        self.asignar(nodo.nombre, nodo.valor.ids)
+    
+    def asignar(self, i, ids):
+        """Variable i gets a value computed from the ids"""
+        nombre = self.lexema(i)
+        linea = self.linea(i)
+        self.tabla.pos = i
+        entry = self.tabla.buscar(nombre)
+        if not entry:
+            self.tabla.error(
+                f"Error línea {linea}: Variable '{nombre}' no declarada", i
+            )
+            return
+        self.verificar_ids(ids)
+        self.tabla.marcar_asignacion(nombre, *self.sitio(i))
+        self.grafo.asigna(self.bit(entry))
+    
+    def verificar_ids(self, ids):
+        for i in ids:
+            entry = self.tabla.usar(self.lexema(i), *self.sitio(i))
+            # Parameters and functions always have a value
+            if entry and not (entry.es_parametro or entry.es_funcion):
+                self.grafo.usa(self.bit(entry), i)
+    
+    def visitar_lectura(self, nodo):
+        linea = self.linea(nodo.inicio)
+        nombre = self.lexema(nodo.nombre)
+        self.tabla.pos = nodo.nombre
+        entry = self.tabla.buscar(nombre)
+        if entry:
+            self.tabla.marcar_asignacion(nombre, *self.sitio(nodo.nombre))
+            self.grafo.asigna(self.bit(entry))
+        else:
+            self.tabla.error(
+                f"Error línea {linea}: Variable '{nombre}' no declarada en READ", nodo.nombre
+            )
+    
+    def visitar_escritura(self, nodo):
+        self.verificar_ids([i for i in nodo.valores if self.tokens[i].tipo == Tipo.ID])
+    
+    def visitar_si(self, nodo):
+        self.verificar_ids(nodo.condicion.ids)
+        return self.ramas([nodo.entonces, nodo.sino])
+    
+    def ramas(self, cuerpos):
+        """Bodies that start from the current block, one of which runs"""
+        self.grafo.abre_ramas()
+        pasos = []
+        for cuerpo in cuerpos:
+            pasos += [self.grafo.rama, *cuerpo]
+        pasos.append(self.grafo.cierra_ramas)
+        return pasos
+    
+    def visitar_mientras(self, nodo):
+        self.grafo.abre_ciclo()
+        self.verificar_ids(nodo.condicion.ids)
+        self.grafo.entra_ciclo()
+        return [*nodo.cuerpo, self.grafo.cierra_ciclo]
+    
+    def visitar_repetir(self, nodo):
+        # The until condition is not checked, same as the token pass
+        self.grafo.abre_repeticion()
+        return [*nodo.cuerpo, self.grafo.cierra_repeticion]
+    
+    def visitar_para(self, nodo):
+        # The loop variable is assigned by the header
+        self.asignar(nodo.variable, [])
+        self.grafo.abre_ciclo()
+        self.grafo.entra_ciclo()
+        return [*nodo.cuerpo, self.grafo.cierra_ciclo]
+    
+    def visitar_selecciona(self, nodo):
+        return self.ramas([caso.cuerpo for caso in nodo.casos] + [nodo.defecto])
+
+
+def inicia_semantico(tokens, arbol=None, procesos=1):
+    """Main function to start semantic analysis. With the tree from
+    inicia_sintactico(tokens, arbol=True) the tokens are not scanned again, and with
+    procesos other than 1 the function bodies are checked in parallel"""
+    if arbol is None and procesos != 1:
+        raise ValueError("Parallel semantic checking needs the syntax tree")
     analyzer = SemanticAnalyzer(tokens)
-    tabla = analyzer.analizar()
+    tabla = analyzer.analizar() if arbol is None else analyzer.analizar_arbol(arbol, procesos)
     return tabla, len(tabla.errores) > 0
\ No newline at end of file
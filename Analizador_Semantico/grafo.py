@@ -0,0 +1,129 @@
+from collections import deque
+
+
+class Bloque:
+    """Basic block: uses and assignments in order, and the edges between blocks"""
+    __slots__ = ('eventos', 'genera', 'sucesores', 'predecesores')
+
+    def __init__(self):
+        self.eventos = []  # (bit, token index) for a use, (bit, None) for an assignment
+        self.genera = 0  # Bits of the variables it assigns
+        self.sucesores = []
+        self.predecesores = []
+
+
+class Grafo:
+    """Control-flow graph of one body, built while walking its tree. Variables are bits
+    of an int, so a set of assigned variables is a single number. Branches and loops are
+    opened and closed as steps of the walk, with a stack of the ones still open instead
+    of nested calls"""
+
+    def __init__(self):
+        self.bloques = [Bloque()]
+        self.actual = 0  # Block that receives the next events
+        self.abiertos = []  # Open branches and loops, innermost last
+
+    def nuevo(self, *desde):
+        """New block reached from the given blocks; it becomes the current one"""
+        self.bloques.append(Bloque())
+        self.actual = len(self.bloques) - 1
+        for bloque in desde:
+            self.arista(bloque, self.actual)
+        return self.actual
+
+    def arista(self, desde, hasta):
+        self.bloques[desde].sucesores.append(hasta)
+        self.bloques[hasta].predecesores.append(desde)
+
+    def abre_ramas(self):
+        """Alternative bodies from the current block: rama before each one, then
+        cierra_ramas"""
+        self.abiertos.append((self.actual, []))
+
+    def rama(self):
+        antes, fines = self.abiertos[-1]
+        # Every body gets its own block, so only the first rama finds antes current
+        if self.actual != antes:
+            fines.append(self.actual)
+        self.nuevo(antes)
+
+    def cierra_ramas(self):
+        """Block where the bodies join"""
+        _, fines = self.abiertos.pop()
+        self.nuevo(*fines, self.actual)
+
+    def abre_ciclo(self):
+        """Loop head that runs before each pass and once more to leave; the condition
+        goes in it and entra_ciclo starts the body"""
+        self.abiertos.append(self.nuevo(self.actual))
+
+    def entra_ciclo(self):
+        self.nuevo(self.abiertos[-1])
+
+    def cierra_ciclo(self):
+        """Back to the head after the body and out of the loop from it"""
+        cabeza = self.abiertos.pop()
+        self.arista(self.actual, cabeza)
+        self.nuevo(cabeza)
+
+    def abre_repeticion(self):
+        """Body that runs at least once, closed by cierra_repeticion"""
+        self.abiertos.append(self.nuevo(self.actual))
+
+    def cierra_repeticion(self):
+        cuerpo = self.abiertos.pop()
+        fin = self.actual
+        self.arista(fin, cuerpo)
+        self.nuevo(fin)
+
+    def usa(self, bit, pos):
+        self.bloques[self.actual].eventos.append((bit, pos))
+
+    def asigna(self, bit):
+        bloque = self.bloques[self.actual]
+        bloque.eventos.append((bit, None))
+        bloque.genera |= bit
+
+    def asignadas(self, entrada):
+        """Definitely assigned variables on entry to each block: a variable counts only
+        if every path from the start assigns it. Worklist over the blocks, each one is
+        revisited only when the set of one of its predecesors shrinks"""
+        bloques = self.bloques
+        todas = entrada
+        for bloque in bloques:
+            todas |= bloque.genera
+        # Must-analysis: everything starts full and only loses bits
+        salida = [todas] * len(bloques)
+        entra = [todas] * len(bloques)
+        entra[0] = entrada
+        pendientes = deque(range(len(bloques)))
+        en_cola = [True] * len(bloques)
+        while pendientes:
+            b = pendientes.popleft()
+            en_cola[b] = False
+            bloque = bloques[b]
+            if b:
+                estado = todas
+                for p in bloque.predecesores:
+                    estado &= salida[p]
+                entra[b] = estado
+            nueva = entra[b] | bloque.genera
+            if nueva != salida[b]:
+                salida[b] = nueva
+                for s in bloque.sucesores:
+                    if not en_cola[s]:
+                        en_cola[s] = True
+                        pendientes.append(s)
+        return entra
+
+    def sin_asignar(self, entrada):
+        """Token indices of the uses whose variable may not have a value yet, in order"""
+        usos = []
+        for bloque, estado in zip(self.bloques, self.asignadas(entrada)):
+            for bit, pos in bloque.eventos:
+                if pos is None:
+                    estado |= bit
+                elif not estado & bit:
+                    usos.append(pos)
+        usos.sort()
+        return usos
@@ -0,0 +1,87 @@
+import copy
+import os
+from concurrent.futures import ProcessPoolExecutor
+from Analizador_Sintactico.Arbol import aplana, arma
+from Analizador_Sintactico.paralelo import MINIMO, tandas
+from .Semanti import SemanticAnalyzer
+
+# Set once per worker by _inicia: the tokens and the scope 0 entries without their uses
+_tokens = None
+_globales = None
+
+
+def _inicia(tokens, globales):
+    global _tokens, _globales
+    _tokens, _globales = tokens, globales
+
+
+def _revisa(primera, funciones):
+    # Check functions primera, primera + 1, ... against fresh copies of the globals. They
+    # come flattened by aplana, since pickle recurses once per tree level. Returns the
+    # errors, the entries the bodies created or used, in creation order, and the symbols
+    # used on each line
+    analyzer = SemanticAnalyzer(_tokens)
+    tabla = analyzer.tabla
+    for entry in _globales:
+        copia = copy.copy(entry)
+        copia.usos = {}
+        tabla.scopes[0][copia.nombre] = copia
+        tabla.tabla[(copia.nombre, 0)] = copia
+    analyzer.fijar_globales()
+    tabla.contador_scope = primera  # Function k opens scope k + 1, same as in one process
+    for funcion in funciones:
+        analyzer.visitar_funcion(arma(funcion))
+    tocadas = [entry for entry in tabla.tabla.values() if entry.scope or entry.usos]
+    return tabla.errores, tocadas, tabla.por_linea
+
+
+def _junta(tabla, errores, tocadas, por_linea):
+    # Add one batch to the table. Its globals are copies: their uses go to the real entries.
+    # Local variables take the next ids, which is the order they get in one process
+    reales = {}
+    for entry in tocadas:
+        if entry.scope == 0:
+            real = tabla.tabla[(entry.nombre, 0)]
+            for linea, sitios in entry.usos.items():
+                real.usos.setdefault(linea, []).extend(sitios)
+            real.tiene_valor = real.tiene_valor or entry.tiene_valor
+            reales[entry] = real
+        else:
+            entry.id_unico = tabla.generar_id_variable()
+            tabla.tabla[(entry.nombre, entry.scope)] = entry
+    for linea, simbolos in por_linea.items():
+        destino = tabla.por_linea.setdefault(linea, {})
+        for entry in simbolos:
+            destino[reales.get(entry, entry)] = None
+    tabla.errores += errores
+
+
+def revision_paralela(analyzer, funciones, procesos=None, minimo=MINIMO):
+    """Check the function bodies in a process pool and merge them into analyzer.tabla in
+    source order, with the same result as checking them one after another. The process
+    body and the first pass must be done already. Programs with fewer than minimo tokens
+    of functions are checked here"""
+    procesos = procesos or os.cpu_count() or 1
+    tokens = funciones[-1].fin - funciones[0].inicio if funciones else 0
+    if procesos < 2 or len(funciones) < 2 or tokens < minimo:
+        for funcion in funciones:
+            analyzer.visitar_funcion(funcion)
+        return
+
+    lotes = tandas(funciones, lambda funcion: (funcion.inicio, funcion.fin), procesos)
+    primeras = [0]
+    for lote in lotes[:-1]:
+        primeras.append(primeras[-1] + len(lote))
+
+    # The workers get the tokens and the globals once, each batch only its trees
+    tabla = analyzer.tabla
+    globales = []
+    for entry in tabla.scopes[0].values():
+        copia = copy.copy(entry)
+        copia.usos = {}
+        globales.append(copia)
+    with ProcessPoolExecutor(procesos, initializer=_inicia, initargs=(analyzer.tokens, globales)) as pool:
+        planos = ([aplana(funcion) for funcion in lote] for lote in lotes)
+        for parte in pool.map(_revisa, primeras, planos):
+            _junta(tabla, *parte)
+    tabla.contador_scope += len(funciones)
@@ -0,0 +1,64 @@
+import contextlib
+import io
+import unittest
+from Analizador_Lexico.Lexi import tablas_lexicas, relexea_tokens
+from Analizador_Lexico.Procesos.fusion import tokenizacion_fusionada
+from Analizador_Sintactico.Sintac import inicia_sintactico
+from Analizador_Semantico.Semanti import inicia_semantico
+
+# Mas niveles de los que aguanta la recursion de Python (1000 por omision)
+PROFUNDIDAD = 1500
+
+
+def anidado(abre, cierra, n=PROFUNDIDAD, centro="x Dice x Inspira 1;\n", despues=""):
+    """Programa con n sentencias una dentro de otra"""
+    return ("Para p\n{\n    El x Puntual;\n    El y Puntual;\n    El i Puntual;\n    x Dice 1;\n"
+            + abre * n + centro + cierra * n + despues + "}\nFin\n")
+
+
+def revisa(texto):
+    """Tabla de simbolos de texto, sin imprimir"""
+    tokens = tokenizacion_fusionada(tablas_lexicas().patron, texto)
+    with contextlib.redirect_stdout(io.StringIO()):
+        arbol = inicia_sintactico(tokens, arbol=True)
+        tabla, _ = inicia_semantico(tokens, arbol)
+    return tabla
+
+
+class TestAnidado(unittest.TestCase):
+    def test_mientras(self):
+        tabla = revisa(anidado("Mientras (x Disuade 1) Canta\n{\n", "}\nSe_Culmina\n"))
+        self.assertEqual(tabla.errores, [])
+
+    def test_grafo(self):
+        # y se asigna hasta adentro y se usa afuera: solo Repetir asegura que tenga valor
+        casos = {
+            "Mientras": ("Mientras (x Disuade 1) Canta\n{\n", "}\nSe_Culmina\n", 1),
+            "Para": ("De i Dice 1 Hasta 10 Con 1 Visitar\n{\n", "}\nSe_Sienta\n", 1),
+            "Si": ("Si (x Disuade 1) Entonces\n{\n", "}\nSino\n{\nx Dice 2;\n}\nSe_Establece\n", 1),
+            "Repetir": ("Repetir\n{\n", "}\nHasta_Que (x Entiende 2)\n", 0),
+        }
+        for nombre, (abre, cierra, errores) in casos.items():
+            with self.subTest(nombre):
+                tabla = revisa(anidado(abre, cierra, centro="y Dice 1;\n", despues="x Dice y;\n"))
+                self.assertEqual(len(tabla.errores), errores, tabla.errores)
+                if errores:
+                    self.assertIn("'y' usada sin valor asignado", tabla.errores[0][1])
+
+    def test_reanaliza(self):
+        # Una sentencia nueva hasta adentro: el arbol viejo se reusa y se recorren sus indices
+        texto = anidado("Mientras (x Disuade 1) Canta\n{\n", "}\nSe_Culmina\n")
+        tokens = tokenizacion_fusionada(tablas_lexicas().patron, texto)
+        with contextlib.redirect_stdout(io.StringIO()):
+            arbol = inicia_sintactico(tokens, arbol=True)
+            nuevos, cambio = relexea_tokens(tokens, texto.index("x Dice x"), 0, "x Dice 2;\n")
+            nuevo, (viejo, _, tramo) = inicia_sintactico(nuevos, arbol=True, previo=(tokens, arbol), cambio=cambio)
+            tabla, _ = inicia_semantico(nuevos, nuevo)
+        self.assertIsNotNone(viejo)
+        self.assertEqual(tramo[2] - tramo[1], 4)
+        self.assertEqual(nuevo.fin, len(nuevos))
+        self.assertEqual(tabla.errores, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import contextlib
+import functools
+import io
+import random
+import unittest
+from unittest import mock
+from Analizador_Lexico.Lexi import tablas_lexicas
+from Analizador_Lexico.Procesos.fusion import tokenizacion_fusionada
+from Analizador_Sintactico.Sintac import inicia_sintactico
+from Analizador_Sintactico.Arbol import aplana, arma
+from Analizador_Semantico.Semanti import inicia_semantico
+from Analizador_Semantico.paralelo import revision_paralela
+
+# Globales, locales o sin declarar, segun toque
+VARIABLES = "abxyz"
+
+
+def resumen(tabla):
+    """Todo lo que junta la revision en paralelo, para compararlo con la de un proceso"""
+    simbolos = [(clave, e.tipo, e.scope, e.id_unico, e.sitios(), e.tiene_valor, e.es_parametro, e.pos)
+                for clave, e in tabla.tabla.items()]
+    lineas = {linea: [e.id_unico for e in simbolos] for linea, simbolos in tabla.por_linea.items()}
+    return tabla.errores, simbolos, lineas, tabla.contador_scope, tabla.contador_var
+
+
+def sentencias(azar, n, hondo=0, declara=True):
+    """n sentencias al azar sobre VARIABLES, unas dentro de otras hasta tres niveles. Las
+    declaraciones solo van donde la gramatica las deja: fuera de los ciclos o en un Si"""
+    partes = []
+    for _ in range(n):
+        v, w = azar.choice(VARIABLES), azar.choice(VARIABLES)
+        bloque = sentencias(azar, azar.randint(1, 3), hondo + 1, False) if hondo < 3 else ""
+        k = azar.randrange(0 if declara else 1, 9 if bloque else 5)
+        if k == 0:
+            partes.append(f"El {v} {azar.choice(['Puntual', 'Eminente'])};\n")
+        elif k == 1:
+            partes.append(f"{v} Dice {w} Inspira {azar.choice(['1', '2.5'])};\n")
+        elif k == 2:
+            partes.append(f"Escucha {v};\n")
+        elif k == 3:
+            partes.append(f"Se_Escribe {v};\n")
+        elif k == 4:
+            partes.append(f"{v} Dice {w};\n")
+        elif k == 5:
+            partes.append(f"Mientras ({v} Disuade 1) Canta\n{{\n{bloque}}}\nSe_Culmina\n")
+        elif k == 6:
+            entonces = sentencias(azar, azar.randint(1, 3), hondo + 1)
+            sino = sentencias(azar, 1, hondo + 1)
+            partes.append(f"Si ({v} Entiende {w}) Entonces\n{{\n{entonces}}}\nSino\n{{\n{sino}}}\nSe_Establece\n")
+        elif k == 7:
+            partes.append(f"Repetir\n{{\n{bloque}}}\nHasta_Que ({v} Entiende 2)\n")
+        else:
+            partes.append(f"De {v} Dice 1 Hasta 10 Con 1 Visitar\n{{\n{bloque}}}\nSe_Sienta\n")
+    return "".join(partes)
+
+
+def programa(azar, funciones):
+    texto = "Para p\n{\n    El a Puntual;\n    El x Puntual;\n" + sentencias(azar, 3) + "}\nFin\n"
+    for k in range(funciones):
+        # A veces sin declarar r, que tambien es un error
+        declara = "El r Puntual;\n" if azar.random() < 0.8 else ""
+        texto += f"Posdata r Dice f{k}(b)\n{{\n{declara}{sentencias(azar, 4)}r Dice b;\n}}\nAdios\n"
+    return texto
+
+
+def compara(prueba, texto, procesos=2):
+    """La revision de las funciones en procesos aparte da la misma tabla que en serie"""
+    tokens = tokenizacion_fusionada(tablas_lexicas().patron, texto)
+    with contextlib.redirect_stdout(io.StringIO()):
+        arbol = inicia_sintactico(tokens, arbol=True)
+        # Un arbol aparte para cada revision, que no compartan nada
+        copia = arma(aplana(arbol))
+        serie, _ = inicia_semantico(tokens, arbol)
+        paralelo, _ = inicia_semantico(tokens, copia, procesos)
+    prueba.assertEqual(resumen(serie), resumen(paralelo))
+    return paralelo
+
+
+class TestParalelo(unittest.TestCase):
+    def test_hondo(self):
+        # Cinco funciones de 1500 niveles pasan de MINIMO tokens, asi que si se usan procesos
+        cuerpo = ("Mientras (x Disuade 1) Canta\n{\n" * 1500 + "y Dice x;\n"
+                  + "}\nSe_Culmina\n" * 1500 + "Se_Escribe y;\n")
+        funcion = "Posdata r Dice f#(a)\n{\n    El r Puntual;\n    El y Puntual;\n" + cuerpo + "    r Dice a;\n}\nAdios\n"
+        texto = ("Para p\n{\n    El x Puntual;\n    x Dice 1;\n}\nFin\n"
+                 + "".join(funcion.replace("#", str(k)) for k in range(5)))
+        tabla = compara(self, texto)
+        self.assertEqual(len(tabla.errores), 5)
+
+    def test_aleatorio(self):
+        # Programas chicos: para que si se usen los procesos no hay minimo de tokens
+        azar = random.Random(25)
+        errores = 0
+        with mock.patch("Analizador_Semantico.paralelo.revision_paralela",
+                        functools.partial(revision_paralela, minimo=0)):
+            for caso in range(8):
+                with self.subTest(caso=caso):
+                    errores += len(compara(self, programa(azar, azar.randint(2, 6))).errores)
+        self.assertGreater(errores, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,245 @@
+# Arbol que arma el sintactico. Los nodos no copian tokens: guardan indices en la lista
+# de tokens, y cada uno el tramo [inicio, fin) de tokens que cubre
+
+from Analizador_Lexico.Procesos.tipos import Tipo
+
+
+class Nodo:
+    __slots__ = ('inicio', 'fin')
+
+    def __init__(self, inicio, fin, *valores):
+        self.inicio = inicio
+        self.fin = fin
+        for campo, valor in zip(self.__slots__, valores):
+            setattr(self, campo, valor)
+
+    def __reduce__(self):
+        # Para pickle (el sintactico en paralelo) basta con los campos en orden
+        return type(self), (self.inicio, self.fin, *(getattr(self, c) for c in self.__slots__))
+
+    def __repr__(self):
+        campos = ", ".join(f"{c}={getattr(self, c)!r}" for c in self.__slots__)
+        return f"{type(self).__name__}({campos}, tokens {self.inicio}:{self.fin})"
+
+
+class Programa(Nodo):
+    __slots__ = ('nombre', 'cuerpo', 'funciones')
+
+
+class Funcion(Nodo):
+    __slots__ = ('retorno', 'nombre', 'parametros', 'cuerpo')
+
+
+class Definicion(Nodo):
+    __slots__ = ('nombre', 'tipo')
+
+
+class Asignacion(Nodo):
+    __slots__ = ('nombre', 'valor')
+
+
+class Escritura(Nodo):
+    __slots__ = ('valores',)
+
+
+class Lectura(Nodo):
+    __slots__ = ('nombre',)
+
+
+class Si(Nodo):
+    __slots__ = ('condicion', 'entonces', 'sino')
+
+
+class Mientras(Nodo):
+    __slots__ = ('condicion', 'cuerpo')
+
+
+class Repetir(Nodo):
+    __slots__ = ('cuerpo', 'condicion')
+
+
+class Para(Nodo):
+    __slots__ = ('variable', 'desde', 'hasta', 'paso', 'cuerpo')
+
+
+class Selecciona(Nodo):
+    __slots__ = ('variable', 'casos', 'defecto')
+
+
+class Caso(Nodo):
+    __slots__ = ('valor', 'cuerpo')
+
+
+class Expresion(Nodo):
+    # Solo los ids que aparecen, en orden: es lo que revisa el semantico
+    __slots__ = ('ids',)
+
+
+def corre(nodo, desde, delta, salvo=None):
+    """Suma delta a los indices de token >= desde de nodo y de sus hijos, en su lugar. Los
+    nodos que acaban antes de desde no se recorren y salvo se deja como esta"""
+    # Con una pila y no recursivo, para que un arbol muy hondo no llegue al limite de Python
+    pila = [nodo]
+    while pila:
+        nodo = pila.pop()
+        if nodo is salvo or nodo.fin < desde:
+            continue
+        if nodo.inicio >= desde:
+            nodo.inicio += delta
+        nodo.fin += delta
+        for campo in nodo.__slots__:
+            valor = getattr(nodo, campo)
+            if isinstance(valor, Nodo):
+                pila.append(valor)
+            elif isinstance(valor, list):
+                for k, v in enumerate(valor):
+                    if isinstance(v, Nodo):
+                        pila.append(v)
+                    elif v >= desde:
+                        valor[k] = v + delta
+            elif valor >= desde:
+                setattr(nodo, campo, valor + delta)
+
+
+def _hijos(nodo):
+    for campo in nodo.__slots__:
+        valor = getattr(nodo, campo)
+        if isinstance(valor, Nodo):
+            yield valor
+        elif isinstance(valor, list):
+            yield from (v for v in valor if isinstance(v, Nodo))
+
+
+def aplana(raiz):
+    """El arbol como lista plana (clase, inicio, fin, campos...) con los hijos antes que su
+    padre, para mandarlo por pickle: pickle recursa una vez por nivel y un arbol hondo
+    llega al limite de Python. Un hijo va como -(k + 1), su lugar en la lista; los
+    indices de token quedan como estan"""
+    plano = []
+    lugar = {}  # id del nodo -> su lugar en plano
+    pila = [(raiz, False)]
+    while pila:
+        nodo, listo = pila.pop()
+        if not listo:
+            pila.append((nodo, True))
+            pila.extend((hijo, False) for hijo in _hijos(nodo))
+            continue
+        campos = []
+        for campo in nodo.__slots__:
+            valor = getattr(nodo, campo)
+            if isinstance(valor, Nodo):
+                valor = -lugar[id(valor)] - 1
+            elif isinstance(valor, list):
+                valor = [-lugar[id(v)] - 1 if isinstance(v, Nodo) else v for v in valor]
+            campos.append(valor)
+        lugar[id(nodo)] = len(plano)
+        plano.append((type(nodo), nodo.inicio, nodo.fin, *campos))
+    return plano
+
+
+def arma(plano):
+    """El arbol de una lista de aplana"""
+    nodos = []
+    for clase, inicio, fin, *campos in plano:
+        for k, valor in enumerate(campos):
+            if isinstance(valor, list):
+                campos[k] = [nodos[-v - 1] if v < 0 else v for v in valor]
+            elif valor < 0:
+                campos[k] = nodos[-valor - 1]
+        nodos.append(clase(inicio, fin, *campos))
+    return nodos[-1]
+
+
+# Cada constructor recibe los hijos de su produccion ya aplanados: indices de los tokens
+# que empato y los nodos de adentro. Los no terminales sin constructor no arman nodo y
+# sus hijos pasan directo al de arriba
+
+def _nodos(hijos):
+    return [h for h in hijos if isinstance(h, Nodo)]
+
+
+def _programa(tokens, hijos, inicio, fin):
+    nodos = _nodos(hijos)
+    cuerpo = [n for n in nodos if not isinstance(n, Funcion)]
+    funciones = [n for n in nodos if isinstance(n, Funcion)]
+    return Programa(inicio, fin, hijos[1], cuerpo, funciones)
+
+
+def _funcion(tokens, hijos, inicio, fin):
+    # function id = id ( id, id ... ) { Cont } end_function
+    cierre = 5
+    while isinstance(hijos[cierre], Nodo) or tokens[hijos[cierre]].tipo != Tipo.DELIM_RPAREN:
+        cierre += 1
+    return Funcion(inicio, fin, hijos[1], hijos[3], hijos[5:cierre:2], _nodos(hijos))
+
+
+def _definicion(tokens, hijos, inicio, fin):
+    return Definicion(inicio, fin, hijos[1], hijos[2])
+
+
+def _asignacion(tokens, hijos, inicio, fin):
+    return Asignacion(inicio, fin, hijos[0], hijos[2])
+
+
+def _escritura(tokens, hijos, inicio, fin):
+    return Escritura(inicio, fin, [h for h in hijos[1:-1] if tokens[h].tipo != Tipo.DELIM_COMMA])
+
+
+def _lectura(tokens, hijos, inicio, fin):
+    return Lectura(inicio, fin, hijos[1])
+
+
+def _si(tokens, hijos, inicio, fin):
+    sino = []
+    for k, h in enumerate(hijos):
+        if not isinstance(h, Nodo) and tokens[h].tipo == Tipo.ELSE:
+            hijos, sino = hijos[:k], _nodos(hijos[k:])
+            break
+    nodos = _nodos(hijos)
+    return Si(inicio, fin, nodos[0], nodos[1:], sino)
+
+
+def _mientras(tokens, hijos, inicio, fin):
+    nodos = _nodos(hijos)
+    return Mientras(inicio, fin, nodos[0], nodos[1:])
+
+
+def _repetir(tokens, hijos, inicio, fin):
+    nodos = _nodos(hijos)
+    return Repetir(inicio, fin, nodos[:-1], nodos[-1])
+
+
+def _para(tokens, hijos, inicio, fin):
+    return Para(inicio, fin, hijos[1], hijos[3], hijos[5], hijos[7], _nodos(hijos))
+
+
+def _selecciona(tokens, hijos, inicio, fin):
+    nodos = _nodos(hijos)
+    casos = [n for n in nodos if isinstance(n, Caso)]
+    return Selecciona(inicio, fin, hijos[2], casos, nodos[len(casos):])
+
+
+def _caso(tokens, hijos, inicio, fin):
+    return Caso(inicio, fin, hijos[0], _nodos(hijos))
+
+
+def _expresion(tokens, hijos, inicio, fin):
+    return Expresion(inicio, fin, [h for h in hijos if tokens[h].tipo == Tipo.ID])
+
+
+CONSTRUCTORES = {
+    "Program": _programa,
+    "Func": _funcion,
+    "Defi": _definicion,
+    "Asig": _asignacion,
+    "Asig'": _expresion,
+    "Exprelog": _expresion,
+    "Impr": _escritura,
+    "Lect": _lectura,
+    "Condif": _si,
+    "CycleWhile": _mientras,
+    "CycleRep": _repetir,
+    "CycleFor": _para,
+    "Multselec": _selecciona,
+    "Multselec''": _caso,
+}
@@ -1,14 +1,108 @@
+import json
+import sys
+from time import perf_counter
+from types import FunctionType
+from collections import Counter
+from .tabla_predicciones import INICIAL, PRODUCCIONES, TABLA, EPSILON, PRIMEROS, SIGUIENTES
+from .Arbol import CONSTRUCTORES, Programa, Funcion, Si, Mientras, Repetir, Para, Selecciona, Caso, corre
+from Analizador_Lexico.Procesos.tipos import Tipo
+
+# Lo que reporta el descendente recursivo cuando ningun camino de un no terminal sirve
+_ESPERADO = {
+    "Accon": "DEFINIR, ID, WRITE, READ, IF, FOR, REPEAT, WHILE, or SWITCH",
+    "Condif'": "ELSE or END_IF",
+    "Acblo": "ID, WRITE, READ, IF, FOR, REPEAT, WHILE, or SWITCH",
+    "Acswi": "ID, WRITE, READ, IF, FOR, REPEAT, or WHILE",
+    "Log": "ID, DATA_INT, or DATA_DOUBLE",
+    "Expremath": "DATA_INT, DATA_DOUBLE, or Math Function",
+    "Mathfunc'": "Math Function",
+    "Asig'": "Expression",
+    "Impr'": "Value or ID",
+    "Printmul'": "ID or Value",
+    "Typed": "INT, REAL, BOOL, CHAR, or STRING",
+    "Simb": "Operator",
+    "Valor": "Value",
+    "Valornum": "DATA_INT or DATA_DOUBLE",
+    "Valorlog": "ID or numeric value",
+    "Valorexp": "ID, numeric value, or string",
+    "Valorstring": "ID or DATA_STRING",
+    "Valorbool": "TRUE or FALSE",
+    "Opeasig": "Comparison operator",
+    "Opelog": "Logical operator",
+}
+# Los que dicen otra cosa cuando ya no hay tokens
+_ESPERADO_EOF = {
+    "Accon": "Statement",
+    "Acblo": "Statement",
+    "Acswi": "Statement",
+    "Log": "Expression",
+    "Expremath": "Expression",
+}
+# No terminales con una sola regla: se expanden aunque el token no este en su fila y el
+# error sale del terminal que no empata, como en el descendente recursivo
+_REGLAS = Counter(izq for izq, _ in PRODUCCIONES)
+_UNICA = {izq: k for k, (izq, _) in enumerate(PRODUCCIONES) if _REGLAS[izq] == 1}
+
+MODOS = ("tabla", "descendente", "paralelo")
+# Como se muestran las medidas por produccion al final de analyze()
+FORMATOS_MEDIDA = ("tabla", "json")
+
+# Para recuperarse de errores: las listas de sentencias donde se retoma, con que empieza
+# una sentencia (ID no, aparece en todas las expresiones), los end_* de bloque, lo que cierra
+# el bloque de afuera y, para los encabezados, donde se puede retomar en general
+_LISTAS = frozenset({"Cont'", "Contblo'", "Contswi'"})
+_INICIOS = PRIMEROS["Accon"] - {Tipo.ID}
+_FINES = frozenset({Tipo.END_IF, Tipo.END_WHILE, Tipo.END_FOR})
+_AFUERA = frozenset({Tipo.DELIM_RKEY, Tipo.FUNCTION, Tipo.END_PROCESS, Tipo.END_FUNCTION})
+_SINCRONIZA = _INICIOS | _FINES | _AFUERA | {Tipo.DELIM_LINE, Tipo.ELSE, Tipo.UNTIL, Tipo.DEFAULT}
+_ABRE = frozenset({Tipo.DELIM_LKEY, Tipo.DELIM_LPAREN})
+_CIERRA = frozenset({Tipo.DELIM_RKEY, Tipo.DELIM_RPAREN})
+MAX_ERRORES = 25
+
+# Listas de sentencias del arbol y el no terminal de sus elementos: un elemento se puede
+# volver a analizar solo, empezando la pila con ese no terminal
+_ELEMENTOS = {
+    (Programa, "cuerpo"): "Accon",
+    (Programa, "funciones"): "Func",
+    (Funcion, "cuerpo"): "Accon",
+    (Si, "entonces"): "Accon",
+    (Si, "sino"): "Accon",
+    (Mientras, "cuerpo"): "Acblo",
+    (Repetir, "cuerpo"): "Acblo",
+    (Para, "cuerpo"): "Acblo",
+    (Selecciona, "casos"): "Multselec''",
+    (Selecciona, "defecto"): "Acswi",
+    (Caso, "cuerpo"): "Acswi",
+}
+
+
+def _empieza(simbolo, tipo):
+    # Si simbolo puede empezar con un token de tipo
+    fila = TABLA.get(simbolo)
+    return simbolo == tipo if fila is None else tipo in fila
+
+
 class SyntaxAnalyzer:
-    def __init__(self, tokens):
+    # Con inicio y fin solo se ven los tokens [inicio, fin), los indices siguen siendo los
+    # de la lista completa. Con medir ("tabla" o "json") se mide cada produccion, en el
+    # descendente recursivo o en la tabla
+    def __init__(self, tokens, inicio=0, fin=None, medir=None):
         self.tokens = tokens
-        self.pos = 0
-        self.current = self.tokens[0] if tokens else None
+        self.fin = len(tokens) if fin is None else fin
+        self.pos = inicio
+        self.current = self.tokens[inicio] if inicio < self.fin else None
         self.errors = []
+        self.arbol = None
+        self.medir = medir
+        self.medidas = None
+        self.pila_maxima = None
+        if medir:
+            self._instrumenta()
     
     # Avanza un token
     def advance(self):
         self.pos += 1
-        if self.pos < len(self.tokens):
+        if self.pos < self.fin:
             self.current = self.tokens[self.pos]
         else:
             self.current = None
@@ -35,25 +129,25 @@ class SyntaxAnalyzer:
         return self.ProgramPrime()
     
     def ProgramPrime(self):
-        if self.current and self.current.tipo == "FUNCTION":
+        if self.current and self.current.tipo == Tipo.FUNCTION:
             if not self.Func():
                 return False
             return self.ProgramPrime()
         return True
     
     def Class(self):
-        if not self.match("PROCESS"):
-            return self.error("PROCESS")
-        if not self.match("ID"):
-            return self.error("ID")
-        if not self.match("DELIM_LKEY"):
-            return self.error("DELIM_LKEY")
+        if not self.match(Tipo.PROCESS):
+            return self.error(Tipo.PROCESS)
+        if not self.match(Tipo.ID):
+            return self.error(Tipo.ID)
+        if not self.match(Tipo.DELIM_LKEY):
+            return self.error(Tipo.DELIM_LKEY)
         if not self.Cont():
             return False
-        if not self.match("DELIM_RKEY"):
-            return self.error("DELIM_RKEY")
-        if not self.match("END_PROCESS"):
-            return self.error("END_PROCESS")
+        if not self.match(Tipo.DELIM_RKEY):
+            return self.error(Tipo.DELIM_RKEY)
+        if not self.match(Tipo.END_PROCESS):
+            return self.error(Tipo.END_PROCESS)
         return True
     
     def Cont(self):
@@ -62,7 +156,7 @@ class SyntaxAnalyzer:
         return self.ContPrime()
     
     def ContPrime(self):
-        if self.current and self.current.tipo in ["DEFINIR", "ID", "WRITE", "READ", "IF", "FOR", "REPEAT", "WHILE", "SWITCH"]:
+        if self.current and self.current.tipo in PRIMEROS["Accon"]:
             if not self.Accon():
                 return False
             return self.ContPrime()
@@ -73,201 +167,201 @@ class SyntaxAnalyzer:
             return self.error("Statement")
         
         tipo = self.current.tipo
-        if tipo == "DEFINIR":
+        if tipo == Tipo.DEFINIR:
             return self.Defi()
-        elif tipo == "ID":
+        elif tipo == Tipo.ID:
             return self.Asig()
-        elif tipo == "WRITE":
+        elif tipo == Tipo.WRITE:
             return self.Impr()
-        elif tipo == "READ":
+        elif tipo == Tipo.READ:
             return self.Lect()
-        elif tipo == "IF":
+        elif tipo == Tipo.IF:
             return self.Condif()
-        elif tipo == "FOR":
+        elif tipo == Tipo.FOR:
             return self.CycleFor()
-        elif tipo == "REPEAT":
+        elif tipo == Tipo.REPEAT:
             return self.CycleRep()
-        elif tipo == "WHILE":
+        elif tipo == Tipo.WHILE:
             return self.CycleWhile()
-        elif tipo == "SWITCH":
+        elif tipo == Tipo.SWITCH:
             return self.Multselec()
         else:
             return self.error("DEFINIR, ID, WRITE, READ, IF, FOR, REPEAT, WHILE, or SWITCH")
     
     def Condif(self):
-        if not self.match("IF"):
-            return self.error("IF")
-        if not self.match("DELIM_LPAREN"):
-            return self.error("DELIM_LPAREN")
+        if not self.match(Tipo.IF):
+            return self.error(Tipo.IF)
+        if not self.match(Tipo.DELIM_LPAREN):
+            return self.error(Tipo.DELIM_LPAREN)
         if not self.Exprelog():
             return False
-        if not self.match("DELIM_RPAREN"):
-            return self.error("DELIM_RPAREN")
-        if not self.match("THEN"):
-            return self.error("THEN")
-        if not self.match("DELIM_LKEY"):
-            return self.error("DELIM_LKEY")
+        if not self.match(Tipo.DELIM_RPAREN):
+            return self.error(Tipo.DELIM_RPAREN)
+        if not self.match(Tipo.THEN):
+            return self.error(Tipo.THEN)
+        if not self.match(Tipo.DELIM_LKEY):
+            return self.error(Tipo.DELIM_LKEY)
         if not self.Cont():
             return False
-        if not self.match("DELIM_RKEY"):
-            return self.error("DELIM_RKEY")
+        if not self.match(Tipo.DELIM_RKEY):
+            return self.error(Tipo.DELIM_RKEY)
         return self.CondifPrime()
     
     def CondifPrime(self):
-        if self.current and self.current.tipo == "ELSE":
+        if self.current and self.current.tipo == Tipo.ELSE:
             self.advance()
-            if not self.match("DELIM_LKEY"):
-                return self.error("DELIM_LKEY")
+            if not self.match(Tipo.DELIM_LKEY):
+                return self.error(Tipo.DELIM_LKEY)
             if not self.Cont():
                 return False
-            if not self.match("DELIM_RKEY"):
-                return self.error("DELIM_RKEY")
-            if not self.match("END_IF"):
-                return self.error("END_IF")
+            if not self.match(Tipo.DELIM_RKEY):
+                return self.error(Tipo.DELIM_RKEY)
+            if not self.match(Tipo.END_IF):
+                return self.error(Tipo.END_IF)
             return True
-        elif self.current and self.current.tipo == "END_IF":
+        elif self.current and self.current.tipo == Tipo.END_IF:
             self.advance()
             return True
         else:
             return self.error("ELSE or END_IF")
     
     def Func(self):
-        if not self.match("FUNCTION"):
-            return self.error("FUNCTION")
-        if not self.match("ID"):
-            return self.error("ID")
-        if not self.match("EQUAL"):
-            return self.error("EQUAL")
-        if not self.match("ID"):
-            return self.error("ID")
-        if not self.match("DELIM_LPAREN"):
-            return self.error("DELIM_LPAREN")
+        if not self.match(Tipo.FUNCTION):
+            return self.error(Tipo.FUNCTION)
+        if not self.match(Tipo.ID):
+            return self.error(Tipo.ID)
+        if not self.match(Tipo.EQUAL):
+            return self.error(Tipo.EQUAL)
+        if not self.match(Tipo.ID):
+            return self.error(Tipo.ID)
+        if not self.match(Tipo.DELIM_LPAREN):
+            return self.error(Tipo.DELIM_LPAREN)
         if not self.Varmul():
             return False
-        if not self.match("DELIM_RPAREN"):
-            return self.error("DELIM_RPAREN")
-        if not self.match("DELIM_LKEY"):
-            return self.error("DELIM_LKEY")
+        if not self.match(Tipo.DELIM_RPAREN):
+            return self.error(Tipo.DELIM_RPAREN)
+        if not self.match(Tipo.DELIM_LKEY):
+            return self.error(Tipo.DELIM_LKEY)
         if not self.Cont():
             return False
-        if not self.match("DELIM_RKEY"):
-            return self.error("DELIM_RKEY")
-        if not self.match("END_FUNCTION"):
-            return self.error("END_FUNCTION")
+        if not self.match(Tipo.DELIM_RKEY):
+            return self.error(Tipo.DELIM_RKEY)
+        if not self.match(Tipo.END_FUNCTION):
+            return self.error(Tipo.END_FUNCTION)
         return True
     
     def CycleWhile(self):
-        if not self.match("WHILE"):
-            return self.error("WHILE")
-        if not self.match("DELIM_LPAREN"):
-            return self.error("DELIM_LPAREN")
+        if not self.match(Tipo.WHILE):
+            return self.error(Tipo.WHILE)
+        if not self.match(Tipo.DELIM_LPAREN):
+            return self.error(Tipo.DELIM_LPAREN)
         if not self.Exprelog():
             return False
-        if not self.match("DELIM_RPAREN"):
-            return self.error("DELIM_RPAREN")
-        if not self.match("DO"):
-            return self.error("DO")
-        if not self.match("DELIM_LKEY"):
-            return self.error("DELIM_LKEY")
+        if not self.match(Tipo.DELIM_RPAREN):
+            return self.error(Tipo.DELIM_RPAREN)
+        if not self.match(Tipo.DO):
+            return self.error(Tipo.DO)
+        if not self.match(Tipo.DELIM_LKEY):
+            return self.error(Tipo.DELIM_LKEY)
         if not self.Contblo():
             return False
-        if not self.match("DELIM_RKEY"):
-            return self.error("DELIM_RKEY")
-        if not self.match("END_WHILE"):
-            return self.error("END_WHILE")
+        if not self.match(Tipo.DELIM_RKEY):
+            return self.error(Tipo.DELIM_RKEY)
+        if not self.match(Tipo.END_WHILE):
+            return self.error(Tipo.END_WHILE)
         return True
     
     def CycleRep(self):
-        if not self.match("REPEAT"):
-            return self.error("REPEAT")
-        if not self.match("DELIM_LKEY"):
-            return self.error("DELIM_LKEY")
+        if not self.match(Tipo.REPEAT):
+            return self.error(Tipo.REPEAT)
+        if not self.match(Tipo.DELIM_LKEY):
+            return self.error(Tipo.DELIM_LKEY)
         if not self.Contblo():
             return False
-        if not self.match("DELIM_RKEY"):
-            return self.error("DELIM_RKEY")
-        if not self.match("UNTIL"):
-            return self.error("UNTIL")
-        if not self.match("DELIM_LPAREN"):
-            return self.error("DELIM_LPAREN")
+        if not self.match(Tipo.DELIM_RKEY):
+            return self.error(Tipo.DELIM_RKEY)
+        if not self.match(Tipo.UNTIL):
+            return self.error(Tipo.UNTIL)
+        if not self.match(Tipo.DELIM_LPAREN):
+            return self.error(Tipo.DELIM_LPAREN)
         if not self.Exprelog():
             return False
-        if not self.match("DELIM_RPAREN"):
-            return self.error("DELIM_RPAREN")
+        if not self.match(Tipo.DELIM_RPAREN):
+            return self.error(Tipo.DELIM_RPAREN)
         return True
     
     def CycleFor(self):
-        if not self.match("FOR"):
-            return self.error("FOR")
-        if not self.match("ID"):
-            return self.error("ID")
-        if not self.match("EQUAL"):
-            return self.error("EQUAL")
-        if not self.match("DATA_INT"):
-            return self.error("DATA_INT")
-        if not self.match("THROUGH"):
-            return self.error("THROUGH")
-        if not self.match("DATA_INT"):
-            return self.error("DATA_INT")
-        if not self.match("RATE"):
-            return self.error("RATE")
-        if not self.match("DATA_INT"):
-            return self.error("DATA_INT")
-        if not self.match("DO_FOR"):
-            return self.error("DO_FOR")
-        if not self.match("DELIM_LKEY"):
-            return self.error("DELIM_LKEY")
+        if not self.match(Tipo.FOR):
+            return self.error(Tipo.FOR)
+        if not self.match(Tipo.ID):
+            return self.error(Tipo.ID)
+        if not self.match(Tipo.EQUAL):
+            return self.error(Tipo.EQUAL)
+        if not self.match(Tipo.DATA_INT):
+            return self.error(Tipo.DATA_INT)
+        if not self.match(Tipo.THROUGH):
+            return self.error(Tipo.THROUGH)
+        if not self.match(Tipo.DATA_INT):
+            return self.error(Tipo.DATA_INT)
+        if not self.match(Tipo.RATE):
+            return self.error(Tipo.RATE)
+        if not self.match(Tipo.DATA_INT):
+            return self.error(Tipo.DATA_INT)
+        if not self.match(Tipo.DO_FOR):
+            return self.error(Tipo.DO_FOR)
+        if not self.match(Tipo.DELIM_LKEY):
+            return self.error(Tipo.DELIM_LKEY)
         if not self.Contblo():
             return False
-        if not self.match("DELIM_RKEY"):
-            return self.error("DELIM_RKEY")
-        if not self.match("END_FOR"):
-            return self.error("END_FOR")
+        if not self.match(Tipo.DELIM_RKEY):
+            return self.error(Tipo.DELIM_RKEY)
+        if not self.match(Tipo.END_FOR):
+            return self.error(Tipo.END_FOR)
         return True
     
     def Multselec(self):
-        if not self.match("SWITCH"):
-            return self.error("SWITCH")
-        if not self.match("DELIM_LPAREN"):
-            return self.error("DELIM_LPAREN")
-        if not self.match("ID"):
-            return self.error("ID")
-        if not self.match("DELIM_RPAREN"):
-            return self.error("DELIM_RPAREN")
-        if not self.match("SELECT"):
-            return self.error("SELECT")
+        if not self.match(Tipo.SWITCH):
+            return self.error(Tipo.SWITCH)
+        if not self.match(Tipo.DELIM_LPAREN):
+            return self.error(Tipo.DELIM_LPAREN)
+        if not self.match(Tipo.ID):
+            return self.error(Tipo.ID)
+        if not self.match(Tipo.DELIM_RPAREN):
+            return self.error(Tipo.DELIM_RPAREN)
+        if not self.match(Tipo.SELECT):
+            return self.error(Tipo.SELECT)
         if not self.MultselecPrime():
             return False
-        if not self.match("DEFAULT"):
-            return self.error("DEFAULT")
-        if not self.match("DELIM_ENTER"):
-            return self.error("DELIM_ENTER")
-        if not self.match("DELIM_LKEY"):
-            return self.error("DELIM_LKEY")
+        if not self.match(Tipo.DEFAULT):
+            return self.error(Tipo.DEFAULT)
+        if not self.match(Tipo.DELIM_ENTER):
+            return self.error(Tipo.DELIM_ENTER)
+        if not self.match(Tipo.DELIM_LKEY):
+            return self.error(Tipo.DELIM_LKEY)
         if not self.Contswi():
             return False
-        if not self.match("DELIM_RKEY"):
-            return self.error("DELIM_RKEY")
+        if not self.match(Tipo.DELIM_RKEY):
+            return self.error(Tipo.DELIM_RKEY)
         return True
     
     def MultselecPrime(self):
-        if self.current and self.current.tipo == "DATA_INT":
+        if self.current and self.current.tipo == Tipo.DATA_INT:
             if not self.MultselecDoublePrime():
                 return False
             return self.MultselecPrime()
         return True
     
     def MultselecDoublePrime(self):
-        if not self.match("DATA_INT"):
-            return self.error("DATA_INT")
-        if not self.match("DELIM_ENTER"):
-            return self.error("DELIM_ENTER")
-        if not self.match("DELIM_LKEY"):
-            return self.error("DELIM_LKEY")
+        if not self.match(Tipo.DATA_INT):
+            return self.error(Tipo.DATA_INT)
+        if not self.match(Tipo.DELIM_ENTER):
+            return self.error(Tipo.DELIM_ENTER)
+        if not self.match(Tipo.DELIM_LKEY):
+            return self.error(Tipo.DELIM_LKEY)
         if not self.Contswi():
             return False
-        if not self.match("DELIM_RKEY"):
-            return self.error("DELIM_RKEY")
+        if not self.match(Tipo.DELIM_RKEY):
+            return self.error(Tipo.DELIM_RKEY)
         return True
     
     def Contblo(self):
@@ -276,7 +370,7 @@ class SyntaxAnalyzer:
         return self.ContbloPrime()
     
     def ContbloPrime(self):
-        if self.current and self.current.tipo in ["ID", "WRITE", "READ", "IF", "FOR", "REPEAT", "WHILE", "SWITCH"]:
+        if self.current and self.current.tipo in PRIMEROS["Acblo"]:
             if not self.Acblo():
                 return False
             return self.ContbloPrime()
@@ -287,21 +381,21 @@ class SyntaxAnalyzer:
             return self.error("Statement")
         
         tipo = self.current.tipo
-        if tipo == "ID":
+        if tipo == Tipo.ID:
             return self.Asig()
-        elif tipo == "WRITE":
+        elif tipo == Tipo.WRITE:
             return self.Impr()
-        elif tipo == "READ":
+        elif tipo == Tipo.READ:
             return self.Lect()
-        elif tipo == "IF":
+        elif tipo == Tipo.IF:
             return self.Condif()
-        elif tipo == "FOR":
+        elif tipo == Tipo.FOR:
             return self.CycleFor()
-        elif tipo == "REPEAT":
+        elif tipo == Tipo.REPEAT:
             return self.CycleRep()
-        elif tipo == "WHILE":
+        elif tipo == Tipo.WHILE:
             return self.CycleWhile()
-        elif tipo == "SWITCH":
+        elif tipo == Tipo.SWITCH:
             return self.Multselec()
         else:
             return self.error("ID, WRITE, READ, IF, FOR, REPEAT, WHILE, or SWITCH")
@@ -312,7 +406,7 @@ class SyntaxAnalyzer:
         return self.ContswiPrime()
     
     def ContswiPrime(self):
-        if self.current and self.current.tipo in ["ID", "WRITE", "READ", "IF", "FOR", "REPEAT", "WHILE"]:
+        if self.current and self.current.tipo in PRIMEROS["Acswi"]:
             if not self.Acswi():
                 return False
             return self.ContswiPrime()
@@ -323,19 +417,19 @@ class SyntaxAnalyzer:
             return self.error("Statement")
         
         tipo = self.current.tipo
-        if tipo == "ID":
+        if tipo == Tipo.ID:
             return self.Asig()
-        elif tipo == "WRITE":
+        elif tipo == Tipo.WRITE:
             return self.Impr()
-        elif tipo == "READ":
+        elif tipo == Tipo.READ:
             return self.Lect()
-        elif tipo == "IF":
+        elif tipo == Tipo.IF:
             return self.Condif()
-        elif tipo == "FOR":
+        elif tipo == Tipo.FOR:
             return self.CycleFor()
-        elif tipo == "REPEAT":
+        elif tipo == Tipo.REPEAT:
             return self.CycleRep()
-        elif tipo == "WHILE":
+        elif tipo == Tipo.WHILE:
             return self.CycleWhile()
         else:
             return self.error("ID, WRITE, READ, IF, FOR, REPEAT, or WHILE")
@@ -346,7 +440,7 @@ class SyntaxAnalyzer:
         return self.ExprelogPrime()
     
     def ExprelogPrime(self):
-        if self.current and self.current.tipo in ["AND", "OR", "NOT"]:
+        if self.current and self.current.tipo in PRIMEROS["Opelog"]:
             if not self.Opelog():
                 return False
             if not self.Log():
@@ -358,12 +452,12 @@ class SyntaxAnalyzer:
         if not self.current:
             return self.error("Expression")
         
-        if self.current.tipo == "ID":
+        if self.current.tipo == Tipo.ID:
             self.advance()
             if not self.Opeasig():
                 return False
             return self.Valorlog()
-        elif self.current.tipo in ["DATA_INT", "DATA_DOUBLE"]:
+        elif self.current.tipo in PRIMEROS["Valornum"]:
             if not self.Valornum():
                 return False
             if not self.Opeasig():
@@ -376,17 +470,17 @@ class SyntaxAnalyzer:
         if not self.current:
             return self.error("Expression")
         
-        if self.current.tipo in ["DATA_INT", "DATA_DOUBLE"]:
+        if self.current.tipo in PRIMEROS["Valornum"]:
             if not self.Valornum():
                 return False
             return self.ExpremathPrime()
-        elif self.current.tipo in ["FUN_SQRT", "FUN_ABS", "FUN_LN", "FUN_EXP", "FUN_SEN", "FUN_COS", "FUN_ATAN", "FUN_TRUNC", "FUN_ROUND", "FUN_RAND"]:
+        elif self.current.tipo in PRIMEROS["Mathfunc'"]:
             return self.Mathfunc()
         else:
             return self.error("DATA_INT, DATA_DOUBLE, or Math Function")
     
     def ExpremathPrime(self):
-        if self.current and self.current.tipo in ["PLUS", "MINUS", "MULT", "DIV", "EXP", "MODULO"]:
+        if self.current and self.current.tipo in PRIMEROS["Simb"]:
             if not self.Simb():
                 return False
             return self.Valorlog()
@@ -395,57 +489,57 @@ class SyntaxAnalyzer:
     def Mathfunc(self):
         if not self.MathfuncPrime():
             return False
-        if not self.match("DELIM_LPAREN"):
-            return self.error("DELIM_LPAREN")
-        if not self.match("ID"):
-            return self.error("ID")
-        if not self.match("DELIM_RPAREN"):
-            return self.error("DELIM_RPAREN")
+        if not self.match(Tipo.DELIM_LPAREN):
+            return self.error(Tipo.DELIM_LPAREN)
+        if not self.match(Tipo.ID):
+            return self.error(Tipo.ID)
+        if not self.match(Tipo.DELIM_RPAREN):
+            return self.error(Tipo.DELIM_RPAREN)
         return True
     
     def MathfuncPrime(self):
-        if self.current and self.current.tipo in ["FUN_SQRT", "FUN_ABS", "FUN_LN", "FUN_EXP", "FUN_SEN", "FUN_COS", "FUN_ATAN", "FUN_TRUNC", "FUN_ROUND", "FUN_RAND"]:
+        if self.current and self.current.tipo in PRIMEROS["Mathfunc'"]:
             self.advance()
             return True
         return self.error("Math Function")
     
     def Exprestring(self):
-        if not self.match("DATA_STRING"):
-            return self.error("DATA_STRING")
+        if not self.match(Tipo.DATA_STRING):
+            return self.error(Tipo.DATA_STRING)
         return self.ExprestringPrime()
     
     def ExprestringPrime(self):
-        if self.current and self.current.tipo == "PLUS":
+        if self.current and self.current.tipo == Tipo.PLUS:
             self.advance()
             return self.Valorstring()
         return True
     
     def Expression(self):
-        if not self.match("ID"):
-            return self.error("ID")
+        if not self.match(Tipo.ID):
+            return self.error(Tipo.ID)
         return self.ExpressionPrime()
     
     def ExpressionPrime(self):
         if not self.current:
             return True
         
-        if self.current.tipo == "DELIM_LPAREN":
+        if self.current.tipo == Tipo.DELIM_LPAREN:
             return self.Usfun()
-        elif self.current.tipo in ["PLUS", "MINUS", "MULT", "DIV", "EXP", "MODULO"]:
+        elif self.current.tipo in PRIMEROS["Simb"]:
             if not self.Simb():
                 return False
             return self.Valorexp()
         return True
     
     def Asig(self):
-        if not self.match("ID"):
-            return self.error("ID")
-        if not self.match("EQUAL"):
-            return self.error("EQUAL")
+        if not self.match(Tipo.ID):
+            return self.error(Tipo.ID)
+        if not self.match(Tipo.EQUAL):
+            return self.error(Tipo.EQUAL)
         if not self.AsigPrime():
             return False
-        if not self.match("DELIM_LINE"):
-            return self.error("DELIM_LINE")
+        if not self.match(Tipo.DELIM_LINE):
+            return self.error(Tipo.DELIM_LINE)
         return True
     
     def AsigPrime(self):
@@ -453,42 +547,42 @@ class SyntaxAnalyzer:
             return self.error("Expression")
         
         tipo = self.current.tipo
-        if tipo in ["DATA_INT", "DATA_DOUBLE"] or tipo in ["FUN_SQRT", "FUN_ABS", "FUN_LN", "FUN_EXP", "FUN_SEN", "FUN_COS", "FUN_ATAN", "FUN_TRUNC", "FUN_ROUND", "FUN_RAND"]:
+        if tipo in PRIMEROS["Expremath"]:
             return self.Expremath()
-        elif tipo == "DATA_STRING":
+        elif tipo == Tipo.DATA_STRING:
             return self.Exprestring()
-        elif tipo in ["TRUE", "FALSE"]:
+        elif tipo in PRIMEROS["Valorbool"]:
             return self.Valorbool()
-        elif tipo == "ID":
+        elif tipo == Tipo.ID:
             return self.Expression()
         else:
             return self.error("Expression")
     
     def Impr(self):
-        if not self.match("WRITE"):
-            return self.error("WRITE")
+        if not self.match(Tipo.WRITE):
+            return self.error(Tipo.WRITE)
         if not self.ImprPrime():
             return False
-        if not self.match("DELIM_LINE"):
-            return self.error("DELIM_LINE")
+        if not self.match(Tipo.DELIM_LINE):
+            return self.error(Tipo.DELIM_LINE)
         return True
     
     def ImprPrime(self):
         if not self.current:
             return self.error("Value or ID")
         
-        if self.current.tipo in ["DATA_INT", "DATA_DOUBLE", "DATA_STRING", "TRUE", "FALSE"]:
+        if self.current.tipo in PRIMEROS["Valor"]:
             if not self.Valor():
                 return False
             return self.Printmul()
-        elif self.current.tipo == "ID":
+        elif self.current.tipo == Tipo.ID:
             self.advance()
             return self.Printmul()
         else:
             return self.error("Value or ID")
     
     def Printmul(self):
-        if self.current and self.current.tipo == "DELIM_COMMA":
+        if self.current and self.current.tipo == Tipo.DELIM_COMMA:
             self.advance()
             if not self.PrintmulPrime():
                 return False
@@ -499,77 +593,77 @@ class SyntaxAnalyzer:
         if not self.current:
             return self.error("ID or Value")
         
-        if self.current.tipo == "ID":
+        if self.current.tipo == Tipo.ID:
             self.advance()
             return True
-        elif self.current.tipo in ["DATA_INT", "DATA_DOUBLE", "DATA_STRING", "TRUE", "FALSE"]:
+        elif self.current.tipo in PRIMEROS["Valor"]:
             return self.Valor()
         else:
             return self.error("ID or Value")
     
     def Lect(self):
-        if not self.match("READ"):
-            return self.error("READ")
-        if not self.match("ID"):
-            return self.error("ID")
-        if not self.match("DELIM_LINE"):
-            return self.error("DELIM_LINE")
+        if not self.match(Tipo.READ):
+            return self.error(Tipo.READ)
+        if not self.match(Tipo.ID):
+            return self.error(Tipo.ID)
+        if not self.match(Tipo.DELIM_LINE):
+            return self.error(Tipo.DELIM_LINE)
         return True
     
     def Defi(self):
-        if not self.match("DEFINIR"):
-            return self.error("DEFINIR")
-        if not self.match("ID"):
-            return self.error("ID")
+        if not self.match(Tipo.DEFINIR):
+            return self.error(Tipo.DEFINIR)
+        if not self.match(Tipo.ID):
+            return self.error(Tipo.ID)
         if not self.Typed():
             return False
-        if not self.match("DELIM_LINE"):
-            return self.error("DELIM_LINE")
+        if not self.match(Tipo.DELIM_LINE):
+            return self.error(Tipo.DELIM_LINE)
         return True
     
     def Usfun(self):
-        if self.current and self.current.tipo == "DELIM_LPAREN":
+        if self.current and self.current.tipo == Tipo.DELIM_LPAREN:
             self.advance()
             if not self.Varmul():
                 return False
-            if not self.match("DELIM_RPAREN"):
-                return self.error("DELIM_RPAREN")
+            if not self.match(Tipo.DELIM_RPAREN):
+                return self.error(Tipo.DELIM_RPAREN)
             return True
         return True
     
     def Varmul(self):
-        if not self.match("ID"):
-            return self.error("ID")
+        if not self.match(Tipo.ID):
+            return self.error(Tipo.ID)
         return self.VarmulPrime()
     
     def VarmulPrime(self):
-        if self.current and self.current.tipo == "DELIM_COMMA":
+        if self.current and self.current.tipo == Tipo.DELIM_COMMA:
             self.advance()
-            if not self.match("ID"):
-                return self.error("ID")
+            if not self.match(Tipo.ID):
+                return self.error(Tipo.ID)
             return self.VarmulPrime()
         return True
     
     def Typed(self):
-        if self.current and self.current.tipo in ["INT", "REAL", "BOOL", "CHAR", "STRING"]:
+        if self.current and self.current.tipo in PRIMEROS["Typed"]:
             self.advance()
             return True
         return self.error("INT, REAL, BOOL, CHAR, or STRING")
     
     def Simb(self):
-        if self.current and self.current.tipo in ["PLUS", "MINUS", "MULT", "DIV", "EXP", "MODULO"]:
+        if self.current and self.current.tipo in PRIMEROS["Simb"]:
             self.advance()
             return True
         return self.error("Operator")
     
     def Valor(self):
-        if self.current and self.current.tipo in ["DATA_INT", "DATA_DOUBLE", "DATA_STRING", "TRUE", "FALSE"]:
+        if self.current and self.current.tipo in PRIMEROS["Valor"]:
             self.advance()
             return True
         return self.error("Value")
     
     def Valornum(self):
-        if self.current and self.current.tipo in ["DATA_INT", "DATA_DOUBLE"]:
+        if self.current and self.current.tipo in PRIMEROS["Valornum"]:
             self.advance()
             return True
         return self.error("DATA_INT or DATA_DOUBLE")
@@ -578,10 +672,10 @@ class SyntaxAnalyzer:
         if not self.current:
             return self.error("ID or numeric value")
         
-        if self.current.tipo == "ID":
+        if self.current.tipo == Tipo.ID:
             self.advance()
             return True
-        elif self.current.tipo in ["DATA_INT", "DATA_DOUBLE"]:
+        elif self.current.tipo in PRIMEROS["Valornum"]:
             return self.Valornum()
         else:
             return self.error("ID or numeric value")
@@ -590,43 +684,299 @@ class SyntaxAnalyzer:
         if not self.current:
             return self.error("ID, numeric value, or string")
         
-        if self.current.tipo == "ID":
+        if self.current.tipo == Tipo.ID:
             self.advance()
             return True
-        elif self.current.tipo in ["DATA_INT", "DATA_DOUBLE"]:
+        elif self.current.tipo in PRIMEROS["Valornum"]:
             return self.Valornum()
-        elif self.current.tipo == "DATA_STRING":
+        elif self.current.tipo == Tipo.DATA_STRING:
             self.advance()
             return True
         else:
             return self.error("ID, numeric value, or string")
     
     def Valorstring(self):
-        if self.current and self.current.tipo in ["ID", "DATA_STRING"]:
+        if self.current and self.current.tipo in PRIMEROS["Valorstring"]:
             self.advance()
             return True
         return self.error("ID or DATA_STRING")
     
     def Valorbool(self):
-        if self.current and self.current.tipo in ["TRUE", "FALSE"]:
+        if self.current and self.current.tipo in PRIMEROS["Valorbool"]:
             self.advance()
             return True
         return self.error("TRUE or FALSE")
     
     def Opeasig(self):
-        if self.current and self.current.tipo in ["LESS", "MORE", "SAME", "LESS_SAME", "MORE_SAME", "DIFF"]:
+        if self.current and self.current.tipo in PRIMEROS["Opeasig"]:
             self.advance()
             return True
         return self.error("Comparison operator")
     
     def Opelog(self):
-        if self.current and self.current.tipo in ["AND", "OR", "NOT"]:
+        if self.current and self.current.tipo in PRIMEROS["Opelog"]:
             self.advance()
             return True
         return self.error("Logical operator")
     
-    def analyze(self):
-        success = self.Program()
+    # Parser predictivo con pila explicita, la pila solo crece con el anidamiento.
+    # Con arbol=True deja en self.arbol el Programa armado con los CONSTRUCTORES.
+    # Con recupera=True no para en el primer error: se brinca la sentencia donde cayo
+    # (modo panico) y sigue, hasta juntar maximo errores. inicial es el no terminal con el
+    # que empieza la pila. Con medir se mide cada no terminal como si fuera su funcion
+    def Predictivo(self, arbol=False, recupera=False, maximo=MAX_ERRORES, inicial=INICIAL):
+        pila = [inicial]
+        valores = []  # indices de tokens y nodos que esperan a su padre
+        abiertos = []  # (len(valores), pos) de cada nodo que se esta armando
+        guardada = None  # (pos, pila) de la ultima lista de sentencias cerrada a fuerzas
+        self.recuperado = -1
+        medidas = None
+        if self.medir:
+            medidas = self.medidas = {}
+            expansiones = []  # las que se estan midiendo, ver _abre_medida
+            self._activas = Counter()
+            self.pila_maxima = 0
+        while pila:
+            if medidas is not None:
+                self._cierra_medidas(expansiones, len(pila))
+            simbolo = pila.pop()
+            if type(simbolo) is FunctionType:
+                if arbol:
+                    base, inicio = abiertos.pop()
+                    hijos = valores[base:]
+                    del valores[base:]
+                    valores.append(simbolo(self.tokens, hijos, inicio, self.pos))
+                continue
+            tipo = self.current.tipo if self.current else Tipo.EOF
+            fila = TABLA.get(simbolo)
+            if fila is None:
+                if self.match(simbolo):
+                    if arbol:
+                        valores.append(self.pos - 1)
+                    continue
+                esperado = simbolo
+            else:
+                if medidas is not None:
+                    self._abre_medida(expansiones, simbolo, len(pila))
+                k = fila.get(tipo)
+                if k is None:
+                    if simbolo in EPSILON:
+                        if recupera and simbolo in _LISTAS and tipo not in SIGUIENTES[simbolo]:
+                            # Con este token ya no hay forma de seguir, si el error sale mas
+                            # adelante se retoma desde aqui
+                            guardada = (self.pos, pila + [simbolo])
+                        continue
+                    k = _UNICA.get(simbolo)
+                if k is not None:
+                    if arbol and simbolo in CONSTRUCTORES:
+                        # El constructor queda abajo del lado derecho y arma el nodo al salir
+                        pila.append(CONSTRUCTORES[simbolo])
+                        abiertos.append((len(valores), self.pos))
+                    pila.extend(reversed(PRODUCCIONES[k][1]))
+                    continue
+                esperado = _ESPERADO[simbolo]
+                if self.current is None:
+                    esperado = _ESPERADO_EOF.get(simbolo, esperado)
+
+            if not self._falla(esperado, recupera, maximo):
+                if medidas is not None:
+                    self._cierra_medidas(expansiones, 0)
+                return False
+            arbol = False
+            pila = self._recupera(pila, simbolo, guardada)
+        if medidas is not None:
+            self._cierra_medidas(expansiones, 0)
+        if self.errors:
+            if self.current is not None:
+                self.error("EOF")
+            return False
+        if arbol:
+            self.arbol = valores[0]
+        return True
+    
+    def _falla(self, esperado, recupera, maximo):
+        # Anota el error y dice si se puede seguir. Los que caen en el mismo token que el
+        # anterior ya son consecuencia de ese y no se anotan
+        if not recupera:
+            return self.error(esperado)
+        if self.pos != self.recuperado:
+            if len(self.errors) >= maximo:
+                self.errors.append(f"Se llego al maximo de {maximo} errores, ya no se revisa lo demas")
+                return False
+            self.error(esperado)
+        return self.current is not None
+    
+    def _recupera(self, pila, simbolo, guardada):
+        # Regresa la pila con la que se sigue despues de un error en simbolo
+        repetido = self.pos == self.recuperado
+        self.recuperado = self.pos
+        tipo = self.current.tipo
+        if simbolo not in TABLA and not repetido and tipo in _SINCRONIZA and self._acepta(pila, tipo):
+            # Solo falta el terminal antes de algo que cierra o empieza: se hace como si estuviera
+            return pila
+        if guardada is not None and guardada[0] == self.pos:
+            nueva = list(guardada[1])
+        else:
+            i = len(pila)
+            while i and pila[i - 1] not in _LISTAS:
+                i -= 1
+            nueva = pila[:i]
+        if repetido:
+            # Ya se intento retomar en este token y no sirvio, se tira
+            self.advance()
+        if nueva:
+            # El error cayo en una sentencia: se brinca completa y se sigue con la lista
+            self._salta_sentencia()
+            return nueva
+        # Encabezados del proceso o de una funcion: se salta hasta algo que sirva ahi y se
+        # sacan de la pila los simbolos que no pueden seguir con ese token
+        if simbolo in TABLA:
+            self._salta(PRIMEROS[simbolo] | SIGUIENTES[simbolo] | _SINCRONIZA)
+            if self.current is not None and self.current.tipo in PRIMEROS[simbolo]:
+                pila.append(simbolo)
+                return pila
+        else:
+            self._salta(_SINCRONIZA | {simbolo})
+            if self.match(simbolo):
+                return pila
+        if self.current is not None:
+            for i in range(len(pila) - 1, -1, -1):
+                if type(pila[i]) is not FunctionType and _empieza(pila[i], self.current.tipo):
+                    del pila[i + 1:]
+                    break
+        return pila
+    
+    def _acepta(self, pila, tipo):
+        # Si lo que queda arriba de la pila puede empezar con tipo
+        for simbolo in reversed(pila):
+            if type(simbolo) is not FunctionType:
+                return _empieza(simbolo, tipo)
+        return False
+    
+    def _salta(self, alto):
+        # Avanza hasta un token de alto; lo que abre con { o ( se salta completo
+        profundidad = 0
+        while self.current:
+            tipo = self.current.tipo
+            if profundidad == 0 and tipo in alto:
+                return
+            if tipo in _ABRE:
+                profundidad += 1
+            elif tipo in _CIERRA and profundidad:
+                profundidad -= 1
+            self.advance()
+    
+    def _salta_sentencia(self):
+        # Se brinca lo que queda de la sentencia: hasta despues de su ; o del end_* de su
+        # bloque, o hasta donde empieza otra sentencia o cierra el bloque de afuera
+        profundidad = 0
+        bloque = False
+        while self.current:
+            tipo = self.current.tipo
+            if profundidad == 0:
+                if tipo == Tipo.DELIM_LINE:
+                    self.advance()
+                    return
+                if tipo in _FINES:
+                    if bloque:
+                        self.advance()
+                    return
+                if tipo in _INICIOS or tipo in _AFUERA or (bloque and tipo == Tipo.ID):
+                    return
+            if tipo in _ABRE:
+                profundidad += 1
+            elif tipo in _CIERRA and profundidad:
+                profundidad -= 1
+                bloque = bloque or (profundidad == 0 and tipo == Tipo.DELIM_RKEY)
+            self.advance()
+    
+    # Cambia cada produccion de esta instancia por una version que la mide. La clase no se
+    # toca, asi que sin medir no cuesta nada
+    def _instrumenta(self):
+        self.medidas = {}
+        self.profundidad = 0
+        for nombre in _METODOS:
+            setattr(self, nombre, self._mide(nombre, getattr(self, nombre)))
+    
+    def _mide(self, nombre, metodo):
+        # Llamadas, tokens que consumio, tiempo inclusivo y la profundidad mas grande (en
+        # producciones anidadas) a la que entro. Si se llama a si misma solo cuenta la de
+        # afuera para el tiempo y los tokens, si no saldrian dobles
+        medida = self.medidas[nombre] = {"llamadas": 0, "tokens": 0, "tiempo": 0.0, "profundidad": 0}
+        activas = [0]
+        
+        def medida_de():
+            medida["llamadas"] += 1
+            self.profundidad += 1
+            if self.profundidad > medida["profundidad"]:
+                medida["profundidad"] = self.profundidad
+            activas[0] += 1
+            pos, inicio = self.pos, perf_counter()
+            try:
+                return metodo()
+            finally:
+                activas[0] -= 1
+                self.profundidad -= 1
+                if not activas[0]:
+                    medida["tiempo"] += perf_counter() - inicio
+                    medida["tokens"] += self.pos - pos
+        return medida_de
+    
+    def _abre_medida(self, expansiones, simbolo, alto):
+        # Empieza a medir una expansion de simbolo, que termina cuando la pila vuelve a
+        # bajar a alto. Lo mismo que en _mide: profundidad en expansiones anidadas, y si
+        # esta dentro de otra del mismo simbolo solo cuenta la de afuera
+        medida = self.medidas.get(simbolo)
+        if medida is None:
+            medida = self.medidas[simbolo] = {"llamadas": 0, "tokens": 0, "tiempo": 0.0, "profundidad": 0}
+        medida["llamadas"] += 1
+        expansiones.append((simbolo, alto, self.pos, perf_counter(), not self._activas[simbolo]))
+        self._activas[simbolo] += 1
+        if len(expansiones) > medida["profundidad"]:
+            medida["profundidad"] = len(expansiones)
+    
+    def _cierra_medidas(self, expansiones, alto):
+        # Cierra las expansiones que ya terminaron con la pila en alto; con 0 todas
+        if alto > self.pila_maxima:
+            self.pila_maxima = alto
+        while expansiones and expansiones[-1][1] >= alto:
+            simbolo, _, pos, inicio, afuera = expansiones.pop()
+            self._activas[simbolo] -= 1
+            if afuera:
+                medida = self.medidas[simbolo]
+                medida["tiempo"] += perf_counter() - inicio
+                medida["tokens"] += self.pos - pos
+    
+    def reporta_medidas(self):
+        # Las producciones que se llamaron, de la que mas tiempo tomo a la que menos. En
+        # la tabla no hay recursion, lo que crece es la pila
+        medidas = sorted(((n, m) for n, m in self.medidas.items() if m["llamadas"]),
+                         key=lambda x: x[1]["tiempo"], reverse=True)
+        profundidad = max((m["profundidad"] for _, m in medidas), default=0)
+        if self.medir == "json":
+            reporte = {"producciones": dict(medidas), "profundidad": profundidad}
+            if self.pila_maxima is None:
+                reporte["limite_recursion"] = sys.getrecursionlimit()
+            else:
+                reporte["pila_maxima"] = self.pila_maxima
+            print(json.dumps(reporte, indent=2))
+            return
+        print(f"{'Produccion':<20} | {'Llamadas':>9} | {'Tokens':>9} | {'Tiempo (ms)':>11} | {'Prof. max':>9}")
+        print("-"*70)
+        for nombre, m in medidas:
+            print(f"{nombre:<20} | {m['llamadas']:>9} | {m['tokens']:>9} | {m['tiempo'] * 1000:>11.3f} | {m['profundidad']:>9}")
+        if self.pila_maxima is not None:
+            print(f"Profundidad maxima: {profundidad} producciones, pila de {self.pila_maxima} simbolos")
+            return
+        # Cada produccion medida usa dos marcos de Python, la suya y la que la mide
+        print(f"Profundidad maxima: {profundidad} producciones, limite de recursion {sys.getrecursionlimit()}")
+    
+    def analyze(self, modo="tabla", arbol=False, recupera=False, maximo=MAX_ERRORES, inicial=INICIAL):
+        if self.medir and modo not in ("tabla", "descendente"):
+            raise ValueError(f"Las medidas por produccion no van en modo '{modo}'")
+        success = self.Predictivo(arbol, recupera, maximo, inicial) if modo == "tabla" else self.Program()
+        if self.medidas is not None:
+            self.reporta_medidas()
         
         if success and self.current is None:
             return True
@@ -641,7 +991,113 @@ class SyntaxAnalyzer:
             return False
 
 
-def inicia_sintactico(tokens_list):
+# Las producciones del descendente recursivo, las que se pueden medir
+_METODOS = tuple(n for n in vars(SyntaxAnalyzer) if n[0].isupper() and n != "Predictivo")
+
+
+def _tramo_cambiado(viejos, tokens, cambio):
+    # Quita de las orillas del rango los tokens que siguen del mismo tipo, al arbol no le
+    # importa el lexema
+    if cambio is None:
+        cambio = (0, len(viejos), len(tokens))
+    desde, hasta_viejo, hasta_nuevo = cambio
+    while desde < hasta_viejo and desde < hasta_nuevo and viejos[desde].tipo == tokens[desde].tipo:
+        desde += 1
+    while hasta_viejo > desde and hasta_nuevo > desde and viejos[hasta_viejo - 1].tipo == tokens[hasta_nuevo - 1].tipo:
+        hasta_viejo -= 1
+        hasta_nuevo -= 1
+    return desde, hasta_viejo, hasta_nuevo
+
+
+def _encierran(programa, desde, hasta):
+    # (lista, posicion, no terminal) de los elementos de listas de sentencias que tienen
+    # adentro los tokens [desde, hasta), de afuera hacia adentro
+    cadena = []
+    nodo = programa
+    while nodo is not None:
+        padre, nodo = nodo, None
+        for campo in padre.__slots__:
+            elemento = _ELEMENTOS.get((type(padre), campo))
+            if elemento is None:
+                continue
+            lista = getattr(padre, campo)
+            for k, hijo in enumerate(lista):
+                if hijo.inicio <= desde < hijo.fin and hasta <= hijo.fin:
+                    cadena.append((lista, k, elemento))
+                    nodo = hijo
+                    break
+            if nodo is not None:
+                break
+    return cadena
+
+
+def reanaliza(tokens, viejos, programa, cambio=None):
+    """Despues de una edicion vuelve a analizar solo el elemento mas chico de una lista de
+    sentencias (sentencia, funcion o caso) que encierra el cambio, y si no sale el de
+    afuera. programa, el arbol de viejos, se corrige en su lugar. Regresa (nodo viejo, nodo
+    nuevo, (desde, hasta_viejo, hasta_nuevo)) con lo que se cambio, o None si hay que
+    analizar todo otra vez"""
+    desde, hasta_viejo, hasta_nuevo = _tramo_cambiado(viejos, tokens, cambio)
+    if desde == hasta_viejo == hasta_nuevo:
+        # Los mismos tipos en el mismo orden, el arbol queda igual
+        return None, None, (desde, desde, desde)
+    delta = hasta_nuevo - hasta_viejo
+    for lista, k, elemento in reversed(_encierran(programa, desde, hasta_viejo)):
+        viejo = lista[k]
+        analyzer = SyntaxAnalyzer(tokens, viejo.inicio, viejo.fin + delta)
+        # Todos los elementos acaban en un terminal, si se come justo su tramo el resto del
+        # analisis sale igual que antes
+        if analyzer.Predictivo(arbol=True, inicial=elemento) and analyzer.current is None:
+            corre(programa, viejo.fin, delta, viejo)
+            lista[k] = analyzer.arbol
+            return viejo, analyzer.arbol, (viejo.inicio, viejo.fin, viejo.fin + delta)
+    return None
+
+
+def inicia_sintactico(tokens_list, modo="tabla", arbol=False, recupera=False, maximo=MAX_ERRORES,
+                      previo=None, cambio=None, medir=None):
     # Agarra tokens super duper
-    analyzer = SyntaxAnalyzer(tokens_list)
-    return analyzer.analyze()
\ No newline at end of file
+    # modo "tabla" usa la tabla de predicciones, "descendente" las funciones recursivas,
+    # "paralelo" la tabla con el proceso y cada funcion en procesos aparte.
+    # Con arbol=True regresa el Programa (o None si hubo error) en vez de True/False.
+    # Con recupera=True junta todos los errores (hasta maximo) y regresa (resultado, errores)
+    # Con previo=(tokens viejos, arbol viejo) solo se analiza de nuevo lo que encierra
+    # cambio, el rango que regresa relexea_tokens (sin el se busca comparando los tokens),
+    # y se reusa el arbol viejo. Al final se agrega lo que regresa reanaliza, o si se
+    # analizo todo (arbol viejo, arbol nuevo, (0, len(viejos), len(tokens)))
+    # Con medir="tabla" o "json" se imprimen al final las medidas de cada produccion (cada
+    # no terminal en modo "tabla"), no en "paralelo" que reparte el analisis en procesos
+    if modo not in MODOS:
+        raise ValueError(f"Modo sintactico desconocido: {modo}")
+    if medir is not None and medir not in FORMATOS_MEDIDA:
+        raise ValueError(f"Formato de medidas desconocido: {medir}")
+    if medir and modo == "paralelo":
+        raise ValueError("Las medidas por produccion no van en modo 'paralelo'")
+    if (arbol or recupera) and modo == "descendente":
+        raise ValueError("El arbol y la recuperacion de errores no van en modo 'descendente'")
+    if previo is not None and not arbol:
+        raise ValueError("El analisis incremental necesita arbol=True")
+    reporte = None
+    if previo is not None and previo[1] is not None:
+        reporte = reanaliza(tokens_list, previo[0], previo[1], cambio)
+    if reporte is not None:
+        resultado, errores = previo[1], []
+    else:
+        if modo == "paralelo":
+            from .paralelo import analisis_paralelo
+            ok, analyzer = analisis_paralelo(tokens_list, arbol, recupera, maximo)
+        else:
+            analyzer = SyntaxAnalyzer(tokens_list, medir=medir)
+            ok = analyzer.analyze(modo, arbol, recupera, maximo)
+        resultado = ok
+        if arbol:
+            resultado = analyzer.arbol if ok else None
+        errores = analyzer.errors
+        if previo is not None:
+            reporte = (previo[1], resultado, (0, len(previo[0]), len(tokens_list)))
+    salida = (resultado,)
+    if recupera:
+        salida += (errores,)
+    if previo is not None:
+        salida += (reporte,)
+    return salida if len(salida) > 1 else resultado
@@ -0,0 +1,229 @@
+import argparse
+import hashlib
+import os
+from Analizador_Lexico.Procesos.tipos import Tipo
+
+_AQUI = os.path.dirname(os.path.abspath(__file__))
+GRAMATICA = os.path.join(_AQUI, "Reglas de Produccion", "Gramatica.txt")
+SALIDA = os.path.join(_AQUI, "tabla_predicciones.py")
+# Fin de los tokens, va en el FOLLOW del simbolo inicial
+FIN = "EOF"
+EPSILON = "ε"
+
+
+def lee_gramatica(texto):
+    """Producciones (izquierda, lado derecho) del texto de Gramatica.txt. Las primas ’ y ’’
+    quedan como ' y '', las lineas // se ignoran y los terminales se pasan a mayusculas
+    para que sean los tipos de token del lexico"""
+    producciones = []
+    for linea in texto.splitlines():
+        linea = linea.strip()
+        if not linea or linea.startswith("//"):
+            continue
+        if "->" not in linea:
+            raise ValueError(f"Regla sin '->': {linea}")
+        izquierda, derecha = linea.replace("’", "'").split("->", 1)
+        izquierda = izquierda.strip()
+        for alternativa in derecha.split("|"):
+            simbolos = [s for s in alternativa.split() if s != EPSILON]
+            producciones.append((izquierda, tuple(s if s[0].isupper() else s.upper() for s in simbolos)))
+    return producciones
+
+
+def primeros(producciones):
+    """FIRST de cada no terminal y el conjunto de los que derivan ε"""
+    primero = {izq: set() for izq, _ in producciones}
+    anulables = set()
+    cambio = True
+    while cambio:
+        cambio = False
+        for izq, derecha in producciones:
+            conjunto, anulable = primero_de(derecha, primero, anulables)
+            if not conjunto <= primero[izq]:
+                primero[izq] |= conjunto
+                cambio = True
+            if anulable and izq not in anulables:
+                anulables.add(izq)
+                cambio = True
+    return primero, anulables
+
+
+def primero_de(simbolos, primero, anulables):
+    """FIRST de una secuencia y si toda ella puede quedar en ε"""
+    conjunto = set()
+    for simbolo in simbolos:
+        if simbolo not in primero:
+            conjunto.add(simbolo)
+            return conjunto, False
+        conjunto |= primero[simbolo]
+        if simbolo not in anulables:
+            return conjunto, False
+    return conjunto, True
+
+
+def siguientes(producciones, primero, anulables, inicial):
+    """FOLLOW de cada no terminal"""
+    siguiente = {izq: set() for izq, _ in producciones}
+    siguiente[inicial].add(FIN)
+    cambio = True
+    while cambio:
+        cambio = False
+        for izq, derecha in producciones:
+            for i, simbolo in enumerate(derecha):
+                if simbolo not in primero:
+                    continue
+                conjunto, anulable = primero_de(derecha[i + 1:], primero, anulables)
+                if anulable:
+                    conjunto = conjunto | siguiente[izq]
+                if not conjunto <= siguiente[simbolo]:
+                    siguiente[simbolo] |= conjunto
+                    cambio = True
+    return siguiente
+
+
+def tabla_predicciones(producciones):
+    """Tabla LL(1) no terminal -> {terminal: numero de produccion} y lista de conflictos
+    (no terminal, terminal, producciones). En un conflicto gana la que tiene el terminal en
+    su FIRST sobre la que llega por FOLLOW, y entre dos por FOLLOW la mas corta: es lo que
+    hace el descendente recursivo, que prueba primero el token y si no se va por ε"""
+    inicial = producciones[0][0]
+    primero, anulables = primeros(producciones)
+    siguiente = siguientes(producciones, primero, anulables, inicial)
+    candidatas = {izq: {} for izq, _ in producciones}
+    for k, (izq, derecha) in enumerate(producciones):
+        conjunto, anulable = primero_de(derecha, primero, anulables)
+        for terminal in conjunto:
+            candidatas[izq].setdefault(terminal, []).append((0, len(derecha), k))
+        if anulable:
+            for terminal in siguiente[izq] - conjunto:
+                candidatas[izq].setdefault(terminal, []).append((1, len(derecha), k))
+
+    tabla = {}
+    conflictos = []
+    for izq, fila in candidatas.items():
+        tabla[izq] = {}
+        for terminal, opciones in fila.items():
+            opciones.sort()
+            tabla[izq][terminal] = opciones[0][2]
+            if len(opciones) > 1:
+                conflictos.append((izq, terminal, [k for _, _, k in opciones]))
+    return tabla, conflictos, primero, siguiente
+
+
+def huella(texto):
+    """Hash de la gramatica y de este archivo: si cambia cualquiera hay que regenerar"""
+    h = hashlib.sha256(texto.encode("utf-8"))
+    with open(os.path.abspath(__file__), "rb") as f:
+        h.update(f.read())
+    return h.hexdigest()[:16]
+
+
+def terminales_desconocidos(producciones):
+    """Terminales de la gramatica que no son un Tipo de token"""
+    no_terminales = {izq for izq, _ in producciones}
+    simbolos = {s for _, derecha in producciones for s in derecha}
+    return sorted(simbolos - no_terminales - set(Tipo.__members__))
+
+
+def _simbolo(simbolo):
+    # Los terminales se escriben como Tipo.X, los no terminales como strings
+    return f"Tipo.{simbolo}" if simbolo in Tipo.__members__ else repr(simbolo)
+
+
+def _conjunto(terminales):
+    return "frozenset({" + ", ".join(_simbolo(t) for t in sorted(terminales)) + "})"
+
+
+def emite(producciones, tabla, conflictos, primero, siguiente, firma):
+    """Texto del modulo tabla_predicciones.py"""
+    epsilon = [izq for izq in dict.fromkeys(i for i, _ in producciones)
+               if any(i == izq and not d for i, d in producciones)]
+    lineas = [
+        "# Generado por Analizador_Sintactico/generador.py a partir de",
+        "# \"Reglas de Produccion/Gramatica.txt\", no editar a mano.",
+        "# Los terminales son los Tipo de token del lexico y Tipo.EOF es el fin de los tokens",
+        "",
+        "from Analizador_Lexico.Procesos.tipos import Tipo",
+        "",
+        f"HUELLA = {firma!r}",
+        "",
+        f"INICIAL = {producciones[0][0]!r}",
+        "",
+        "# (no terminal, lado derecho); un lado derecho vacio es ε",
+        "PRODUCCIONES = (",
+    ]
+    for k, (izq, derecha) in enumerate(producciones):
+        lado = ", ".join(_simbolo(s) for s in derecha) + ("," if len(derecha) == 1 else "")
+        lineas.append(f"    ({izq!r}, ({lado})),  # {k}")
+    lineas += [")", ""]
+    if conflictos:
+        lineas.append("# Conflictos LL(1), se queda la primera produccion de cada uno:")
+        lineas += [f"#   {izq} con {terminal}: {opciones}" for izq, terminal, opciones in conflictos]
+        lineas.append("")
+    lineas += ["# No terminal -> {terminal: numero de produccion}", "TABLA = {"]
+    for izq, fila in tabla.items():
+        celdas = ", ".join(f"{_simbolo(t)}: {k}" for t, k in sorted(fila.items(), key=lambda x: (x[1], x[0])))
+        lineas.append(f"    {izq!r}: {{{celdas}}},")
+    lineas += [
+        "}",
+        "",
+        "# No terminales con regla ε: si el token no esta en su fila se toma esa, igual que el",
+        "# descendente recursivo que nunca revisa el FOLLOW",
+        "EPSILON = frozenset({",
+    ]
+    lineas += [f"    {izq!r}," for izq in epsilon]
+    lineas += ["})", "", "# FIRST de cada no terminal", "PRIMEROS = {"]
+    lineas += [f"    {izq!r}: {_conjunto(primero[izq])}," for izq in tabla]
+    lineas += ["}", "", "# FOLLOW de cada no terminal", "SIGUIENTES = {"]
+    lineas += [f"    {izq!r}: {_conjunto(siguiente[izq])}," for izq in tabla]
+    lineas += ["}", ""]
+    return "\n".join(lineas)
+
+
+def _huella_actual(ruta):
+    try:
+        with open(ruta, encoding="utf-8") as f:
+            for linea in f:
+                if linea.startswith("HUELLA = "):
+                    return linea.split("=", 1)[1].strip().strip("'\"")
+    except OSError:
+        pass
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Genera la tabla de predicciones LL(1) de la gramatica")
+    parser.add_argument("--gramatica", default=GRAMATICA, help="archivo con las reglas de produccion")
+    parser.add_argument("--salida", default=SALIDA, help="modulo de Python a escribir")
+    parser.add_argument("--fuerza", action="store_true", help="escribir aunque la gramatica no haya cambiado")
+    parser.add_argument("--conjuntos", action="store_true", help="imprimir FIRST y FOLLOW")
+    args = parser.parse_args(argv)
+
+    with open(args.gramatica, encoding="utf-8") as f:
+        texto = f.read()
+    producciones = lee_gramatica(texto)
+    desconocidos = terminales_desconocidos(producciones)
+    if desconocidos:
+        print(f"Terminales que no son tipos de token: {', '.join(desconocidos)}")
+        return 1
+    tabla, conflictos, primero, siguiente = tabla_predicciones(producciones)
+
+    print(f"Producciones: {len(producciones)}, no terminales: {len(tabla)}")
+    if args.conjuntos:
+        for izq in tabla:
+            print(f"  {izq}: FIRST {sorted(primero[izq])} FOLLOW {sorted(siguiente[izq])}")
+    for izq, terminal, opciones in conflictos:
+        print(f"Conflicto en {izq} con {terminal}: producciones {opciones}, se usa {opciones[0]}")
+
+    firma = huella(texto)
+    if not args.fuerza and _huella_actual(args.salida) == firma:
+        print(f"'{args.salida}' ya esta al dia")
+        return 1 if conflictos else 0
+    with open(args.salida, "w", encoding="utf-8") as f:
+        f.write(emite(producciones, tabla, conflictos, primero, siguiente, firma))
+    print(f"Tabla escrita en: '{args.salida}'")
+    return 1 if conflictos else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
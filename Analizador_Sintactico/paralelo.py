@@ -0,0 +1,111 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from Analizador_Lexico.Procesos.tipos import Tipo
+from Analizador_Lexico.Procesos.secuencia import TokenStream, TokenVista
+from .Sintac import SyntaxAnalyzer, MAX_ERRORES
+from .Arbol import aplana, arma
+
+# Tokens: con menos, levantar los procesos tarda mas que analizar todo en serie
+MINIMO = 1 << 16
+
+
+class _Tramo:
+    """Los tokens [base, base + n) que le tocan a un proceso, con los indices de la lista
+    completa: asi las posiciones de los errores y los indices del arbol salen igual"""
+    def __init__(self, kinds, lineas, base):
+        self.base = base
+        # Sin texto fuente: al sintactico solo le importan el tipo y la linea
+        self.flujo = TokenStream(None)
+        self.flujo.kinds = kinds
+        self.flujo.lineas = lineas
+
+    def __len__(self):
+        return self.base + len(self.flujo)
+
+    def __getitem__(self, i):
+        return TokenVista(self.flujo, i - self.base)
+
+
+def _columnas(tokens, inicio, fin):
+    # Tipos y lineas de los tokens [inicio, fin) en arreglos, que es lo que viaja al proceso
+    if hasattr(tokens, "kinds"):
+        return tokens.kinds[inicio:fin], tokens.lineas[inicio:fin]
+    tramo = tokens[inicio:fin]
+    return array('H', [t.tipo for t in tramo]), array('I', [t.linea for t in tramo])
+
+
+def _funciones(tokens):
+    # Donde empieza cada funcion; FUNCTION solo puede ir afuera del proceso
+    if hasattr(tokens, "kinds"):
+        return [i for i, kind in enumerate(tokens.kinds) if kind == Tipo.FUNCTION]
+    return [i for i, t in enumerate(tokens) if t.tipo == Tipo.FUNCTION]
+
+
+def tandas(unidades, tramo, procesos):
+    """Unidades seguidas juntas en unas cuantas tandas por proceso de tamaños parecidos,
+    para que ninguno se quede esperando al ultimo. tramo(unidad) es su (inicio, fin) en
+    tokens"""
+    if not unidades:
+        return []
+    tamano = (tramo(unidades[-1])[1] - tramo(unidades[0])[0]) // (procesos * 4) + 1
+    resultado, tanda = [], []
+    for unidad in unidades:
+        tanda.append(unidad)
+        if tramo(unidad)[1] - tramo(tanda[0])[0] >= tamano:
+            resultado.append(tanda)
+            tanda = []
+    if tanda:
+        resultado.append(tanda)
+    return resultado
+
+
+def _analiza_unidades(kinds, lineas, base, unidades, arbol):
+    # Cada unidad tiene que empatar justo su tramo. Regresa los arboles (aplanados) de las
+    # que salieron y el inicio de la primera que no, o None si salieron todas
+    tokens = _Tramo(kinds, lineas, base)
+    arboles = []
+    for inicial, inicio, fin in unidades:
+        analyzer = SyntaxAnalyzer(tokens, inicio, fin)
+        if not analyzer.Predictivo(arbol, inicial=inicial) or analyzer.current is not None:
+            return arboles, inicio
+        if arbol:
+            arboles.append(aplana(analyzer.arbol))
+    return arboles, None
+
+
+def analisis_paralelo(tokens, arbol=False, recupera=False, maximo=MAX_ERRORES, procesos=None, minimo=MINIMO):
+    """Analiza el proceso y cada funcion en procesos aparte y regresa (ok, analyzer) como
+    SyntaxAnalyzer.analyze en modo "tabla". Si alguna no sale, desde ahi se sigue en serie
+    para que los errores sean los mismos que analizando todo junto"""
+    procesos = procesos or os.cpu_count() or 1
+    cortes = [0, *_funciones(tokens), len(tokens)] if procesos > 1 and len(tokens) >= minimo else []
+    if len(cortes) < 3 or cortes[1] == 0:
+        analyzer = SyntaxAnalyzer(tokens)
+        return analyzer.analyze("tabla", arbol, recupera, maximo), analyzer
+
+    # El proceso va como Program, que con los tokens acabados deja Program' en ε
+    unidades = [("Program" if a == 0 else "Func", a, b) for a, b in zip(cortes, cortes[1:])]
+    trabajos = [(*_columnas(tokens, t[0][1], t[-1][2]), t[0][1], t, arbol)
+                for t in tandas(unidades, lambda unidad: unidad[1:], procesos)]
+
+    with ProcessPoolExecutor(procesos) as pool:
+        partes = list(pool.map(_analiza_unidades, *zip(*trabajos)))
+
+    arboles = []
+    for parte, falla in partes:
+        arboles += map(arma, parte)
+        if falla is not None:
+            # En serie se llega aqui con solo Program' en la pila, se retoma desde ahi. Si
+            # fallo el proceso se analiza todo
+            analyzer = SyntaxAnalyzer(tokens, falla)
+            inicial = "Program'" if falla else "Program"
+            return analyzer.analyze("tabla", arbol, recupera, maximo, inicial), analyzer
+
+    analyzer = SyntaxAnalyzer(tokens, len(tokens))
+    if arbol:
+        programa = arboles[0]
+        programa.funciones = arboles[1:]
+        programa.fin = len(tokens)
+        analyzer.arbol = programa
+    return True, analyzer
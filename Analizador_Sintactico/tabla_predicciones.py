@@ -0,0 +1,334 @@
+# Generado por Analizador_Sintactico/generador.py a partir de
+# "Reglas de Produccion/Gramatica.txt", no editar a mano.
+# Los terminales son los Tipo de token del lexico y Tipo.EOF es el fin de los tokens
+
+from Analizador_Lexico.Procesos.tipos import Tipo
+
+HUELLA = '62e59a2d94f4b3cc'
+
+INICIAL = 'Program'
+
+# (no terminal, lado derecho); un lado derecho vacio es ε
+PRODUCCIONES = (
+    ('Program', ('Class', "Program'")),  # 0
+    ("Program'", ('Func', "Program'")),  # 1
+    ("Program'", ()),  # 2
+    ('Class', (Tipo.PROCESS, Tipo.ID, Tipo.DELIM_LKEY, 'Cont', Tipo.DELIM_RKEY, Tipo.END_PROCESS)),  # 3
+    ('Cont', ('Accon', "Cont'")),  # 4
+    ("Cont'", ('Accon', "Cont'")),  # 5
+    ("Cont'", ()),  # 6
+    ('Accon', ('Defi',)),  # 7
+    ('Accon', ('Asig',)),  # 8
+    ('Accon', ('Impr',)),  # 9
+    ('Accon', ('Lect',)),  # 10
+    ('Accon', ('Condif',)),  # 11
+    ('Accon', ('CycleFor',)),  # 12
+    ('Accon', ('CycleRep',)),  # 13
+    ('Accon', ('CycleWhile',)),  # 14
+    ('Accon', ('Multselec',)),  # 15
+    ('Condif', (Tipo.IF, Tipo.DELIM_LPAREN, 'Exprelog', Tipo.DELIM_RPAREN, Tipo.THEN, Tipo.DELIM_LKEY, 'Cont', Tipo.DELIM_RKEY, "Condif'")),  # 16
+    ("Condif'", (Tipo.ELSE, Tipo.DELIM_LKEY, 'Cont', Tipo.DELIM_RKEY, Tipo.END_IF)),  # 17
+    ("Condif'", (Tipo.END_IF,)),  # 18
+    ('Func', (Tipo.FUNCTION, Tipo.ID, Tipo.EQUAL, Tipo.ID, Tipo.DELIM_LPAREN, 'Varmul', Tipo.DELIM_RPAREN, Tipo.DELIM_LKEY, 'Cont', Tipo.DELIM_RKEY, Tipo.END_FUNCTION)),  # 19
+    ('CycleWhile', (Tipo.WHILE, Tipo.DELIM_LPAREN, 'Exprelog', Tipo.DELIM_RPAREN, Tipo.DO, Tipo.DELIM_LKEY, 'Contblo', Tipo.DELIM_RKEY, Tipo.END_WHILE)),  # 20
+    ('CycleRep', (Tipo.REPEAT, Tipo.DELIM_LKEY, 'Contblo', Tipo.DELIM_RKEY, Tipo.UNTIL, Tipo.DELIM_LPAREN, 'Exprelog', Tipo.DELIM_RPAREN)),  # 21
+    ('CycleFor', (Tipo.FOR, Tipo.ID, Tipo.EQUAL, Tipo.DATA_INT, Tipo.THROUGH, Tipo.DATA_INT, Tipo.RATE, Tipo.DATA_INT, Tipo.DO_FOR, Tipo.DELIM_LKEY, 'Contblo', Tipo.DELIM_RKEY, Tipo.END_FOR)),  # 22
+    ('Multselec', (Tipo.SWITCH, Tipo.DELIM_LPAREN, Tipo.ID, Tipo.DELIM_RPAREN, Tipo.SELECT, "Multselec'", Tipo.DEFAULT, Tipo.DELIM_ENTER, Tipo.DELIM_LKEY, 'Contswi', Tipo.DELIM_RKEY)),  # 23
+    ("Multselec'", ("Multselec''", "Multselec'")),  # 24
+    ("Multselec'", ()),  # 25
+    ("Multselec''", (Tipo.DATA_INT, Tipo.DELIM_ENTER, Tipo.DELIM_LKEY, 'Contswi', Tipo.DELIM_RKEY)),  # 26
+    ('Contblo', ('Acblo', "Contblo'")),  # 27
+    ("Contblo'", ('Acblo', "Contblo'")),  # 28
+    ("Contblo'", ()),  # 29
+    ('Acblo', ('Asig',)),  # 30
+    ('Acblo', ('Impr',)),  # 31
+    ('Acblo', ('Lect',)),  # 32
+    ('Acblo', ('Condif',)),  # 33
+    ('Acblo', ('CycleFor',)),  # 34
+    ('Acblo', ('CycleRep',)),  # 35
+    ('Acblo', ('CycleWhile',)),  # 36
+    ('Acblo', ('Multselec',)),  # 37
+    ('Contswi', ('Acswi', "Contswi'")),  # 38
+    ("Contswi'", ('Acswi', "Contswi'")),  # 39
+    ("Contswi'", ()),  # 40
+    ('Acswi', ('Asig',)),  # 41
+    ('Acswi', ('Impr',)),  # 42
+    ('Acswi', ('Lect',)),  # 43
+    ('Acswi', ('Condif',)),  # 44
+    ('Acswi', ('CycleFor',)),  # 45
+    ('Acswi', ('CycleRep',)),  # 46
+    ('Acswi', ('CycleWhile',)),  # 47
+    ('Exprelog', ('Log', "Exprelog'")),  # 48
+    ("Exprelog'", ('Opelog', 'Log', "Exprelog'")),  # 49
+    ("Exprelog'", ()),  # 50
+    ('Log', (Tipo.ID, 'Opeasig', 'Valorlog')),  # 51
+    ('Log', ('Valornum', 'Opeasig', 'Valorlog')),  # 52
+    ('Expremath', ('Valornum', "Expremath'")),  # 53
+    ('Expremath', ('Mathfunc',)),  # 54
+    ("Expremath'", ('Simb', 'Valorlog')),  # 55
+    ("Expremath'", ()),  # 56
+    ('Mathfunc', ("Mathfunc'", Tipo.DELIM_LPAREN, Tipo.ID, Tipo.DELIM_RPAREN)),  # 57
+    ("Mathfunc'", (Tipo.FUN_SQRT,)),  # 58
+    ("Mathfunc'", (Tipo.FUN_ABS,)),  # 59
+    ("Mathfunc'", (Tipo.FUN_LN,)),  # 60
+    ("Mathfunc'", (Tipo.FUN_EXP,)),  # 61
+    ("Mathfunc'", (Tipo.FUN_SEN,)),  # 62
+    ("Mathfunc'", (Tipo.FUN_COS,)),  # 63
+    ("Mathfunc'", (Tipo.FUN_ATAN,)),  # 64
+    ("Mathfunc'", (Tipo.FUN_TRUNC,)),  # 65
+    ("Mathfunc'", (Tipo.FUN_ROUND,)),  # 66
+    ("Mathfunc'", (Tipo.FUN_RAND,)),  # 67
+    ('Exprestring', (Tipo.DATA_STRING, "Exprestring'")),  # 68
+    ("Exprestring'", (Tipo.PLUS, 'Valorstring')),  # 69
+    ("Exprestring'", ()),  # 70
+    ('Expression', (Tipo.ID, "Expression'")),  # 71
+    ("Expression'", ('Usfun',)),  # 72
+    ("Expression'", ('Simb', 'Valorexp')),  # 73
+    ("Expression'", ()),  # 74
+    ('Typed', (Tipo.INT,)),  # 75
+    ('Typed', (Tipo.REAL,)),  # 76
+    ('Typed', (Tipo.BOOL,)),  # 77
+    ('Typed', (Tipo.CHAR,)),  # 78
+    ('Typed', (Tipo.STRING,)),  # 79
+    ('Simb', (Tipo.PLUS,)),  # 80
+    ('Simb', (Tipo.MINUS,)),  # 81
+    ('Simb', (Tipo.MULT,)),  # 82
+    ('Simb', (Tipo.DIV,)),  # 83
+    ('Simb', (Tipo.EXP,)),  # 84
+    ('Simb', (Tipo.MODULO,)),  # 85
+    ('Valor', (Tipo.DATA_INT,)),  # 86
+    ('Valor', (Tipo.DATA_DOUBLE,)),  # 87
+    ('Valor', (Tipo.DATA_STRING,)),  # 88
+    ('Valor', (Tipo.TRUE,)),  # 89
+    ('Valor', (Tipo.FALSE,)),  # 90
+    ('Valornum', (Tipo.DATA_INT,)),  # 91
+    ('Valornum', (Tipo.DATA_DOUBLE,)),  # 92
+    ('Valorlog', (Tipo.ID,)),  # 93
+    ('Valorlog', ('Valornum',)),  # 94
+    ('Valorexp', (Tipo.ID,)),  # 95
+    ('Valorexp', ('Valornum',)),  # 96
+    ('Valorexp', (Tipo.DATA_STRING,)),  # 97
+    ('Valorstring', (Tipo.ID,)),  # 98
+    ('Valorstring', (Tipo.DATA_STRING,)),  # 99
+    ('Valorbool', (Tipo.TRUE,)),  # 100
+    ('Valorbool', (Tipo.FALSE,)),  # 101
+    ('Opeasig', (Tipo.LESS,)),  # 102
+    ('Opeasig', (Tipo.MORE,)),  # 103
+    ('Opeasig', (Tipo.SAME,)),  # 104
+    ('Opeasig', (Tipo.LESS_SAME,)),  # 105
+    ('Opeasig', (Tipo.MORE_SAME,)),  # 106
+    ('Opeasig', (Tipo.DIFF,)),  # 107
+    ('Opelog', (Tipo.AND,)),  # 108
+    ('Opelog', (Tipo.OR,)),  # 109
+    ('Opelog', (Tipo.NOT,)),  # 110
+    ('Asig', (Tipo.ID, Tipo.EQUAL, "Asig'", Tipo.DELIM_LINE)),  # 111
+    ("Asig'", ('Expremath',)),  # 112
+    ("Asig'", ('Exprestring',)),  # 113
+    ("Asig'", ('Valorbool',)),  # 114
+    ("Asig'", ('Expression',)),  # 115
+    ('Impr', (Tipo.WRITE, "Impr'", Tipo.DELIM_LINE)),  # 116
+    ("Impr'", ('Valor', 'Printmul')),  # 117
+    ("Impr'", (Tipo.ID, 'Printmul')),  # 118
+    ('Printmul', (Tipo.DELIM_COMMA, "Printmul'", 'Printmul')),  # 119
+    ('Printmul', ()),  # 120
+    ("Printmul'", (Tipo.ID,)),  # 121
+    ("Printmul'", ('Valor',)),  # 122
+    ('Lect', (Tipo.READ, Tipo.ID, Tipo.DELIM_LINE)),  # 123
+    ('Defi', (Tipo.DEFINIR, Tipo.ID, 'Typed', Tipo.DELIM_LINE)),  # 124
+    ('Usfun', (Tipo.DELIM_LPAREN, 'Varmul', Tipo.DELIM_RPAREN)),  # 125
+    ('Usfun', ()),  # 126
+    ('Varmul', (Tipo.ID, "Varmul'")),  # 127
+    ("Varmul'", (Tipo.DELIM_COMMA, Tipo.ID, "Varmul'")),  # 128
+    ("Varmul'", ()),  # 129
+)
+
+# Conflictos LL(1), se queda la primera produccion de cada uno:
+#   Expression' con DELIM_LINE: [74, 72]
+
+# No terminal -> {terminal: numero de produccion}
+TABLA = {
+    'Program': {Tipo.PROCESS: 0},
+    "Program'": {Tipo.FUNCTION: 1, Tipo.EOF: 2},
+    'Class': {Tipo.PROCESS: 3},
+    'Cont': {Tipo.DEFINIR: 4, Tipo.FOR: 4, Tipo.ID: 4, Tipo.IF: 4, Tipo.READ: 4, Tipo.REPEAT: 4, Tipo.SWITCH: 4, Tipo.WHILE: 4, Tipo.WRITE: 4},
+    "Cont'": {Tipo.DEFINIR: 5, Tipo.FOR: 5, Tipo.ID: 5, Tipo.IF: 5, Tipo.READ: 5, Tipo.REPEAT: 5, Tipo.SWITCH: 5, Tipo.WHILE: 5, Tipo.WRITE: 5, Tipo.DELIM_RKEY: 6},
+    'Accon': {Tipo.DEFINIR: 7, Tipo.ID: 8, Tipo.WRITE: 9, Tipo.READ: 10, Tipo.IF: 11, Tipo.FOR: 12, Tipo.REPEAT: 13, Tipo.WHILE: 14, Tipo.SWITCH: 15},
+    'Condif': {Tipo.IF: 16},
+    "Condif'": {Tipo.ELSE: 17, Tipo.END_IF: 18},
+    'Func': {Tipo.FUNCTION: 19},
+    'CycleWhile': {Tipo.WHILE: 20},
+    'CycleRep': {Tipo.REPEAT: 21},
+    'CycleFor': {Tipo.FOR: 22},
+    'Multselec': {Tipo.SWITCH: 23},
+    "Multselec'": {Tipo.DATA_INT: 24, Tipo.DEFAULT: 25},
+    "Multselec''": {Tipo.DATA_INT: 26},
+    'Contblo': {Tipo.FOR: 27, Tipo.ID: 27, Tipo.IF: 27, Tipo.READ: 27, Tipo.REPEAT: 27, Tipo.SWITCH: 27, Tipo.WHILE: 27, Tipo.WRITE: 27},
+    "Contblo'": {Tipo.FOR: 28, Tipo.ID: 28, Tipo.IF: 28, Tipo.READ: 28, Tipo.REPEAT: 28, Tipo.SWITCH: 28, Tipo.WHILE: 28, Tipo.WRITE: 28, Tipo.DELIM_RKEY: 29},
+    'Acblo': {Tipo.ID: 30, Tipo.WRITE: 31, Tipo.READ: 32, Tipo.IF: 33, Tipo.FOR: 34, Tipo.REPEAT: 35, Tipo.WHILE: 36, Tipo.SWITCH: 37},
+    'Contswi': {Tipo.FOR: 38, Tipo.ID: 38, Tipo.IF: 38, Tipo.READ: 38, Tipo.REPEAT: 38, Tipo.WHILE: 38, Tipo.WRITE: 38},
+    "Contswi'": {Tipo.FOR: 39, Tipo.ID: 39, Tipo.IF: 39, Tipo.READ: 39, Tipo.REPEAT: 39, Tipo.WHILE: 39, Tipo.WRITE: 39, Tipo.DELIM_RKEY: 40},
+    'Acswi': {Tipo.ID: 41, Tipo.WRITE: 42, Tipo.READ: 43, Tipo.IF: 44, Tipo.FOR: 45, Tipo.REPEAT: 46, Tipo.WHILE: 47},
+    'Exprelog': {Tipo.DATA_DOUBLE: 48, Tipo.DATA_INT: 48, Tipo.ID: 48},
+    "Exprelog'": {Tipo.AND: 49, Tipo.NOT: 49, Tipo.OR: 49, Tipo.DELIM_RPAREN: 50},
+    'Log': {Tipo.ID: 51, Tipo.DATA_DOUBLE: 52, Tipo.DATA_INT: 52},
+    'Expremath': {Tipo.DATA_DOUBLE: 53, Tipo.DATA_INT: 53, Tipo.FUN_ABS: 54, Tipo.FUN_ATAN: 54, Tipo.FUN_COS: 54, Tipo.FUN_EXP: 54, Tipo.FUN_LN: 54, Tipo.FUN_RAND: 54, Tipo.FUN_ROUND: 54, Tipo.FUN_SEN: 54, Tipo.FUN_SQRT: 54, Tipo.FUN_TRUNC: 54},
+    "Expremath'": {Tipo.DIV: 55, Tipo.EXP: 55, Tipo.MINUS: 55, Tipo.MODULO: 55, Tipo.MULT: 55, Tipo.PLUS: 55, Tipo.DELIM_LINE: 56},
+    'Mathfunc': {Tipo.FUN_ABS: 57, Tipo.FUN_ATAN: 57, Tipo.FUN_COS: 57, Tipo.FUN_EXP: 57, Tipo.FUN_LN: 57, Tipo.FUN_RAND: 57, Tipo.FUN_ROUND: 57, Tipo.FUN_SEN: 57, Tipo.FUN_SQRT: 57, Tipo.FUN_TRUNC: 57},
+    "Mathfunc'": {Tipo.FUN_SQRT: 58, Tipo.FUN_ABS: 59, Tipo.FUN_LN: 60, Tipo.FUN_EXP: 61, Tipo.FUN_SEN: 62, Tipo.FUN_COS: 63, Tipo.FUN_ATAN: 64, Tipo.FUN_TRUNC: 65, Tipo.FUN_ROUND: 66, Tipo.FUN_RAND: 67},
+    'Exprestring': {Tipo.DATA_STRING: 68},
+    "Exprestring'": {Tipo.PLUS: 69, Tipo.DELIM_LINE: 70},
+    'Expression': {Tipo.ID: 71},
+    "Expression'": {Tipo.DELIM_LPAREN: 72, Tipo.DIV: 73, Tipo.EXP: 73, Tipo.MINUS: 73, Tipo.MODULO: 73, Tipo.MULT: 73, Tipo.PLUS: 73, Tipo.DELIM_LINE: 74},
+    'Typed': {Tipo.INT: 75, Tipo.REAL: 76, Tipo.BOOL: 77, Tipo.CHAR: 78, Tipo.STRING: 79},
+    'Simb': {Tipo.PLUS: 80, Tipo.MINUS: 81, Tipo.MULT: 82, Tipo.DIV: 83, Tipo.EXP: 84, Tipo.MODULO: 85},
+    'Valor': {Tipo.DATA_INT: 86, Tipo.DATA_DOUBLE: 87, Tipo.DATA_STRING: 88, Tipo.TRUE: 89, Tipo.FALSE: 90},
+    'Valornum': {Tipo.DATA_INT: 91, Tipo.DATA_DOUBLE: 92},
+    'Valorlog': {Tipo.ID: 93, Tipo.DATA_DOUBLE: 94, Tipo.DATA_INT: 94},
+    'Valorexp': {Tipo.ID: 95, Tipo.DATA_DOUBLE: 96, Tipo.DATA_INT: 96, Tipo.DATA_STRING: 97},
+    'Valorstring': {Tipo.ID: 98, Tipo.DATA_STRING: 99},
+    'Valorbool': {Tipo.TRUE: 100, Tipo.FALSE: 101},
+    'Opeasig': {Tipo.LESS: 102, Tipo.MORE: 103, Tipo.SAME: 104, Tipo.LESS_SAME: 105, Tipo.MORE_SAME: 106, Tipo.DIFF: 107},
+    'Opelog': {Tipo.AND: 108, Tipo.OR: 109, Tipo.NOT: 110},
+    'Asig': {Tipo.ID: 111},
+    "Asig'": {Tipo.DATA_DOUBLE: 112, Tipo.DATA_INT: 112, Tipo.FUN_ABS: 112, Tipo.FUN_ATAN: 112, Tipo.FUN_COS: 112, Tipo.FUN_EXP: 112, Tipo.FUN_LN: 112, Tipo.FUN_RAND: 112, Tipo.FUN_ROUND: 112, Tipo.FUN_SEN: 112, Tipo.FUN_SQRT: 112, Tipo.FUN_TRUNC: 112, Tipo.DATA_STRING: 113, Tipo.FALSE: 114, Tipo.TRUE: 114, Tipo.ID: 115},
+    'Impr': {Tipo.WRITE: 116},
+    "Impr'": {Tipo.DATA_DOUBLE: 117, Tipo.DATA_INT: 117, Tipo.DATA_STRING: 117, Tipo.FALSE: 117, Tipo.TRUE: 117, Tipo.ID: 118},
+    'Printmul': {Tipo.DELIM_COMMA: 119, Tipo.DELIM_LINE: 120},
+    "Printmul'": {Tipo.ID: 121, Tipo.DATA_DOUBLE: 122, Tipo.DATA_INT: 122, Tipo.DATA_STRING: 122, Tipo.FALSE: 122, Tipo.TRUE: 122},
+    'Lect': {Tipo.READ: 123},
+    'Defi': {Tipo.DEFINIR: 124},
+    'Usfun': {Tipo.DELIM_LPAREN: 125, Tipo.DELIM_LINE: 126},
+    'Varmul': {Tipo.ID: 127},
+    "Varmul'": {Tipo.DELIM_COMMA: 128, Tipo.DELIM_RPAREN: 129},
+}
+
+# No terminales con regla ε: si el token no esta en su fila se toma esa, igual que el
+# descendente recursivo que nunca revisa el FOLLOW
+EPSILON = frozenset({
+    "Program'",
+    "Cont'",
+    "Multselec'",
+    "Contblo'",
+    "Contswi'",
+    "Exprelog'",
+    "Expremath'",
+    "Exprestring'",
+    "Expression'",
+    'Printmul',
+    'Usfun',
+    "Varmul'",
+})
+
+# FIRST de cada no terminal
+PRIMEROS = {
+    'Program': frozenset({Tipo.PROCESS}),
+    "Program'": frozenset({Tipo.FUNCTION}),
+    'Class': frozenset({Tipo.PROCESS}),
+    'Cont': frozenset({Tipo.DEFINIR, Tipo.FOR, Tipo.ID, Tipo.IF, Tipo.READ, Tipo.REPEAT, Tipo.SWITCH, Tipo.WHILE, Tipo.WRITE}),
+    "Cont'": frozenset({Tipo.DEFINIR, Tipo.FOR, Tipo.ID, Tipo.IF, Tipo.READ, Tipo.REPEAT, Tipo.SWITCH, Tipo.WHILE, Tipo.WRITE}),
+    'Accon': frozenset({Tipo.DEFINIR, Tipo.FOR, Tipo.ID, Tipo.IF, Tipo.READ, Tipo.REPEAT, Tipo.SWITCH, Tipo.WHILE, Tipo.WRITE}),
+    'Condif': frozenset({Tipo.IF}),
+    "Condif'": frozenset({Tipo.ELSE, Tipo.END_IF}),
+    'Func': frozenset({Tipo.FUNCTION}),
+    'CycleWhile': frozenset({Tipo.WHILE}),
+    'CycleRep': frozenset({Tipo.REPEAT}),
+    'CycleFor': frozenset({Tipo.FOR}),
+    'Multselec': frozenset({Tipo.SWITCH}),
+    "Multselec'": frozenset({Tipo.DATA_INT}),
+    "Multselec''": frozenset({Tipo.DATA_INT}),
+    'Contblo': frozenset({Tipo.FOR, Tipo.ID, Tipo.IF, Tipo.READ, Tipo.REPEAT, Tipo.SWITCH, Tipo.WHILE, Tipo.WRITE}),
+    "Contblo'": frozenset({Tipo.FOR, Tipo.ID, Tipo.IF, Tipo.READ, Tipo.REPEAT, Tipo.SWITCH, Tipo.WHILE, Tipo.WRITE}),
+    'Acblo': frozenset({Tipo.FOR, Tipo.ID, Tipo.IF, Tipo.READ, Tipo.REPEAT, Tipo.SWITCH, Tipo.WHILE, Tipo.WRITE}),
+    'Contswi': frozenset({Tipo.FOR, Tipo.ID, Tipo.IF, Tipo.READ, Tipo.REPEAT, Tipo.WHILE, Tipo.WRITE}),
+    "Contswi'": frozenset({Tipo.FOR, Tipo.ID, Tipo.IF, Tipo.READ, Tipo.REPEAT, Tipo.WHILE, Tipo.WRITE}),
+    'Acswi': frozenset({Tipo.FOR, Tipo.ID, Tipo.IF, Tipo.READ, Tipo.REPEAT, Tipo.WHILE, Tipo.WRITE}),
+    'Exprelog': frozenset({Tipo.DATA_DOUBLE, Tipo.DATA_INT, Tipo.ID}),
+    "Exprelog'": frozenset({Tipo.AND, Tipo.NOT, Tipo.OR}),
+    'Log': frozenset({Tipo.DATA_DOUBLE, Tipo.DATA_INT, Tipo.ID}),
+    'Expremath': frozenset({Tipo.DATA_DOUBLE, Tipo.DATA_INT, Tipo.FUN_ABS, Tipo.FUN_ATAN, Tipo.FUN_COS, Tipo.FUN_EXP, Tipo.FUN_LN, Tipo.FUN_RAND, Tipo.FUN_ROUND, Tipo.FUN_SEN, Tipo.FUN_SQRT, Tipo.FUN_TRUNC}),
+    "Expremath'": frozenset({Tipo.DIV, Tipo.EXP, Tipo.MINUS, Tipo.MODULO, Tipo.MULT, Tipo.PLUS}),
+    'Mathfunc': frozenset({Tipo.FUN_ABS, Tipo.FUN_ATAN, Tipo.FUN_COS, Tipo.FUN_EXP, Tipo.FUN_LN, Tipo.FUN_RAND, Tipo.FUN_ROUND, Tipo.FUN_SEN, Tipo.FUN_SQRT, Tipo.FUN_TRUNC}),
+    "Mathfunc'": frozenset({Tipo.FUN_ABS, Tipo.FUN_ATAN, Tipo.FUN_COS, Tipo.FUN_EXP, Tipo.FUN_LN, Tipo.FUN_RAND, Tipo.FUN_ROUND, Tipo.FUN_SEN, Tipo.FUN_SQRT, Tipo.FUN_TRUNC}),
+    'Exprestring': frozenset({Tipo.DATA_STRING}),
+    "Exprestring'": frozenset({Tipo.PLUS}),
+    'Expression': frozenset({Tipo.ID}),
+    "Expression'": frozenset({Tipo.DELIM_LPAREN, Tipo.DIV, Tipo.EXP, Tipo.MINUS, Tipo.MODULO, Tipo.MULT, Tipo.PLUS}),
+    'Typed': frozenset({Tipo.BOOL, Tipo.CHAR, Tipo.INT, Tipo.REAL, Tipo.STRING}),
+    'Simb': frozenset({Tipo.DIV, Tipo.EXP, Tipo.MINUS, Tipo.MODULO, Tipo.MULT, Tipo.PLUS}),
+    'Valor': frozenset({Tipo.DATA_DOUBLE, Tipo.DATA_INT, Tipo.DATA_STRING, Tipo.FALSE, Tipo.TRUE}),
+    'Valornum': frozenset({Tipo.DATA_DOUBLE, Tipo.DATA_INT}),
+    'Valorlog': frozenset({Tipo.DATA_DOUBLE, Tipo.DATA_INT, Tipo.ID}),
+    'Valorexp': frozenset({Tipo.DATA_DOUBLE, Tipo.DATA_INT, Tipo.DATA_STRING, Tipo.ID}),
+    'Valorstring': frozenset({Tipo.DATA_STRING, Tipo.ID}),
+    'Valorbool': frozenset({Tipo.FALSE, Tipo.TRUE}),
+    'Opeasig': frozenset({Tipo.DIFF, Tipo.LESS, Tipo.LESS_SAME, Tipo.MORE, Tipo.MORE_SAME, Tipo.SAME}),
+    'Opelog': frozenset({Tipo.AND, Tipo.NOT, Tipo.OR}),
+    'Asig': frozenset({Tipo.ID}),
+    "Asig'": frozenset({Tipo.DATA_DOUBLE, Tipo.DATA_INT, Tipo.DATA_STRING, Tipo.FALSE, Tipo.FUN_ABS, Tipo.FUN_ATAN, Tipo.FUN_COS, Tipo.FUN_EXP, Tipo.FUN_LN, Tipo.FUN_RAND, Tipo.FUN_ROUND, Tipo.FUN_SEN, Tipo.FUN_SQRT, Tipo.FUN_TRUNC, Tipo.ID, Tipo.TRUE}),
+    'Impr': frozenset({Tipo.WRITE}),
+    "Impr'": frozenset({Tipo.DATA_DOUBLE, Tipo.DATA_INT, Tipo.DATA_STRING, Tipo.FALSE, Tipo.ID, Tipo.TRUE}),
+    'Printmul': frozenset({Tipo.DELIM_COMMA}),
+    "Printmul'": frozenset({Tipo.DATA_DOUBLE, Tipo.DATA_INT, Tipo.DATA_STRING, Tipo.FALSE, Tipo.ID, Tipo.TRUE}),
+    'Lect': frozenset({Tipo.READ}),
+    'Defi': frozenset({Tipo.DEFINIR}),
+    'Usfun': frozenset({Tipo.DELIM_LPAREN}),
+    'Varmul': frozenset({Tipo.ID}),
+    "Varmul'": frozenset({Tipo.DELIM_COMMA}),
+}
+
+# FOLLOW de cada no terminal
+SIGUIENTES = {
+    'Program': frozenset({Tipo.EOF}),
+    "Program'": frozenset({Tipo.EOF}),
+    'Class': frozenset({Tipo.EOF, Tipo.FUNCTION}),
+    'Cont': frozenset({Tipo.DELIM_RKEY}),
+    "Cont'": frozenset({Tipo.DELIM_RKEY}),
+    'Accon': frozenset({Tipo.DEFINIR, Tipo.DELIM_RKEY, Tipo.FOR, Tipo.ID, Tipo.IF, Tipo.READ, Tipo.REPEAT, Tipo.SWITCH, Tipo.WHILE, Tipo.WRITE}),
+    'Condif': frozenset({Tipo.DEFINIR, Tipo.DELIM_RKEY, Tipo.FOR, Tipo.ID, Tipo.IF, Tipo.READ, Tipo.REPEAT, Tipo.SWITCH, Tipo.WHILE, Tipo.WRITE}),
+    "Condif'": frozenset({Tipo.DEFINIR, Tipo.DELIM_RKEY, Tipo.FOR, Tipo.ID, Tipo.IF, Tipo.READ, Tipo.REPEAT, Tipo.SWITCH, Tipo.WHILE, Tipo.WRITE}),
+    'Func': frozenset({Tipo.EOF, Tipo.FUNCTION}),
+    'CycleWhile': frozenset({Tipo.DEFINIR, Tipo.DELIM_RKEY, Tipo.FOR, Tipo.ID, Tipo.IF, Tipo.READ, Tipo.REPEAT, Tipo.SWITCH, Tipo.WHILE, Tipo.WRITE}),
+    'CycleRep': frozenset({Tipo.DEFINIR, Tipo.DELIM_RKEY, Tipo.FOR, Tipo.ID, Tipo.IF, Tipo.READ, Tipo.REPEAT, Tipo.SWITCH, Tipo.WHILE, Tipo.WRITE}),
+    'CycleFor': frozenset({Tipo.DEFINIR, Tipo.DELIM_RKEY, Tipo.FOR, Tipo.ID, Tipo.IF, Tipo.READ, Tipo.REPEAT, Tipo.SWITCH, Tipo.WHILE, Tipo.WRITE}),
+    'Multselec': frozenset({Tipo.DEFINIR, Tipo.DELIM_RKEY, Tipo.FOR, Tipo.ID, Tipo.IF, Tipo.READ, Tipo.REPEAT, Tipo.SWITCH, Tipo.WHILE, Tipo.WRITE}),
+    "Multselec'": frozenset({Tipo.DEFAULT}),
+    "Multselec''": frozenset({Tipo.DATA_INT, Tipo.DEFAULT}),
+    'Contblo': frozenset({Tipo.DELIM_RKEY}),
+    "Contblo'": frozenset({Tipo.DELIM_RKEY}),
+    'Acblo': frozenset({Tipo.DELIM_RKEY, Tipo.FOR, Tipo.ID, Tipo.IF, Tipo.READ, Tipo.REPEAT, Tipo.SWITCH, Tipo.WHILE, Tipo.WRITE}),
+    'Contswi': frozenset({Tipo.DELIM_RKEY}),
+    "Contswi'": frozenset({Tipo.DELIM_RKEY}),
+    'Acswi': frozenset({Tipo.DELIM_RKEY, Tipo.FOR, Tipo.ID, Tipo.IF, Tipo.READ, Tipo.REPEAT, Tipo.WHILE, Tipo.WRITE}),
+    'Exprelog': frozenset({Tipo.DELIM_RPAREN}),
+    "Exprelog'": frozenset({Tipo.DELIM_RPAREN}),
+    'Log': frozenset({Tipo.AND, Tipo.DELIM_RPAREN, Tipo.NOT, Tipo.OR}),
+    'Expremath': frozenset({Tipo.DELIM_LINE}),
+    "Expremath'": frozenset({Tipo.DELIM_LINE}),
+    'Mathfunc': frozenset({Tipo.DELIM_LINE}),
+    "Mathfunc'": frozenset({Tipo.DELIM_LPAREN}),
+    'Exprestring': frozenset({Tipo.DELIM_LINE}),
+    "Exprestring'": frozenset({Tipo.DELIM_LINE}),
+    'Expression': frozenset({Tipo.DELIM_LINE}),
+    "Expression'": frozenset({Tipo.DELIM_LINE}),
+    'Typed': frozenset({Tipo.DELIM_LINE}),
+    'Simb': frozenset({Tipo.DATA_DOUBLE, Tipo.DATA_INT, Tipo.DATA_STRING, Tipo.ID}),
+    'Valor': frozenset({Tipo.DELIM_COMMA, Tipo.DELIM_LINE}),
+    'Valornum': frozenset({Tipo.AND, Tipo.DELIM_LINE, Tipo.DELIM_RPAREN, Tipo.DIFF, Tipo.DIV, Tipo.EXP, Tipo.LESS, Tipo.LESS_SAME, Tipo.MINUS, Tipo.MODULO, Tipo.MORE, Tipo.MORE_SAME, Tipo.MULT, Tipo.NOT, Tipo.OR, Tipo.PLUS, Tipo.SAME}),
+    'Valorlog': frozenset({Tipo.AND, Tipo.DELIM_LINE, Tipo.DELIM_RPAREN, Tipo.NOT, Tipo.OR}),
+    'Valorexp': frozenset({Tipo.DELIM_LINE}),
+    'Valorstring': frozenset({Tipo.DELIM_LINE}),
+    'Valorbool': frozenset({Tipo.DELIM_LINE}),
+    'Opeasig': frozenset({Tipo.DATA_DOUBLE, Tipo.DATA_INT, Tipo.ID}),
+    'Opelog': frozenset({Tipo.DATA_DOUBLE, Tipo.DATA_INT, Tipo.ID}),
+    'Asig': frozenset({Tipo.DEFINIR, Tipo.DELIM_RKEY, Tipo.FOR, Tipo.ID, Tipo.IF, Tipo.READ, Tipo.REPEAT, Tipo.SWITCH, Tipo.WHILE, Tipo.WRITE}),
+    "Asig'": frozenset({Tipo.DELIM_LINE}),
+    'Impr': frozenset({Tipo.DEFINIR, Tipo.DELIM_RKEY, Tipo.FOR, Tipo.ID, Tipo.IF, Tipo.READ, Tipo.REPEAT, Tipo.SWITCH, Tipo.WHILE, Tipo.WRITE}),
+    "Impr'": frozenset({Tipo.DELIM_LINE}),
+    'Printmul': frozenset({Tipo.DELIM_LINE}),
+    "Printmul'": frozenset({Tipo.DELIM_COMMA, Tipo.DELIM_LINE}),
+    'Lect': frozenset({Tipo.DEFINIR, Tipo.DELIM_RKEY, Tipo.FOR, Tipo.ID, Tipo.IF, Tipo.READ, Tipo.REPEAT, Tipo.SWITCH, Tipo.WHILE, Tipo.WRITE}),
+    'Defi': frozenset({Tipo.DEFINIR, Tipo.DELIM_RKEY, Tipo.FOR, Tipo.ID, Tipo.IF, Tipo.READ, Tipo.REPEAT, Tipo.SWITCH, Tipo.WHILE, Tipo.WRITE}),
+    'Usfun': frozenset({Tipo.DELIM_LINE}),
+    'Varmul': frozenset({Tipo.DELIM_RPAREN}),
+    "Varmul'": frozenset({Tipo.DELIM_RPAREN}),
+}
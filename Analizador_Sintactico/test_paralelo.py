@@ -0,0 +1,80 @@
+import contextlib
+import io
+import random
+import unittest
+from Analizador_Lexico.Lexi import tablas_lexicas
+from Analizador_Lexico.Procesos.fusion import tokenizacion_fusionada
+from Analizador_Sintactico.Sintac import SyntaxAnalyzer
+from Analizador_Sintactico.Arbol import aplana
+from Analizador_Sintactico.paralelo import analisis_paralelo
+
+
+FUNCION = """Posdata r Dice f(a)
+{
+    El r Puntual;
+    Mientras (a Disuade 1) Canta
+    {
+        Si (a Entiende 2) Entonces
+        {
+            Se_Escribe "dos";
+        }
+        Sino
+        {
+            r Dice a Inspira 1;
+        }
+        Se_Establece
+    }
+    Se_Culmina
+}
+Adios
+"""
+# Lo que se mete al azar para que haya errores en cualquier unidad, o en sus orillas
+PIEZAS = ['x', 'Dice', ';', 'Se_Escribe "a";', '{', '}', 'Adios', 'Posdata', 'Mientras', '1', 'El z Puntual;', ' ', '']
+
+
+def tokens(texto):
+    # Los errores del lexico quedan como tokens ERROR, que el parser tambien tiene que ver
+    return tokenizacion_fusionada(tablas_lexicas().patron, texto, diagnosticos=[])
+
+
+def compara(prueba, flujo, arbol=True, recupera=False, procesos=3):
+    """El analisis en paralelo (forzado aunque sean pocos tokens) da lo mismo que en serie,
+    hasta en lo que imprime"""
+    serie = SyntaxAnalyzer(flujo)
+    salida, salida_paralelo = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(salida):
+        ok = serie.analyze("tabla", arbol, recupera)
+    with contextlib.redirect_stdout(salida_paralelo):
+        ok_paralelo, paralelo = analisis_paralelo(flujo, arbol, recupera, procesos=procesos, minimo=0)
+    prueba.assertEqual(ok, ok_paralelo)
+    prueba.assertEqual(serie.errors, paralelo.errors)
+    prueba.assertEqual(salida.getvalue(), salida_paralelo.getvalue())
+    if arbol and ok:
+        # aplana y no repr, que recursa y no aguanta arboles hondos
+        prueba.assertEqual(aplana(serie.arbol), aplana(paralelo.arbol))
+
+
+class TestParalelo(unittest.TestCase):
+    def test_hondo(self):
+        # Los arboles regresan de los procesos aplanados: pickle no llega al limite de recursion
+        cuerpo = "Mientras (x Disuade 1) Canta\n{\n" * 1500 + "x Dice 1;\n" + "}\nSe_Culmina\n" * 1500
+        funcion = "Posdata r Dice f(a)\n{\n    El x Puntual;\n" + cuerpo + "}\nAdios\n"
+        compara(self, tokens("Para p\n{\n    El x Puntual;\n" + cuerpo + "}\nFin\n" + funcion * 3))
+
+    def test_aleatorio(self):
+        # Programas con errores metidos al azar, con y sin arbol y recuperacion
+        azar = random.Random(20)
+        for caso in range(20):
+            texto = "Para p\n{\n    El x Puntual;\n    x Dice 1;\n}\nFin\n" + FUNCION * azar.randint(2, 5)
+            for _ in range(azar.choice([0, 1, 2, 4])):
+                i = azar.randrange(len(texto))
+                texto = texto[:i] + azar.choice(PIEZAS) + texto[i + azar.randint(0, 5):]
+            flujo = tokens(texto)
+            for arbol in (False, True):
+                for recupera in (False, True):
+                    with self.subTest(caso=caso, arbol=arbol, recupera=recupera):
+                        compara(self, flujo, arbol, recupera)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import contextlib
+import io
+import random
+import unittest
+from Analizador_Lexico.Procesos.tipos import Tipo
+from Analizador_Lexico.Procesos.tokenizador import Token
+from Analizador_Sintactico.Sintac import SyntaxAnalyzer
+from Analizador_Sintactico.tabla_predicciones import INICIAL, PRODUCCIONES, TABLA
+
+# Los terminales de la gramatica, mas el token que deja el lexico al recuperarse
+TERMINALES = sorted({s for _, derecha in PRODUCCIONES for s in derecha if s not in TABLA}) + [Tipo.ERROR]
+CASOS = 1000
+
+
+def deriva(azar, simbolo=INICIAL, hondo=0):
+    """Tipos de una derivacion al azar de simbolo; pasando de 8 niveles se va por los lados
+    derechos mas cortos para que termine"""
+    if simbolo not in TABLA:
+        return [simbolo]
+    opciones = [derecha for izquierda, derecha in PRODUCCIONES if izquierda == simbolo]
+    if hondo > 8:
+        corta = min(len(derecha) for derecha in opciones)
+        opciones = [derecha for derecha in opciones if len(derecha) == corta]
+    tipos = []
+    for s in azar.choice(opciones):
+        tipos += deriva(azar, s, hondo + 1)
+    return tipos
+
+
+def descompone(azar, tipos, n):
+    """n borrados, inserciones o cambios de token al azar"""
+    for _ in range(n):
+        i = azar.randrange(len(tipos) + 1)
+        operacion = azar.randrange(3)
+        if operacion == 0 and i < len(tipos):
+            del tipos[i]
+        elif operacion == 1:
+            tipos.insert(i, azar.choice(TERMINALES))
+        elif i < len(tipos):
+            tipos[i] = azar.choice(TERMINALES)
+    return tipos
+
+
+def analiza(tipos, modo="tabla", recupera=False, medir=None):
+    tokens = [Token(tipo, tipo.name.lower(), k // 3 + 1) for k, tipo in enumerate(tipos)]
+    analyzer = SyntaxAnalyzer(tokens, medir=medir)
+    salida = io.StringIO()
+    with contextlib.redirect_stdout(salida):
+        ok = analyzer.analyze(modo, recupera=recupera)
+    return ok, analyzer, salida.getvalue()
+
+
+class TestPredictivo(unittest.TestCase):
+    def test_como_descendente(self):
+        # La tabla acepta y rechaza lo mismo que las funciones recursivas, con el mismo error
+        azar = random.Random(13)
+        aceptados = 0
+        for _ in range(CASOS):
+            if azar.random() < 0.3:
+                tipos = [azar.choice(TERMINALES) for _ in range(azar.randint(0, 30))]
+            else:
+                tipos = descompone(azar, deriva(azar), azar.randint(0, 3))
+            ok, tabla, salida = analiza(tipos)
+            ok_descendente, descendente, salida_descendente = analiza(tipos, "descendente")
+            self.assertEqual((ok, tabla.errors, tabla.pos, salida),
+                             (ok_descendente, descendente.errors, descendente.pos, salida_descendente), tipos)
+            aceptados += ok
+        # Que si haya de los dos
+        self.assertTrue(0 < aceptados < CASOS)
+
+    def test_recupera(self):
+        # Recuperandose de los errores el veredicto y el primer error no cambian
+        azar = random.Random(16)
+        for _ in range(CASOS):
+            tipos = descompone(azar, deriva(azar), azar.randint(0, 6))
+            ok, primero, _ = analiza(tipos)
+            ok_recupera, todos, _ = analiza(tipos, recupera=True)
+            self.assertEqual(ok, ok_recupera, tipos)
+            self.assertEqual(primero.errors[:1], todos.errors[:1], tipos)
+
+    def test_medidas(self):
+        # Cada no terminal de la tabla se mide igual que su funcion en el descendente
+        azar = random.Random(19)
+        for _ in range(CASOS // 10):
+            tipos = descompone(azar, deriva(azar), azar.randint(0, 2))
+            medidas = []
+            for modo in ("tabla", "descendente"):
+                _, analyzer, _ = analiza(tipos, modo, medir="json")
+                medidas.append({nombre.replace("DoublePrime", "''").replace("Prime", "'"):
+                                (m["llamadas"], m["tokens"], m["profundidad"])
+                                for nombre, m in analyzer.medidas.items() if m["llamadas"]})
+            self.assertEqual(medidas[0], medidas[1], tipos)
+        with self.assertRaises(ValueError):
+            analiza(tipos, "paralelo", medir="tabla")
+
+
+if __name__ == "__main__":
+    unittest.main()
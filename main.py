@@ -20,7 +20,7 @@ if not tokens:
 print(f" Tokens: {len(tokens)}")
 
 # Tokens en res
-t = ",".join([token.tipo for token in tokens])
+t = ",".join([token.tipo.name for token in tokens])
 folder = "Analizador_Lexico/Resultados"
 nombre = f"Res_{nom}.txt"
 folder_path = Path(folder)
@@ -34,9 +34,9 @@ print("\n")
 print(" Sintac ".center(90))
 print("\n")
 
-s = inicia_sintactico(tokens)
+arbol, errores = inicia_sintactico(tokens, arbol=True, recupera=True)
 
-if not s:
+if not arbol:
     print("Sintactico todo mal")
     exit(1)
 
@@ -47,7 +47,7 @@ print("\n")
 print(" Semantico ".center(90))
 print("\n")
 
-tabla, tiene_errores = inicia_semantico(tokens)
+tabla, tiene_errores = inicia_semantico(tokens, arbol)
 
 tabla.imprimir_tabla()
 